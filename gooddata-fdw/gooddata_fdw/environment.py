@@ -23,6 +23,7 @@ try:
     TableDefinition = multicorn.TableDefinition
     ColumnDefinition = multicorn.ColumnDefinition
     Qual = multicorn.Qual
+    SortKey = multicorn.SortKey
     log_to_postgres = utils.log_to_postgres
 except ImportError as e:
     # determine if running as part of test suite
@@ -62,6 +63,18 @@ except ImportError as e:
 
     Qual = QualStub
 
+    class SortKeyStub:
+        def __init__(
+            self, attname: str, attnum: int, is_reversed: bool, nulls_first: bool, collate: Optional[str]
+        ) -> None:
+            self.attname = attname
+            self.attnum = attnum
+            self.is_reversed = is_reversed
+            self.nulls_first = nulls_first
+            self.collate = collate
+
+    SortKey = SortKeyStub
+
     class TableDefinitionStub:
         def __init__(
             self, table_name: str, columns: list[ColumnDefinition], options: dict[str, str]  # type: ignore
@@ -92,4 +105,16 @@ except ImportError as e:
         def execute(self, quals: list[Qual], columns: list[str], sortkeys: Optional[list[Any]] = None):  # type: ignore
             pass
 
+        def get_rel_size(self, quals: list[Qual], columns: list[str]) -> tuple[int, int]:  # type: ignore
+            return 100000000, len(columns) * 100
+
+        def get_path_keys(self) -> list[tuple[tuple[str, ...], int]]:
+            return []
+
+        def can_sort(self, sortkeys: list[SortKey]) -> list[SortKey]:  # type: ignore
+            return []
+
+        def can_limit(self, limit: int, offset: int) -> bool:
+            return False
+
     ForeignDataWrapper = ForeignDataWrapperStub
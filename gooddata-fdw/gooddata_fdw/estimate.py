@@ -0,0 +1,83 @@
+# (C) 2022 GoodData Corporation
+"""
+Estimates of sizes of foreign table scans used by the PostgreSQL planner. The rows of a result are combinations of
+elements of the labels it is computed for, so the number of rows is estimated as product of element counts of the
+labels, reduced by selectivity of the quals.
+"""
+from __future__ import annotations
+
+from gooddata_fdw.environment import ColumnDefinition, Qual
+
+DEFAULT_ROWS = 100_000_000
+"""
+Number of rows estimated when it is not known what the rows depend on; it is the default of multicorn.
+"""
+
+DEFAULT_SELECTIVITY = 1 / 3
+"""
+Fraction of rows estimated to satisfy a qual that is not equality; it is the PostgreSQL default for inequalities.
+"""
+
+_FIXED_WIDTH_TYPES = ("date", "timestamp", "numeric", "decimal", "integer", "bigint", "smallint", "double", "real")
+_FIXED_WIDTH = 8
+_VARIABLE_WIDTH = 32
+
+
+def _qual_selectivity(qual: Qual, element_count: int) -> float:
+    """
+    Estimates number of elements of a label that satisfy the qual on the label column.
+    """
+    if isinstance(qual.operator, tuple):
+        operator, is_any = qual.operator
+        if operator == "=" and is_any:
+            return min(len(qual.value), element_count)
+        if operator == "<>" and not is_any:
+            return max(element_count - len(qual.value), 1)
+    elif qual.operator == "=":
+        return 1
+    elif qual.operator == "<>":
+        return max(element_count - 1, 1)
+
+    return element_count * DEFAULT_SELECTIVITY
+
+
+def estimate_rows(element_counts: dict[str, int], quals: list[Qual]) -> int:
+    """
+    Estimates number of rows of result computed for labels.
+
+    :param element_counts: number of elements of each label that the rows are computed for, keyed by column name
+    :param quals: quals of the scan
+    :return: estimated number of rows, at most DEFAULT_ROWS
+    """
+    elements = {column_name: float(count) for column_name, count in element_counts.items()}
+    selectivity = 1.0
+
+    for qual in quals:
+        if qual.field_name in elements:
+            column_name = qual.field_name
+            elements[column_name] = min(elements[column_name], _qual_selectivity(qual, element_counts[column_name]))
+        else:
+            # qual on metric value
+            selectivity *= DEFAULT_SELECTIVITY
+
+    rows = selectivity
+    for count in elements.values():
+        rows *= count
+
+    return max(1, min(round(rows), DEFAULT_ROWS))
+
+
+def estimate_width(table_columns: dict[str, ColumnDefinition], columns: list[str]) -> int:
+    """
+    Estimates average width of a row in bytes.
+
+    :param table_columns: all table columns
+    :param columns: columns of the scan
+    :return: estimated width
+    """
+    width = 0
+    for column_name in columns:
+        type_name = table_columns[column_name].base_type_name.lower()
+        width += _FIXED_WIDTH if type_name.startswith(_FIXED_WIDTH_TYPES) else _VARIABLE_WIDTH
+
+    return width
@@ -1,14 +1,30 @@
 # (C) 2022 GoodData Corporation
 from __future__ import annotations
 
-from typing import Any, Generator, NamedTuple, Optional
+import itertools
+from typing import Any, Generator, Iterable, NamedTuple, Optional, Union
 
 import gooddata_fdw.column_utils as column_utils
 import gooddata_fdw.column_validation as col_val
-from gooddata_fdw.environment import ColumnDefinition, Qual
-from gooddata_fdw.filter import extract_filters_from_quals
+import gooddata_fdw.estimate as estimate
+from gooddata_fdw.environment import ColumnDefinition, Qual, SortKey
+from gooddata_fdw.filter import push_down_quals
 from gooddata_fdw.options import ServerOptions, TableOptions
+from gooddata_fdw.pg_logging import _log_warn
 from gooddata_fdw.result_reader import InsightTableResultReader, TableResultReader
+from gooddata_sdk.compute_model import (
+    ArithmeticMetric,
+    Attribute,
+    AttributeSortKey,
+    Filter,
+    Metric,
+    MetricSortKey,
+    MetricValueFilter,
+    PopDateMetric,
+    PopDatesetMetric,
+    RankingFilter,
+)
+from gooddata_sdk.compute_model import SortKey as ComputeSortKey
 from gooddata_sdk.sdk import GoodDataSdk
 
 
@@ -19,11 +35,111 @@ class InitData(NamedTuple):
     columns: dict[str, ColumnDefinition]
 
 
+def _metric_dependencies(metric: Metric) -> list[str]:
+    if isinstance(metric, (PopDateMetric, PopDatesetMetric)):
+        return [metric.metric_local_id]
+    if isinstance(metric, ArithmeticMetric):
+        return metric.operand_local_ids
+
+    return []
+
+
+def _filter_dependencies(filter_: Filter) -> list[str]:
+    if isinstance(filter_, MetricValueFilter):
+        return [filter_.metric] if isinstance(filter_.metric, str) else []
+    if isinstance(filter_, RankingFilter):
+        return [m for m in filter_.metrics if isinstance(m, str)]
+
+    return []
+
+
+def _project_items(
+    items: list[Union[Attribute, Metric]], filters: list[Filter], local_ids: list[str]
+) -> list[Union[Attribute, Metric]]:
+    """
+    Selects items that must be computed to get values of the items with the given local ids without changing
+    granularity of the result: all attributes are kept, metrics only if they are selected or if selected metrics
+    or filters depend on them. When no metric is selected, the first one is kept so that the result still has
+    the same rows as if all metrics were computed.
+
+    :param items: all items that may be computed
+    :param filters: filters that are applied on the items
+    :param local_ids: local ids of the items whose values are needed
+    :return: items to compute, in the original order
+    """
+    metrics = {item.local_id: item for item in items if isinstance(item, Metric)}
+    required = [local_id for local_id in local_ids if local_id in metrics]
+    required += [local_id for f in filters for local_id in _filter_dependencies(f)]
+
+    if not required and metrics:
+        required.append(next(iter(metrics)))
+
+    selected: set[str] = set()
+    while required:
+        local_id = required.pop()
+        if local_id in metrics and local_id not in selected:
+            selected.add(local_id)
+            required.extend(_metric_dependencies(metrics[local_id]))
+
+    return [item for item in items if isinstance(item, Attribute) or item.local_id in selected]
+
+
+def _label_id(column: ColumnDefinition) -> Optional[str]:
+    item_type, _, item_id = column.options.get("id", "").partition("/")
+
+    return item_id if item_type == "label" else None
+
+
+def _label_ids(columns: Iterable[str], table_columns: dict[str, ColumnDefinition]) -> dict[str, str]:
+    label_ids = {name: _label_id(table_columns[name]) for name in columns}
+    return {name: label_id for name, label_id in label_ids.items() if label_id is not None}
+
+
+def _is_sortable(column: ColumnDefinition, sort_key: SortKey) -> bool:
+    # rows are sorted by GD.CN; labels are texts sorted without regard to collation of the database, the order
+    # matches only for dates
+    item_type = column.options["id"].split("/")[0]
+    type_name = column.base_type_name.lower()
+
+    # GD.CN orders NULLs as the highest values, the same as PostgreSQL does by default; NULLS FIRST in ascending
+    # and NULLS LAST in descending order cannot be requested from GD.CN
+    if sort_key.nulls_first != sort_key.is_reversed:
+        return False
+
+    return item_type != "label" or type_name == "date" or type_name.startswith("timestamp")
+
+
+def _as_compute_sort_keys(
+    sort_keys: Optional[list[SortKey]], table_columns: dict[str, ColumnDefinition]
+) -> list[ComputeSortKey]:
+    compute_sort_keys: list[ComputeSortKey] = []
+    for sort_key in sort_keys or []:
+        item = column_utils.table_col_as_computable(table_columns[sort_key.attname])
+        direction = "DESC" if sort_key.is_reversed else "ASC"
+
+        if isinstance(item, Attribute):
+            compute_sort_keys.append(AttributeSortKey(item, direction))
+        else:
+            compute_sort_keys.append(MetricSortKey(item, direction))
+
+    return compute_sort_keys
+
+
+def _limit_rows(
+    rows: Iterable[dict[str, Any]], limit: Optional[int], offset: Optional[int]
+) -> Generator[dict[str, Any], None, None]:
+    # result pages are read lazily, stopping early saves reading of the remaining pages
+    start = offset or 0
+    yield from itertools.islice(rows, start, start + limit if limit is not None else None)
+
+
 class Executor:
     def __init__(self, inputs: InitData, column_validators: list[col_val.ColumnValidator]) -> None:
         self._sdk = inputs.sdk
+        self._workspace = inputs.table_options.workspace
         self._table_columns = inputs.columns
         self._column_validators = column_validators
+        self._push_down_limit = inputs.table_options.push_down_limit == "true"
 
     @classmethod
     def can_react(cls, inputs: InitData) -> bool:
@@ -34,8 +150,86 @@ class Executor:
             for validator in self._column_validators:
                 validator.validate(column_name, column_def)
 
+    def can_sort(self, sort_keys: list[SortKey]) -> list[SortKey]:
+        """
+        Determines whether the executor can return rows ordered by the given sort keys. PostgreSQL can use ordering
+        only if it is complete; so either all or none of the sort keys are returned.
+
+        :param sort_keys: sort keys requested by PostgreSQL
+        :return: sort keys that the executor applies when passed to execute
+        """
+        if all(_is_sortable(self._table_columns[sort_key.attname], sort_key) for sort_key in sort_keys):
+            return sort_keys
+
+        return []
+
+    def can_limit(self, limit: Optional[int], offset: Optional[int]) -> bool:
+        """
+        Determines whether the executor can apply LIMIT and OFFSET. The executor does not see conditions which are
+        not passed to it as quals, e.g. conditions on expressions, and PostgreSQL evaluates them only after the limit
+        is applied. So the limit is applied only if the table is declared to be queried without such conditions
+        using the 'push_down_limit' option. Even then, when some of the quals cannot be pushed down, all rows are
+        returned and PostgreSQL filters them before applying the limit.
+        """
+        return self._push_down_limit
+
+    def _grain_columns(self, columns: list[str]) -> Optional[dict[str, str]]:
+        """
+        Returns label columns whose elements make up the rows when computing the given columns, mapped to ids of
+        their labels; None if not known.
+        """
+        return _label_ids(self._table_columns, self._table_columns)
+
+    def _count_elements(self, grain_columns: dict[str, str]) -> Optional[dict[str, int]]:
+        try:
+            return {
+                name: self._sdk.compute.count_label_elements(self._workspace, label_id)
+                for name, label_id in grain_columns.items()
+            }
+        except Exception as e:
+            # estimates are just a hint for the planner, failure to get them must not fail the query
+            _log_warn(f"unable to count label elements, using default estimates: {e}")
+            return None
+
+    def get_rel_size(self, quals: list[Qual], columns: list[str]) -> tuple[int, int]:
+        """
+        Estimates number of rows and average row width of the scan.
+
+        :param quals: quals of the scan
+        :param columns: columns of the scan
+        :return: tuple (rows, width)
+        """
+        width = estimate.estimate_width(self._table_columns, columns)
+        grain_columns = self._grain_columns(columns)
+        element_counts = self._count_elements(grain_columns) if grain_columns is not None else None
+
+        if element_counts is None:
+            return estimate.DEFAULT_ROWS, width
+
+        return estimate.estimate_rows(element_counts, quals), width
+
+    def get_path_keys(self) -> list[tuple[tuple[str, ...], int]]:
+        """
+        Estimates number of rows returned when the scan is filtered by equality on a column.
+
+        :return: list of tuples (columns, rows)
+        """
+        grain_columns = self._grain_columns(list(self._table_columns))
+        element_counts = self._count_elements(grain_columns) if grain_columns else None
+
+        if not element_counts:
+            return []
+
+        rows = estimate.estimate_rows(element_counts, [])
+        return [((name,), max(1, rows // max(count, 1))) for name, count in element_counts.items()]
+
     def execute(
-        self, quals: list[Qual], columns: list[str], sort_keys: Optional[list[Any]] = None
+        self,
+        quals: list[Qual],
+        columns: list[str],
+        sort_keys: Optional[list[SortKey]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ) -> Generator[dict[str, Any], None, None]:
         raise NotImplementedError()
 
@@ -45,7 +239,6 @@ class InsightExecutor(Executor):
 
     def __init__(self, inputs: InitData) -> None:
         super().__init__(inputs, self._COLUMN_VALIDATORS)
-        self._workspace = inputs.table_options.workspace
 
         assert inputs.table_options.insight is not None
         self._insight = inputs.table_options.insight
@@ -56,14 +249,39 @@ class InsightExecutor(Executor):
     def can_react(cls, inputs: InitData) -> bool:
         return inputs.table_options.insight is not None
 
+    def can_sort(self, sort_keys: list[SortKey]) -> list[SortKey]:
+        # column types are not known until the insight is read
+        return []
+
+    def _grain_columns(self, columns: list[str]) -> Optional[dict[str, str]]:
+        # labels of the insight are known only if all columns specify ids
+        if any("id" not in column.options for column in self._table_columns.values()):
+            return None
+
+        return super()._grain_columns(columns)
+
     def execute(
-        self, quals: list[Qual], columns: list[str], sort_keys: Optional[list[Any]] = None
+        self,
+        quals: list[Qual],
+        columns: list[str],
+        sort_keys: Optional[list[SortKey]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ) -> Generator[dict[str, Any], None, None]:
         results_reader = InsightTableResultReader(self._table_columns, columns)
         insight = self._sdk.insights.get_insight(self._workspace, self._insight)
-        table = self._sdk.tables.for_insight(self._workspace, insight)
+        # same as computing the whole insight, except for metrics that are not needed for the selected columns
+        items: list[Union[Attribute, Metric]] = [a.as_computable() for a in insight.attributes]
+        items += [m.as_computable() for m in insight.metrics]
+        filters = [cf for cf in [f.as_computable() for f in insight.filters] if not cf.is_noop()]
+        local_ids = [self._table_columns[col_name].options["local_id"] for col_name in columns]
+        table = self._sdk.tables.for_items(self._workspace, _project_items(items, filters, local_ids), filters)
+
+        if quals:
+            # quals are not pushed down to insights
+            return results_reader.read_all_rows(table)
 
-        return results_reader.read_all_rows(table)
+        return _limit_rows(results_reader.read_all_rows(table), limit, offset)
 
 
 class ComputeExecutor(Executor):
@@ -71,23 +289,41 @@ class ComputeExecutor(Executor):
 
     def __init__(self, inputs: InitData) -> None:
         super().__init__(inputs, self._COLUMN_VALIDATORS)
-        self._workspace = inputs.table_options.workspace
         self._results_reader = TableResultReader(self._table_columns)
 
     @classmethod
     def can_react(cls, inputs: InitData) -> bool:
         return inputs.table_options.compute is not None
 
+    def _grain_columns(self, columns: list[str]) -> Optional[dict[str, str]]:
+        return _label_ids(columns, self._table_columns)
+
+    def get_path_keys(self) -> list[tuple[tuple[str, ...], int]]:
+        # rows of the pseudo-table depend on the selected columns
+        return []
+
     def execute(
-        self, quals: list[Qual], columns: list[str], sort_keys: Optional[list[Any]] = None
+        self,
+        quals: list[Qual],
+        columns: list[str],
+        sort_keys: Optional[list[SortKey]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ) -> Generator[dict[str, Any], None, None]:
         col_val.validate_columns_in_table_def(self._table_columns, columns)
-        items = [column_utils.table_col_as_computable(self._table_columns[col_name]) for col_name in columns]
         # TODO: push down more filters that are included in quals
-        filters = extract_filters_from_quals(quals, self._table_columns)
-        table = self._sdk.tables.for_items(self._workspace, items, filters)
+        filters, remaining_quals = push_down_quals(quals, self._table_columns)
+        # metrics filtered by their values must be computed even if they are not selected
+        filtered = [local_id for f in filters for local_id in _filter_dependencies(f)]
+        local_ids = dict.fromkeys(list(columns) + filtered)
+        items = [column_utils.table_col_as_computable(self._table_columns[col_name]) for col_name in local_ids]
+        sorts = _as_compute_sort_keys(sort_keys, self._table_columns)
+        table = self._sdk.tables.for_items(self._workspace, items, filters, sorts)
+
+        if remaining_quals:
+            return self._results_reader.read_all_rows(table)
 
-        return self._results_reader.read_all_rows(table)
+        return _limit_rows(self._results_reader.read_all_rows(table), limit, offset)
 
 
 class CustomExecutor(Executor):
@@ -95,7 +331,6 @@ class CustomExecutor(Executor):
 
     def __init__(self, inputs: InitData) -> None:
         super().__init__(inputs, self._COLUMN_VALIDATORS)
-        self._workspace = inputs.table_options.workspace
         self._results_reader = TableResultReader(self._table_columns)
 
     @classmethod
@@ -103,14 +338,26 @@ class CustomExecutor(Executor):
         return True
 
     def execute(
-        self, quals: list[Qual], columns: list[str], sort_keys: Optional[list[Any]] = None
+        self,
+        quals: list[Qual],
+        columns: list[str],
+        sort_keys: Optional[list[SortKey]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ) -> Generator[dict[str, Any], None, None]:
+        col_val.validate_columns_in_table_def(self._table_columns, columns)
         items = [column_utils.table_col_as_computable(col) for col in self._table_columns.values()]
         # TODO: pushdown more filters that are included in quals
-        filters = extract_filters_from_quals(quals, self._table_columns)
-        table = self._sdk.tables.for_items(self._workspace, items, filters)
+        filters, remaining_quals = push_down_quals(quals, self._table_columns)
+        sorts = _as_compute_sort_keys(sort_keys, self._table_columns)
+        # columns of the custom table are computable items with local id equal to the column name
+        local_ids = list(columns) + [sort.local_id for sort in sorts]
+        table = self._sdk.tables.for_items(self._workspace, _project_items(items, filters, local_ids), filters, sorts)
+
+        if remaining_quals:
+            return self._results_reader.read_all_rows(table)
 
-        return self._results_reader.read_all_rows(table)
+        return _limit_rows(self._results_reader.read_all_rows(table), limit, offset)
 
 
 class ExecutorFactory:
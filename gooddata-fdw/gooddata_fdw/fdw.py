@@ -2,20 +2,40 @@
 from __future__ import annotations
 
 import traceback
-from typing import Any, Optional
+from typing import Optional
 
 from gooddata_fdw import __version__
-from gooddata_fdw.environment import ColumnDefinition, ForeignDataWrapper, Qual, TableDefinition
+from gooddata_fdw.environment import ColumnDefinition, ForeignDataWrapper, Qual, SortKey, TableDefinition
 from gooddata_fdw.executor import ExecutorFactory, InitData
 from gooddata_fdw.import_workspace import ImporterInitData, WorkspaceImportersLocator
 from gooddata_fdw.options import ImportSchemaOptions, ServerOptions, TableOptions
 from gooddata_fdw.pg_logging import _log_debug, _log_error, _log_info
-from gooddata_sdk import GoodDataSdk
+from gooddata_sdk import DiskResultCache, GoodDataSdk, MemoryResultCache, ResultCache, RetryPolicy
+from gooddata_sdk.result_cache import DEFAULT_RESULT_CACHE_SIZE
 
 USER_AGENT = f"gooddata-fdw/{__version__}"
 """Extra segment of the User-Agent header that will be appended to standard gooddata-sdk user agent."""
 
 
+def _create_result_cache(server_options: ServerOptions) -> Optional[ResultCache]:
+    # results are cached only if the foreign server asks for it; the on-disk cache is shared by all backends
+    # while in-memory cache lives as long as the foreign table instance in the current backend
+    if server_options.result_cache_ttl is None:
+        return None
+
+    if server_options.result_cache_dir is not None:
+        return DiskResultCache(server_options.result_cache_dir, ttl=server_options.result_cache_ttl)
+
+    return MemoryResultCache(ttl=server_options.result_cache_ttl)
+
+
+def _create_retry_policy(server_options: ServerOptions) -> Optional[RetryPolicy]:
+    if server_options.max_retries is None:
+        return None
+
+    return RetryPolicy(max_retries=server_options.max_retries)
+
+
 class GoodDataForeignDataWrapper(ForeignDataWrapper):
     def __init__(self, options: dict[str, str], columns: dict[str, ColumnDefinition]) -> None:
         super(GoodDataForeignDataWrapper, self).__init__(options, columns)
@@ -27,16 +47,46 @@ class GoodDataForeignDataWrapper(ForeignDataWrapper):
 
         self._columns = columns
         gd_sdk = GoodDataSdk.create(
-            self._server_options.host, self._server_options.token, USER_AGENT, Host=self._server_options.headers_host
+            self._server_options.host,
+            self._server_options.token,
+            USER_AGENT,
+            retry_policy_=_create_retry_policy(self._server_options),
+            result_cache_=_create_result_cache(self._server_options),
+            # cached pages belong to particular result; identical queries must reuse it to be served from the cache
+            result_id_cache_size_=DEFAULT_RESULT_CACHE_SIZE if self._server_options.result_cache_ttl is not None else 0,
+            result_id_cache_ttl_=self._server_options.result_cache_ttl,
+            Host=self._server_options.headers_host,
         )
 
         self._executor = ExecutorFactory.create(InitData(gd_sdk, self._server_options, self._table_options, columns))
         self._executor.validate_columns_def()
 
-    def execute(self, quals: list[Qual], columns: list[str], sortkeys: Optional[list[Any]] = None):  # type: ignore
-        _log_debug(f"query in fdw with {self._server_options}; {self._table_options}; columns {columns}; quals={quals}")
+    def get_rel_size(self, quals: list[Qual], columns: list[str]) -> tuple[int, int]:
+        return self._executor.get_rel_size(quals, columns)
+
+    def get_path_keys(self) -> list[tuple[tuple[str, ...], int]]:
+        return self._executor.get_path_keys()
+
+    def can_sort(self, sortkeys: list[SortKey]) -> list[SortKey]:  # type: ignore
+        return self._executor.can_sort(sortkeys)
+
+    def can_limit(self, limit: Optional[int], offset: Optional[int]) -> bool:
+        return self._executor.can_limit(limit, offset)
+
+    def execute(  # type: ignore
+        self,
+        quals: list[Qual],
+        columns: list[str],
+        sortkeys: Optional[list[SortKey]] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ):
+        _log_debug(
+            f"query in fdw with {self._server_options}; {self._table_options}; columns {columns}; quals={quals}; "
+            f"sortkeys={sortkeys}; limit={limit}; offset={offset}"
+        )
         try:
-            return self._executor.execute(quals, columns, sortkeys)
+            return self._executor.execute(quals, columns, sortkeys, limit, offset)
         except Exception as e:
             _log_error(traceback.format_exc())
             raise e
@@ -62,7 +112,11 @@ class GoodDataForeignDataWrapper(ForeignDataWrapper):
             importer_classes = WorkspaceImportersLocator.locate(import_options.object_type)
 
             _sdk = GoodDataSdk.create(
-                server_options.host, server_options.token, USER_AGENT, Host=server_options.headers_host
+                server_options.host,
+                server_options.token,
+                USER_AGENT,
+                retry_policy_=_create_retry_policy(server_options),
+                Host=server_options.headers_host,
             )
             init_data = ImporterInitData(_sdk, schema, server_options, import_options, restriction_type, restricts)
             tables = []
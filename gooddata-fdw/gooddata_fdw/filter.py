@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import datetime
 import re
-from typing import Union
+from decimal import Decimal
+from typing import NamedTuple, Union
 
 import gooddata_fdw.column_utils as column_utils
 from gooddata_fdw.environment import ColumnDefinition, Qual
@@ -12,6 +13,8 @@ from gooddata_sdk.compute_model import (
     AbsoluteDateFilter,
     Attribute,
     Filter,
+    Metric,
+    MetricValueFilter,
     NegativeAttributeFilter,
     ObjId,
     PositiveAttributeFilter,
@@ -21,6 +24,17 @@ from gooddata_sdk.compute_model import (
 MIN_DATE = "0001-01-01"
 MAX_DATE = "2999-01-01"
 
+_DATE_LABEL_FORMATS = {
+    "year": "%Y",
+    "month": "%Y-%m",
+    "day": "%Y-%m-%d",
+    "hour": "%Y-%m-%d %H",
+    "minute": "%Y-%m-%d %H:%M",
+}
+"""
+Formats of elements of date labels, keyed by granularity which is the suffix of the label id.
+"""
+
 
 def _date_to_str(date: datetime.date) -> str:
     return date.strftime("%Y-%m-%d")
@@ -32,45 +46,126 @@ def _is_qual_date(qual: Qual) -> bool:
     )
 
 
-def _get_date_filter(operator: str, value: datetime.date, label: ObjId) -> Union[Filter, None]:
-    date_from = MIN_DATE
-    date_to = MAX_DATE
-    add_filter = True
-    # AbsoluteDateFilter supports only day granularity
-    # date_to must equal to qual.value + 1 day, if qual.value day is to be included
-    if operator == ">=":
-        date_from = _date_to_str(value)
-    elif operator == "<=":
-        date_to = _date_to_str(value + datetime.timedelta(days=1))
-    elif operator == ">":
-        date_from = _date_to_str(value + datetime.timedelta(days=1))
-    elif operator == "<":
-        date_to = _date_to_str(value)
-    elif operator == "=":
-        date_from = _date_to_str(value)
-        date_to = _date_to_str(value + datetime.timedelta(days=1))
-    else:
-        add_filter = False
+def _date_granularity(filter_entity: Attribute) -> Union[str, None]:
+    granularity = filter_entity.label.id.rsplit(".", 1)[-1]
+    return granularity if granularity in _DATE_LABEL_FORMATS else None
+
+
+def _truncate_date(value: datetime.date, granularity: str) -> datetime.date:
+    if granularity == "year":
+        return datetime.date(value.year, 1, 1)
+    if granularity == "month":
+        return datetime.date(value.year, value.month, 1)
+    return datetime.date(value.year, value.month, value.day)
+
+
+def _next_period(start: datetime.date, granularity: str) -> datetime.date:
+    if granularity == "year":
+        return datetime.date(start.year + 1, 1, 1)
+    if granularity == "month":
+        return datetime.date(start.year + start.month // 12, start.month % 12 + 1, 1)
+    return start + datetime.timedelta(days=1)
+
+
+class _DateRange(NamedTuple):
+    """
+    Range of days [date_from, date_to) satisfying date quals on one column, None stands for unbounded side. The range
+    is exact, when it contains the same rows as the quals; otherwise it contains more rows and the quals must be
+    evaluated by PostgreSQL.
+    """
+
+    date_from: Union[datetime.date, None]
+    date_to: Union[datetime.date, None]
+    exact: bool
 
-    if add_filter:
-        date_filter = AbsoluteDateFilter(label, date_from, date_to)
-        _log_debug(f"extract_filters_from_quals: date_filter={date_filter.__dict__}")
-        return date_filter
+    def intersect(self, other: _DateRange) -> _DateRange:
+        date_from = self.date_from
+        if date_from is None or (other.date_from is not None and other.date_from > date_from):
+            date_from = other.date_from
+        date_to = self.date_to
+        if date_to is None or (other.date_to is not None and other.date_to < date_to):
+            date_to = other.date_to
+
+        return _DateRange(date_from, date_to, self.exact and other.exact)
+
+    def is_empty(self) -> bool:
+        return self.date_from is not None and self.date_to is not None and self.date_from >= self.date_to
+
+    def as_filter(self, dataset: ObjId) -> AbsoluteDateFilter:
+        date_from = MIN_DATE if self.date_from is None else _date_to_str(self.date_from)
+        date_to = MAX_DATE if self.date_to is None else _date_to_str(self.date_to)
+        return AbsoluteDateFilter(dataset, date_from, date_to)
+
+
+def _get_date_range(operator: str, value: datetime.date, granularity: Union[str, None]) -> Union[_DateRange, None]:
+    # AbsoluteDateFilter supports only day granularity; rows of date labels are at the beginning of their periods,
+    # so ranges of years, months and days are exact, while ranges of the other labels are widened to whole days
+    exact = granularity in ("year", "month", "day") and not isinstance(value, datetime.datetime)
+    period = granularity if exact and granularity else "day"
+    start = _truncate_date(value, period)
+    end = _next_period(start, period)
+
+    if exact:
+        # first period starting at or after the value
+        ceil = start if start == value else end
+        bounds = {">=": (ceil, None), ">": (end, None), "<=": (None, end), "<": (None, ceil), "=": (ceil, end)}
     else:
+        bounds = {">=": (start, None), ">": (start, None), "<=": (None, end), "<": (None, end), "=": (start, end)}
+
+    if operator not in bounds:
         return None
 
+    date_from, date_to = bounds[operator]
+    return _DateRange(date_from, date_to, exact)
+
 
-def _qual_to_date_filter(filter_entity: Attribute, qual: Qual) -> Union[Filter, None]:
+def _qual_to_date_range(filter_entity: Attribute, qual: Qual) -> Union[_DateRange, None]:
     _log_debug(f"extract_filters_from_quals: filter_column={filter_entity} is date attribute")
+    if isinstance(qual.operator, tuple):
+        return None
+
+    return _get_date_range(qual.operator, qual.value, _date_granularity(filter_entity))
+
+
+def _date_dataset(filter_entity: Attribute) -> ObjId:
     # Hack - Absolute date filter requires <date_dataset>.day label, but user can limit e.g. month granularity
     re_day = re.compile(r"(.*)\.[^.]+$")
-    label = ObjId(re_day.sub(r"\1", filter_entity.label.id), "dataset")
-    if isinstance(qual.operator, tuple):
-        # Can't be implemented by multiple filters, because GD.CN does not support OR between filters
-        _log_debug("extract_filters_from_quals: IN (date1, date2, ..) is not supported")
+    return ObjId(re_day.sub(r"\1", filter_entity.label.id), "dataset")
+
+
+def _is_date_element(value: datetime.date, date_format: str) -> bool:
+    element = datetime.datetime.strptime(value.strftime(date_format), date_format)
+    return element == value if isinstance(value, datetime.datetime) else element.date() == value
+
+
+def _qual_to_date_attribute_filter(filter_entity: Attribute, qual: Qual) -> Union[Filter, None]:
+    # GD.CN does not support OR between filters, IN (date1, date2, ..) is pushed down as filter of label elements
+    granularity = _date_granularity(filter_entity)
+    if granularity is None:
+        _log_debug(f"extract_filters_from_quals: granularity of {filter_entity} is not known, cannot filter elements")
         return None
+
+    date_format = _DATE_LABEL_FORMATS[granularity]
+    # only = ANY (IN) and <> ALL (NOT IN) lists are sets of elements, the other operators are evaluated by PostgreSQL
+    if qual.operator in [("=", True), "="]:
+        positive = True
+    elif qual.operator in [("<>", False), "<>"]:
+        positive = False
     else:
-        return _get_date_filter(qual.operator, qual.value, label)
+        _log_debug(f"extract_filters_from_quals: operator {qual.operator} cannot be pushed down as element filter")
+        return None
+    dates = qual.value if isinstance(qual.operator, tuple) else [qual.value]
+
+    # values not at the beginning of a period are not elements of the label, no row has them
+    values = [date.strftime(date_format) for date in dates if _is_date_element(date, date_format)]
+    _log_debug(f"extract_filters_from_quals: values={values} positive={positive}")
+    if not values:
+        return None
+
+    if positive:
+        return PositiveAttributeFilter(filter_entity, values)
+    else:
+        return NegativeAttributeFilter(filter_entity, values)
 
 
 def _qual_to_attribute_filter(filter_entity: Attribute, qual: Qual) -> Union[Filter, None]:
@@ -89,16 +184,118 @@ def _qual_to_attribute_filter(filter_entity: Attribute, qual: Qual) -> Union[Fil
         return NegativeAttributeFilter(filter_entity, values)
 
 
-def extract_filters_from_quals(quals: list[Qual], table_columns: dict[str, ColumnDefinition]) -> list[Filter]:
+_METRIC_VALUE_OPERATORS = {
+    ">": "GREATER_THAN",
+    ">=": "GREATER_THAN_OR_EQUAL_TO",
+    "<": "LESS_THAN",
+    "<=": "LESS_THAN_OR_EQUAL_TO",
+}
+
+_INTEGER_TYPES = ("smallint", "integer", "int", "int2", "int4", "int8", "bigint")
+
+
+def _is_metric_value_qual(qual: Qual) -> bool:
+    # IS (NOT) NULL is represented as comparison with None
+    return (
+        not isinstance(qual.operator, tuple)
+        and qual.operator in _METRIC_VALUE_OPERATORS
+        and isinstance(qual.value, (int, float, Decimal))
+        and not isinstance(qual.value, bool)
+        and Decimal(qual.value).is_finite()
+    )
+
+
+def _column_scale(table_column: ColumnDefinition) -> Union[int, None]:
+    """
+    Number of decimal places metric values are rounded to by the column type, None when values are not rounded.
+    """
+    type_name = table_column.type_name.lower().strip()
+    if type_name in _INTEGER_TYPES:
+        return 0
+    match = re.match(r"^(?:numeric|decimal)\s*\(\s*\d+\s*(?:,\s*(-?\d+)\s*)?\)$", type_name)
+    if match is None:
+        return None
+    return int(match.group(1) or 0)
+
+
+def _half_unit(table_column: ColumnDefinition) -> Decimal:
+    """
+    Half a unit of the scale metric values are rounded to by the column type, 0 when values are not rounded.
+    """
+    scale = _column_scale(table_column)
+    return Decimal(0) if scale is None else Decimal(5).scaleb(-scale - 1)
+
+
+def _tighter_bound(
+    bound: Union[tuple[str, Decimal], None], operator: str, value: Decimal, lower: bool
+) -> tuple[str, Decimal]:
+    if bound is None or (value > bound[1] if lower else value < bound[1]):
+        return operator, value
+    # strict comparison is tighter than non-strict one with the same value
+    if value == bound[1] and operator in (">", "<"):
+        return operator, value
+    return bound
+
+
+def _quals_to_metric_value_filters(
+    filter_entity: Metric, table_column: ColumnDefinition, quals: list[Qual]
+) -> list[Filter]:
+    """
+    Convert comparisons of metric column to metric value filters. Only the tightest lower and upper bounds are used,
+    >= together with <= is converted to range filter.
+
+    PostgreSQL compares values rounded to the scale of the column type, e.g. 1000.004 is 1000.00 in DECIMAL(18, 2)
+    column, while GD.CN filters the computed values. So the bounds are widened by half a unit of the scale and the
+    filters may return more rows than the quals, which must be evaluated by PostgreSQL as well. Filters of columns
+    which do not round the values, e.g. NUMERIC, are exact.
+
+    Nulls are not treated as any value, so rows with NULL metric value are filtered out, the same way as PostgreSQL
+    comparisons do.
+    """
+    _log_debug(f"extract_filters_from_quals: filter_column={filter_entity} is metric")
+    half_unit = _half_unit(table_column)
+    lower_bound: Union[tuple[str, Decimal], None] = None
+    upper_bound: Union[tuple[str, Decimal], None] = None
+    for qual in quals:
+        value = Decimal(qual.value)
+        if qual.operator in (">", ">="):
+            lower_bound = _tighter_bound(lower_bound, qual.operator, value, lower=True)
+        else:
+            upper_bound = _tighter_bound(upper_bound, qual.operator, value, lower=False)
+
+    if half_unit:
+        # rounded values equal to the bound are compared as equal, whatever the strictness of the comparison
+        lower_bound = (">=", lower_bound[1] - half_unit) if lower_bound else None
+        upper_bound = ("<=", upper_bound[1] + half_unit) if upper_bound else None
+
+    # range filter is sent with sorted bounds, empty range must be kept as two comparisons
+    if lower_bound and upper_bound and lower_bound[0] == ">=" and upper_bound[0] == "<=":
+        if lower_bound[1] <= upper_bound[1]:
+            return [MetricValueFilter(filter_entity, "BETWEEN", (float(lower_bound[1]), float(upper_bound[1])))]
+
+    return [
+        MetricValueFilter(filter_entity, _METRIC_VALUE_OPERATORS[bound[0]], float(bound[1]))
+        for bound in (lower_bound, upper_bound)
+        if bound
+    ]
+
+
+def push_down_quals(quals: list[Qual], table_columns: dict[str, ColumnDefinition]) -> tuple[list[Filter], list[Qual]]:
     """
     Convert quals to filters.
-    Now only simple attribute filters are supported.
+    Now only simple attribute filters, date filters and comparisons of metrics are supported. Range quals on the same
+    date column are merged into a single date filter. Empty date ranges are not sent to GD.CN, their quals are left
+    to PostgreSQL.
 
     :param quals: multicorn quals representing filters in SQL WHERE clause
     :param table_columns: list of table columns
-    :return: list of filters
+    :return: list of filters and list of quals that cannot be converted to filters exactly
     """
     filters: list[Filter] = []
+    remaining_quals: list[Qual] = []
+    # date range of column, index of its filter in filters and its quals which are not in remaining quals
+    date_ranges: dict[str, tuple[_DateRange, int, list[Qual]]] = {}
+    metric_quals: dict[str, tuple[Metric, ColumnDefinition, list[Qual]]] = {}
     for qual in quals:
         _log_info(
             f"extract_filters_from_quals: field_name={qual.field_name} operator={qual.operator} value={qual.value}"
@@ -109,22 +306,72 @@ def extract_filters_from_quals(quals: list[Qual], table_columns: dict[str, Colum
                 f"extract_filters_from_quals: field_name={qual.field_name} not found in report columns, "
                 f"cannot push it down"
             )
+            remaining_quals.append(qual)
             continue
 
         filter_entity = column_utils.table_col_as_computable(table_column)
         new_filter = None
         if isinstance(filter_entity, Attribute):
             _log_debug(f"extract_filters_from_quals: filter_entity={filter_entity} is attribute")
-            if _is_qual_date(qual):
-                new_filter = _qual_to_date_filter(filter_entity, qual)
+            date_range = _qual_to_date_range(filter_entity, qual) if _is_qual_date(qual) else None
+            if date_range is not None:
+                if qual.field_name in date_ranges:
+                    previous_range, index, pushed_quals = date_ranges[qual.field_name]
+                    date_range = previous_range.intersect(date_range)
+                    filters[index] = date_range.as_filter(_date_dataset(filter_entity))
+                else:
+                    index, pushed_quals = len(filters), []
+                    filters.append(date_range.as_filter(_date_dataset(filter_entity)))
+                date_ranges[qual.field_name] = date_range, index, pushed_quals
+                _log_debug(f"extract_filters_from_quals: date_filter={filters[index].__dict__}")
+                if date_range.exact:
+                    pushed_quals.append(qual)
+                else:
+                    remaining_quals.append(qual)
+                continue
+            elif _is_qual_date(qual):
+                new_filter = _qual_to_date_attribute_filter(filter_entity, qual)
             else:
                 new_filter = _qual_to_attribute_filter(filter_entity, qual)
+        elif _is_metric_value_qual(qual):
+            metric_quals.setdefault(qual.field_name, (filter_entity, table_column, []))[2].append(qual)
+            if _half_unit(table_column):
+                # values compared by PostgreSQL are rounded, the filters are not exact
+                remaining_quals.append(qual)
+            continue
         else:
             _log_info(
-                f"extract_filters_from_quals: field_name={qual.field_name} is not attribute, "
-                f"but {type(filter_entity)}"
+                f"extract_filters_from_quals: field_name={qual.field_name} is {type(filter_entity)}, "
+                f"only <, <=, > and >= comparisons with a number can be pushed down"
             )
         if new_filter:
             filters.append(new_filter)
+        else:
+            remaining_quals.append(qual)
+
+    # AbsoluteDateFilter cannot express an empty date range, PostgreSQL evaluates its quals instead
+    empty_range_indexes = set()
+    for date_range, index, pushed_quals in date_ranges.values():
+        if date_range.is_empty():
+            _log_info(f"extract_filters_from_quals: date range {date_range} is empty, cannot push it down")
+            empty_range_indexes.add(index)
+            remaining_quals.extend(pushed_quals)
+    filters = [date_filter for index, date_filter in enumerate(filters) if index not in empty_range_indexes]
+
+    for metric, metric_column, column_quals in metric_quals.values():
+        filters.extend(_quals_to_metric_value_filters(metric, metric_column, column_quals))
+
+    return filters, remaining_quals
+
+
+def extract_filters_from_quals(quals: list[Qual], table_columns: dict[str, ColumnDefinition]) -> list[Filter]:
+    """
+    Convert quals to filters. Quals that cannot be converted are skipped.
+
+    :param quals: multicorn quals representing filters in SQL WHERE clause
+    :param table_columns: list of table columns
+    :return: list of filters
+    """
+    filters, _ = push_down_quals(quals, table_columns)
 
     return filters
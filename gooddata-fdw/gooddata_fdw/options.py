@@ -75,6 +75,30 @@ class ServerOptions(BaseOptions):
     def headers_host(self) -> Union[str, None]:
         return self._options.get("headers_host")
 
+    @property
+    def result_cache_ttl(self) -> Union[float, None]:
+        value = self._options.get("result_cache_ttl")
+        return float(value) if value is not None else None
+
+    @staticmethod
+    def _validate_result_cache_ttl(value: Union[float, None]) -> None:
+        if value is not None and value <= 0:
+            raise ValueError(f"FOREIGN SERVER 'result_cache_ttl' option must be positive number. Instead got '{value}'")
+
+    @property
+    def result_cache_dir(self) -> Union[str, None]:
+        return self._options.get("result_cache_dir")
+
+    @property
+    def max_retries(self) -> Union[int, None]:
+        value = self._options.get("max_retries")
+        return int(value) if value is not None else None
+
+    @staticmethod
+    def _validate_max_retries(value: Union[int, None]) -> None:
+        if value is not None and value < 0:
+            raise ValueError(f"FOREIGN SERVER 'max_retries' option must not be negative. Instead got '{value}'")
+
 
 class TableOptions(BaseOptions):
     def __init__(self, options: dict[str, str]) -> None:
@@ -96,6 +120,15 @@ class TableOptions(BaseOptions):
     def compute(self) -> Union[str, None]:
         return self._options.get("compute")
 
+    @property
+    def push_down_limit(self) -> str:
+        return self._options.get("push_down_limit", "false").lower()
+
+    @staticmethod
+    def _validate_push_down_limit(value: str) -> None:
+        if value not in ["true", "false"]:
+            raise ValueError(f"FOREIGN TABLE 'push_down_limit' option must be 'true' or 'false'. Instead got '{value}'")
+
 
 class ImportSchemaOptions(BaseOptions):
     METRIC_DIGITS_BEFORE_DEC_POINT_DEFAULT = "18"
@@ -18,6 +18,12 @@ def pytest_addoption(parser):
     )
 
 
+@pytest.fixture(autouse=True)
+def sequential_catalog_load(monkeypatch):
+    # vcrpy cassettes cannot serve concurrent requests reliably; load catalogs sequentially during tests
+    monkeypatch.setattr("gooddata_sdk.catalog.DEFAULT_CATALOG_LOAD_WORKERS", 1)
+
+
 @pytest.fixture(scope="session")
 def test_config(request):
     config_path = Path(request.config.getoption("--gd-test-config"))
@@ -0,0 +1,39 @@
+# (C) 2022 GoodData Corporation
+import pytest
+
+from gooddata_fdw.environment import ColumnDefinition, Qual
+from gooddata_fdw.estimate import DEFAULT_ROWS, estimate_rows, estimate_width
+
+_element_counts = dict(region=10, product=300)
+
+
+@pytest.mark.parametrize(
+    "quals, expected_rows",
+    [
+        ([], 3000),
+        ([Qual("region", "=", "East")], 300),
+        ([Qual("region", ("=", True), ["East", "West"])], 600),
+        ([Qual("region", ("<>", False), ["East", "West"])], 2400),
+        ([Qual("region", "=", "East"), Qual("region", ("=", True), ["East", "West"])], 300),
+        ([Qual("product", ">", "A")], 1000),
+        ([Qual("revenue", ">", 100)], 1000),
+    ],
+    ids=["no-quals", "equality", "in", "not-in", "multiple-quals", "inequality", "metric"],
+)
+def test_estimate_rows(quals, expected_rows):
+    assert estimate_rows(_element_counts, quals) == expected_rows
+
+
+def test_estimate_rows_bounds():
+    assert estimate_rows({}, []) == 1
+    assert estimate_rows(dict(a=100_000, b=100_000), []) == DEFAULT_ROWS
+
+
+def test_estimate_width():
+    columns = dict(
+        region=ColumnDefinition(column_name="region", type_name="VARCHAR(255)", options={}),
+        revenue=ColumnDefinition(column_name="revenue", type_name="NUMERIC(15,5)", options={}),
+    )
+
+    assert estimate_width(columns, ["region", "revenue"]) == 40
+    assert estimate_width(columns, ["revenue"]) == 8
@@ -1,11 +1,23 @@
 # (C) 2022 GoodData Corporation
 
 import unittest.mock as mock
+from collections import OrderedDict
 
 import pytest
 
 import gooddata_fdw.executor as executor
 import gooddata_fdw.options as options
+from gooddata_fdw.environment import ColumnDefinition, Qual, SortKey
+from gooddata_fdw.estimate import DEFAULT_ROWS
+from gooddata_sdk.compute_model import (
+    Attribute,
+    MetricSortKey,
+    MetricValueFilter,
+    ObjId,
+    PopDate,
+    PopDateMetric,
+    SimpleMetric,
+)
 
 
 @pytest.mark.parametrize(
@@ -27,3 +39,168 @@ def test_executor_factory(test_config, table_options, expected_executor):
     )
 
     assert isinstance(executor.ExecutorFactory.create(inputs), expected_executor)
+
+
+def _custom_table_columns():
+    columns = OrderedDict()
+    columns["region"] = ColumnDefinition(column_name="region", type_name="VARCHAR", options=dict(id="label/region"))
+    columns["amount"] = ColumnDefinition(column_name="amount", type_name="NUMERIC", options=dict(id="fact/amount"))
+    columns["revenue"] = ColumnDefinition(column_name="revenue", type_name="NUMERIC", options=dict(id="metric/revenue"))
+
+    return columns
+
+
+@pytest.mark.parametrize(
+    "columns, expected_items",
+    [
+        (["region", "revenue"], ["region", "revenue"]),
+        (["revenue"], ["region", "revenue"]),
+        (["region"], ["region", "amount"]),
+    ],
+    ids=["label-and-metric", "metric-only", "label-only"],
+)
+def test_custom_executor_projection(columns, expected_items):
+    sdk = mock.Mock(name="sdk")
+    inputs = executor.InitData(
+        sdk, mock.Mock(name="server_options"), options.TableOptions(dict(workspace="123")), _custom_table_columns()
+    )
+
+    executor.CustomExecutor(inputs).execute([], columns)
+
+    items = sdk.tables.for_items.call_args.args[1]
+    assert [item.local_id for item in items] == expected_items
+
+
+def test_insight_executor_projection():
+    sdk = mock.Mock(name="sdk")
+    attribute = Attribute(local_id="a1", label="region")
+    master = SimpleMetric(local_id="m1", item=ObjId("revenue", "metric"))
+    other = SimpleMetric(local_id="m2", item=ObjId("amount", "fact"))
+    pop = PopDateMetric(
+        local_id="m3", metric="m1", date_attributes=[PopDate(attribute=ObjId("year", "attribute"), periods_ago=1)]
+    )
+    sdk.insights.get_insight.return_value = mock.Mock(
+        attributes=[mock.Mock(**{"as_computable.return_value": attribute})],
+        metrics=[mock.Mock(**{"as_computable.return_value": m}) for m in [master, other, pop]],
+        filters=[],
+    )
+    table_columns = OrderedDict(
+        (name, ColumnDefinition(column_name=name, type_name="VARCHAR", options=dict(local_id=local_id)))
+        for name, local_id in [("region", "a1"), ("revenue", "m1"), ("amount", "m2"), ("revenue_ago", "m3")]
+    )
+    inputs = executor.InitData(
+        sdk, mock.Mock(name="server_options"), options.TableOptions(dict(workspace="123", insight="i")), table_columns
+    )
+
+    executor.InsightExecutor(inputs).execute([], ["revenue_ago"])
+
+    items = sdk.tables.for_items.call_args.args[1]
+    # time comparison cannot be computed without its master metric
+    assert [item.local_id for item in items] == ["a1", "m1", "m3"]
+
+
+def _sort_key(column_name, is_reversed=False):
+    return SortKey(attname=column_name, attnum=0, is_reversed=is_reversed, nulls_first=is_reversed, collate=None)
+
+
+def test_can_sort():
+    columns = _custom_table_columns()
+    columns["day"] = ColumnDefinition(column_name="day", type_name="DATE", options=dict(id="label/date.day"))
+    inputs = executor.InitData(
+        mock.Mock(name="sdk"), mock.Mock(name="server_options"), options.TableOptions(dict(workspace="123")), columns
+    )
+    custom_executor = executor.CustomExecutor(inputs)
+
+    sortable = [_sort_key("revenue", True), _sort_key("day")]
+    assert custom_executor.can_sort(sortable) == sortable
+    # text labels are sorted by the database collation which is not known to GoodData.CN
+    assert custom_executor.can_sort(sortable + [_sort_key("region")]) == []
+    # GoodData.CN sorts NULLs as the highest values
+    nulls_first = SortKey(attname="revenue", attnum=0, is_reversed=False, nulls_first=True, collate=None)
+    assert custom_executor.can_sort([nulls_first]) == []
+
+
+@pytest.mark.parametrize(
+    "table_options, expected",
+    [
+        (dict(workspace="123"), False),
+        (dict(workspace="123", push_down_limit="true"), True),
+        (dict(workspace="123", push_down_limit="FALSE"), False),
+    ],
+)
+def test_can_limit(table_options, expected):
+    inputs = executor.InitData(
+        mock.Mock(name="sdk"),
+        mock.Mock(name="server_options"),
+        options.TableOptions(table_options),
+        _custom_table_columns(),
+    )
+
+    assert executor.CustomExecutor(inputs).can_limit(2, 1) is expected
+
+
+def test_push_down_limit_option_invalid():
+    with pytest.raises(ValueError, match="push_down_limit"):
+        options.TableOptions(dict(workspace="123", push_down_limit="yes"))
+
+
+@pytest.mark.parametrize(
+    "quals, expected_rows",
+    [
+        ([], [1, 2]),
+        ([Qual("unknown", "=", "a")], [0, 1, 2, 3]),
+        # NUMERIC column does not round values, the metric value filter is exact
+        ([Qual("revenue", ">", 0)], [1, 2]),
+    ],
+    ids=["limited", "not-pushed-qual", "metric-qual"],
+)
+def test_custom_executor_sort_and_limit(quals, expected_rows):
+    sdk = mock.Mock(name="sdk")
+    sdk.tables.for_items.return_value.read_all.return_value = [dict(region=str(i), revenue=i) for i in range(4)]
+    inputs = executor.InitData(
+        sdk,
+        mock.Mock(name="server_options"),
+        options.TableOptions(dict(workspace="123", push_down_limit="true")),
+        _custom_table_columns(),
+    )
+
+    rows = list(executor.CustomExecutor(inputs).execute(quals, ["region"], [_sort_key("revenue", True)], 2, 1))
+
+    assert [row["revenue"] for row in rows] == expected_rows
+    items, _, sorts = sdk.tables.for_items.call_args.args[1:]
+    # sorted metric is computed even though it is not selected
+    assert [item.local_id for item in items] == ["region", "revenue"]
+    assert sorts == [MetricSortKey("revenue", "DESC")]
+
+
+def test_custom_executor_estimates():
+    sdk = mock.Mock(name="sdk")
+    sdk.compute.count_label_elements.return_value = 20
+    inputs = executor.InitData(
+        sdk, mock.Mock(name="server_options"), options.TableOptions(dict(workspace="123")), _custom_table_columns()
+    )
+    custom_executor = executor.CustomExecutor(inputs)
+
+    assert custom_executor.get_rel_size([Qual("region", "=", "East")], ["region", "revenue"]) == (1, 40)
+    assert custom_executor.get_path_keys() == [(("region",), 1)]
+    sdk.compute.count_label_elements.assert_called_with("123", "region")
+
+    sdk.compute.count_label_elements.side_effect = ValueError("unavailable")
+    assert custom_executor.get_rel_size([], ["region"]) == (DEFAULT_ROWS, 32)
+    assert custom_executor.get_path_keys() == []
+
+
+def test_compute_executor_metric_value_filter():
+    sdk = mock.Mock(name="sdk")
+    inputs = executor.InitData(
+        sdk,
+        mock.Mock(name="server_options"),
+        options.TableOptions(dict(workspace="123", compute="c")),
+        _custom_table_columns(),
+    )
+
+    executor.ComputeExecutor(inputs).execute([Qual("revenue", ">", 1000)], ["region"])
+
+    items, filters = sdk.tables.for_items.call_args.args[1:3]
+    assert [item.local_id for item in items] == ["region", "revenue"]
+    assert filters == [MetricValueFilter("revenue", "GREATER_THAN", 1000)]
@@ -2,12 +2,19 @@
 
 import datetime
 from collections import OrderedDict
+from decimal import Decimal
 
 import pytest
 
 from gooddata_fdw.environment import ColumnDefinition, Qual
-from gooddata_fdw.filter import MAX_DATE, MIN_DATE, extract_filters_from_quals
-from gooddata_sdk.compute_model import AbsoluteDateFilter, ObjId, PositiveAttributeFilter
+from gooddata_fdw.filter import MAX_DATE, MIN_DATE, extract_filters_from_quals, push_down_quals
+from gooddata_sdk.compute_model import (
+    AbsoluteDateFilter,
+    MetricValueFilter,
+    NegativeAttributeFilter,
+    ObjId,
+    PositiveAttributeFilter,
+)
 
 start_date = datetime.date(2021, 1, 1)
 end_date = datetime.date(2021, 2, 1)
@@ -28,6 +35,27 @@ def test_filter_columns():
         type_name="DATE",
         options=dict(id="label/datetime.day"),
     )
+    columns["month"] = ColumnDefinition(
+        column_name="month",
+        type_name="DATE",
+        options=dict(id="label/datetime.month"),
+    )
+    columns["hour"] = ColumnDefinition(
+        column_name="hour",
+        type_name="TIMESTAMP",
+        options=dict(id="label/datetime.hour"),
+    )
+    # metric
+    columns["revenue"] = ColumnDefinition(
+        column_name="revenue",
+        type_name="NUMERIC",
+        options=dict(id="metric/revenue"),
+    )
+    columns["margin"] = ColumnDefinition(
+        column_name="margin",
+        type_name="DECIMAL(18, 2)",
+        options=dict(id="metric/margin"),
+    )
 
     return columns
 
@@ -44,8 +72,7 @@ test_data = [
         # This represents SQL BETWEEN operation
         [Qual("datetime", ">=", start_date), Qual("datetime", "<=", end_date)],
         [
-            AbsoluteDateFilter(ObjId("datetime", "dataset"), "2021-01-01", MAX_DATE),
-            AbsoluteDateFilter(ObjId("datetime", "dataset"), MIN_DATE, "2021-02-02"),
+            AbsoluteDateFilter(ObjId("datetime", "dataset"), "2021-01-01", "2021-02-02"),
         ],
     ],
     [
@@ -57,8 +84,115 @@ test_data = [
     [
         [Qual("datetime", ">", start_date), Qual("datetime", "<", end_date)],
         [
-            AbsoluteDateFilter(ObjId("datetime", "dataset"), "2021-01-02", MAX_DATE),
-            AbsoluteDateFilter(ObjId("datetime", "dataset"), MIN_DATE, "2021-02-01"),
+            AbsoluteDateFilter(ObjId("datetime", "dataset"), "2021-01-02", "2021-02-01"),
+        ],
+    ],
+    [
+        [
+            Qual("datetime", "<", end_date),
+            Qual("car_model", "=", "Tesla"),
+            Qual("datetime", ">=", start_date),
+            Qual("datetime", "<=", datetime.date(2021, 1, 15)),
+        ],
+        [
+            AbsoluteDateFilter(ObjId("datetime", "dataset"), "2021-01-01", "2021-01-16"),
+            PositiveAttributeFilter("car_model", ["Tesla"]),
+        ],
+    ],
+    [
+        [Qual("datetime", "<", start_date)],
+        [
+            AbsoluteDateFilter(ObjId("datetime", "dataset"), MIN_DATE, "2021-01-01"),
+        ],
+    ],
+    [
+        # whole months of the values
+        [Qual("month", ">", datetime.date(2021, 1, 15)), Qual("month", "<=", datetime.date(2021, 12, 15))],
+        [
+            AbsoluteDateFilter(ObjId("datetime", "dataset"), "2021-02-01", "2022-01-01"),
+        ],
+    ],
+    [
+        [Qual("month", ">=", datetime.date(2021, 1, 15)), Qual("month", "<", datetime.date(2021, 3, 1))],
+        [
+            AbsoluteDateFilter(ObjId("datetime", "dataset"), "2021-02-01", "2021-03-01"),
+        ],
+    ],
+    [
+        [Qual("datetime", ("=", True), [start_date, end_date])],
+        [
+            PositiveAttributeFilter("datetime", ["2021-01-01", "2021-02-01"]),
+        ],
+    ],
+    [
+        [Qual("datetime", ("<>", False), [start_date, end_date])],
+        [
+            NegativeAttributeFilter("datetime", ["2021-01-01", "2021-02-01"]),
+        ],
+    ],
+    [
+        [Qual("datetime", "<>", start_date)],
+        [
+            NegativeAttributeFilter("datetime", ["2021-01-01"]),
+        ],
+    ],
+    [
+        # 2021-02-15 is not a beginning of month, no row has it
+        [Qual("month", ("=", True), [start_date, datetime.date(2021, 2, 15)])],
+        [
+            PositiveAttributeFilter("month", ["2021-01"]),
+        ],
+    ],
+    [
+        [Qual("hour", ("=", True), [datetime.datetime(2021, 1, 1, 10), datetime.datetime(2021, 1, 1, 11)])],
+        [
+            PositiveAttributeFilter("hour", ["2021-01-01 10", "2021-01-01 11"]),
+        ],
+    ],
+    [
+        [Qual("revenue", ">", Decimal(1000)), Qual("car_model", "=", "Tesla")],
+        [
+            PositiveAttributeFilter("car_model", ["Tesla"]),
+            MetricValueFilter("revenue", "GREATER_THAN", 1000),
+        ],
+    ],
+    [
+        # This represents SQL BETWEEN operation
+        [Qual("revenue", ">=", 10), Qual("revenue", "<=", 20.5)],
+        [
+            MetricValueFilter("revenue", "BETWEEN", (10, 20.5)),
+        ],
+    ],
+    [
+        [Qual("revenue", ">=", 10), Qual("revenue", ">", 10), Qual("revenue", "<", 30), Qual("revenue", "<=", 20)],
+        [
+            MetricValueFilter("revenue", "GREATER_THAN", 10),
+            MetricValueFilter("revenue", "LESS_THAN_OR_EQUAL_TO", 20),
+        ],
+    ],
+    [
+        # empty range
+        [Qual("revenue", ">=", 20), Qual("revenue", "<=", 10)],
+        [
+            MetricValueFilter("revenue", "GREATER_THAN_OR_EQUAL_TO", 20),
+            MetricValueFilter("revenue", "LESS_THAN_OR_EQUAL_TO", 10),
+        ],
+    ],
+    [
+        [Qual("revenue", "<>", 0), Qual("revenue", "=", 5)],
+        [],
+    ],
+    [
+        # 999.996 is 1000.00 in DECIMAL(18, 2) column, bounds are widened by half a cent
+        [Qual("margin", ">", Decimal("999.99")), Qual("margin", "<", 2000)],
+        [
+            MetricValueFilter("margin", "BETWEEN", (999.985, 2000.005)),
+        ],
+    ],
+    [
+        [Qual("margin", ">=", 1000)],
+        [
+            MetricValueFilter("margin", "GREATER_THAN_OR_EQUAL_TO", 999.995),
         ],
     ],
 ]
@@ -69,3 +203,82 @@ def test_quals(test_filter_columns, quals, expected):
     filters = extract_filters_from_quals(quals, test_filter_columns)
 
     assert filters == expected
+
+
+def test_remaining_quals(test_filter_columns):
+    exact = [Qual("datetime", ">=", start_date), Qual("month", ("=", True), [start_date])]
+    # hours are filtered by whole days, PostgreSQL must filter the rest
+    inexact = [
+        Qual("hour", ">=", datetime.datetime(2021, 1, 1, 10)),
+        Qual("month", ("=", True), [end_date.replace(day=2)]),
+    ]
+
+    filters, remaining_quals = push_down_quals(exact + inexact, test_filter_columns)
+
+    assert filters == [
+        AbsoluteDateFilter(ObjId("datetime", "dataset"), "2021-01-01", MAX_DATE),
+        PositiveAttributeFilter("month", ["2021-01"]),
+        AbsoluteDateFilter(ObjId("datetime", "dataset"), "2021-01-01", MAX_DATE),
+    ]
+    assert remaining_quals == inexact
+
+
+@pytest.mark.parametrize(
+    "empty",
+    [
+        [Qual("datetime", ">", datetime.date(2021, 5, 1)), Qual("datetime", "<", datetime.date(2021, 3, 1))],
+        # 2021-02-15 is not a beginning of month, no row has it
+        [Qual("month", "=", datetime.date(2021, 2, 15))],
+    ],
+    ids=["inverted", "not-period-start"],
+)
+def test_remaining_empty_date_range(test_filter_columns, empty):
+    quals = [Qual("car_model", "=", "Tesla")] + empty
+
+    filters, remaining_quals = push_down_quals(quals, test_filter_columns)
+
+    # empty date range is not sent, PostgreSQL filters out all rows
+    assert filters == [PositiveAttributeFilter("car_model", ["Tesla"])]
+    assert remaining_quals == empty
+
+
+def test_remaining_date_list_quals(test_filter_columns):
+    quals = [
+        Qual("datetime", ("<>", True), [start_date, end_date]),
+        Qual("datetime", ("=", False), [start_date, end_date]),
+        Qual("datetime", (">", True), [start_date, end_date]),
+    ]
+
+    filters, remaining_quals = push_down_quals(quals, test_filter_columns)
+
+    assert filters == []
+    assert remaining_quals == quals
+
+
+def test_remaining_metric_quals(test_filter_columns):
+    # IS NULL, IS NOT NULL, IN and equality which is not exact for rounded values
+    quals = [
+        Qual("revenue", "=", None),
+        Qual("revenue", "<>", None),
+        Qual("revenue", ("=", True), [1, 2]),
+        Qual("margin", "=", 1000),
+    ]
+
+    filters, remaining_quals = push_down_quals(quals, test_filter_columns)
+
+    assert filters == []
+    assert remaining_quals == quals
+
+
+def test_rounded_metric_quals(test_filter_columns):
+    quals = [Qual("margin", ">=", 1000), Qual("revenue", "<", 10)]
+
+    filters, remaining_quals = push_down_quals(quals, test_filter_columns)
+
+    # computed value 999.995 is 1000.00 in DECIMAL(18, 2) column, the filter is wider than the qual
+    assert filters == [
+        MetricValueFilter("margin", "GREATER_THAN_OR_EQUAL_TO", 999.995),
+        MetricValueFilter("revenue", "LESS_THAN", 10),
+    ]
+    # only the comparison of rounded values is evaluated by PostgreSQL
+    assert remaining_quals == quals[:1]
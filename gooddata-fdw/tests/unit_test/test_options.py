@@ -90,12 +90,22 @@ class TestBaseOptions:
 
 class TestServerOptions:
     def test_options_with_optional(self):
-        config = dict(host="https://abc", token="123", headers_host="abc")
+        config = dict(
+            host="https://abc",
+            token="123",
+            headers_host="abc",
+            result_cache_ttl="60",
+            result_cache_dir="/tmp/cache",
+            max_retries="3",
+        )
         so = options.ServerOptions(config)
 
         assert so.host == config["host"]
         assert so.token == config["token"]
         assert so.headers_host == config["headers_host"]
+        assert so.result_cache_ttl == 60.0
+        assert so.result_cache_dir == config["result_cache_dir"]
+        assert so.max_retries == 3
 
     def test_options_without_optional(self):
         config = dict(host="https://abc", token="123")
@@ -104,6 +114,9 @@ class TestServerOptions:
         assert so.host == config["host"]
         assert so.token == config["token"]
         assert so.headers_host is None
+        assert so.result_cache_ttl is None
+        assert so.result_cache_dir is None
+        assert so.max_retries is None
 
     @pytest.mark.parametrize(
         "config",
@@ -122,6 +135,18 @@ class TestServerOptions:
         with pytest.raises(ValueError):
             options.ServerOptions(config)
 
+    @pytest.mark.parametrize("max_retries", ["-1", "abc"])
+    def test_options_invalid_max_retries(self, max_retries):
+        config = dict(host="https://abc", token="123", max_retries=max_retries)
+        with pytest.raises(ValueError):
+            options.ServerOptions(config)
+
+    @pytest.mark.parametrize("ttl", ["0", "-1", "abc"])
+    def test_options_invalid_result_cache_ttl(self, ttl):
+        config = dict(host="https://abc", token="123", result_cache_ttl=ttl)
+        with pytest.raises(ValueError):
+            options.ServerOptions(config)
+
 
 class TestTableOptions:
     def test_options_with_optional(self):
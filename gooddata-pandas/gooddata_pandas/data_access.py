@@ -1,7 +1,7 @@
 # (C) 2021 GoodData Corporation
 from __future__ import annotations
 
-from typing import Any, Optional, Union
+from typing import Any, Generator, Optional, Union
 
 from gooddata_pandas.utils import (
     ColumnsDef,
@@ -10,10 +10,27 @@ from gooddata_pandas.utils import (
     _str_to_obj_id,
     _to_attribute,
     _to_item,
-    _typed_attribute_value,
+    _typed_attribute_values,
 )
-from gooddata_sdk import Attribute, Catalog, ExecutionDefinition, ExecutionResponse, Filter, GoodDataSdk, Metric, ObjId
+from gooddata_sdk import (
+    Attribute,
+    Catalog,
+    ExecutionDefinition,
+    ExecutionResponse,
+    ExecutionResult,
+    Filter,
+    GoodDataSdk,
+    Metric,
+    ObjId,
+)
+from gooddata_sdk.compute import PageSize, PageSizer
 from gooddata_sdk.compute_model import AttributeFilter, MetricValueFilter
+from gooddata_sdk.type_converter import AttributeConverterStore, StringConverter
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None  # type: ignore
 
 
 class ExecutionDefinitionBuilder:
@@ -185,19 +202,39 @@ def _compute(
 
 
 _RESULT_PAGE_LEN = 1000
+"""
+Number of rows read from the result at once, unless configured otherwise on the factory or on the SDK.
+"""
+
+
+def _page_size(sdk: GoodDataSdk, page_size: Optional[PageSize]) -> PageSize:
+    if page_size is not None:
+        return page_size
+
+    return sdk.compute.page_size if sdk.compute.page_size is not None else _RESULT_PAGE_LEN
+
+
+_RESULT_METRICS_TILE_LEN = 256
+"""
+Maximum number of metrics read from the result at once; pages of results with more metrics are read in tiles.
+"""
 
 
 #
-# Note: both of the extract functions assume the number of measures requested for the data frame is less than
-# page limit enforced by the server. The function for getting data frame for measures only does not paging at all
-# and the one that gets data from possibly two-dimensional result always pages only through the dimension that
-# contains attributes.
+# Note: the extract functions page only through the dimension that contains attributes. Each page contains values of
+# all the metrics - if there are more metrics than can be read at once, the page is read in tiles which are
+# stitched together.
 #
 
 
 def _extract_for_metrics_only(response: ExecutionResponse, cols: list, col_to_metric_idx: dict) -> dict:
     exec_def = response.exec_def
-    result = response.read_result(len(exec_def.metrics))
+    limit = [len(exec_def.metrics)]
+
+    if limit[0] > _RESULT_METRICS_TILE_LEN:
+        result = response.read_result_tiled(limit=limit, tile_limit=[_RESULT_METRICS_TILE_LEN])
+    else:
+        result = response.read_result(limit)
     data = dict()
 
     for col in cols:
@@ -211,7 +248,32 @@ def _typed_result(catalog: Catalog, attribute: Attribute, result_values: list[An
     catalog_attribute = catalog.find_label_attribute(attribute.label)
     if catalog_attribute is None:
         raise ValueError(f"Unable to find attribute {attribute.label} in catalog")
-    return [_typed_attribute_value(catalog_attribute, value) for value in result_values]
+    return list(_typed_attribute_values(catalog_attribute, result_values))
+
+
+def _read_attribute_pages(
+    response: ExecutionResponse, attribute_dim: int, page_size: PageSize
+) -> Generator[ExecutionResult, None, None]:
+    """Reads the result page-by-page, paging through the dimension with attributes."""
+    exec_def = response.exec_def
+    sizer = PageSizer(page_size)
+    offset = [0 for _ in exec_def.dimensions]
+
+    while True:
+        if exec_def.has_metrics():
+            limit = [len(exec_def.metrics), sizer.size]
+            tile_limit = [_RESULT_METRICS_TILE_LEN, sizer.size]
+        else:
+            limit = tile_limit = [sizer.size]
+
+        result = sizer.read(response, offset=list(offset), limit=limit, dim=attribute_dim, tile_limit=tile_limit)
+
+        yield result
+
+        if result.is_complete(attribute_dim):
+            break
+
+        offset[attribute_dim] = result.next_page_start(attribute_dim)
 
 
 def _extract_from_attributes_and_maybe_metrics(
@@ -221,13 +283,11 @@ def _extract_from_attributes_and_maybe_metrics(
     col_to_attr_idx: dict[str, int],
     col_to_metric_idx: dict[str, int],
     index_to_attr_idx: Optional[dict[str, int]] = None,
+    page_size: PageSize = _RESULT_PAGE_LEN,
 ) -> tuple[dict, dict]:
 
     exec_def = response.exec_def
-    offset = [0 for _ in exec_def.dimensions]
-    limit = [len(exec_def.metrics), _RESULT_PAGE_LEN] if exec_def.has_metrics() else [_RESULT_PAGE_LEN]
     attribute_dim = 1 if exec_def.has_metrics() else 0
-    result = response.read_result(limit=limit, offset=offset)
     safe_index_to_attr_idx = index_to_attr_idx if index_to_attr_idx is not None else dict()
 
     # mappings from column name to Attribute
@@ -238,33 +298,98 @@ def _extract_from_attributes_and_maybe_metrics(
     index: dict[str, list[Any]] = {idx_name: [] for idx_name in safe_index_to_attr_idx}
     data: dict[str, list[Any]] = {col: [] for col in cols}
 
-    while True:
+    for result in _read_attribute_pages(response, attribute_dim, page_size):
+        header_columns = result.get_all_header_columns(attribute_dim)
         for idx_name in index:
-            rs = result.get_all_header_values(attribute_dim, safe_index_to_attr_idx[idx_name])
+            rs = header_columns[safe_index_to_attr_idx[idx_name]]
             attribute = index_to_attribute[idx_name]
             index[idx_name] += _typed_result(catalog, attribute, rs)
         for col in cols:
             if col in col_to_attr_idx:
-                rs = result.get_all_header_values(attribute_dim, col_to_attr_idx[col])
+                rs = header_columns[col_to_attr_idx[col]]
                 attribute = col_to_attribute[col]
                 data[col] += _typed_result(catalog, attribute, rs)
             else:
                 data[col] += result.data[col_to_metric_idx[col]]
-        if result.is_complete(attribute_dim):
-            break
-
-        offset[attribute_dim] = result.next_page_start(attribute_dim)
-        result = response.read_result(limit=limit, offset=offset)
 
     return data, index
 
 
+def _ensure_pyarrow() -> None:
+    if pyarrow is None:
+        raise ImportError("Arrow support requires the pyarrow package. Install it using 'pip install pyarrow'.")
+
+
+def _typed_result_arrow(catalog: Catalog, attribute: Attribute, result_values: list[Any]) -> pyarrow.Array:
+    """Convert result_values to arrow array of proper data type; plain labels are dictionary-encoded."""
+    catalog_attribute = catalog.find_label_attribute(attribute.label)
+    if catalog_attribute is None:
+        raise ValueError(f"Unable to find attribute {attribute.label} in catalog")
+
+    converter = AttributeConverterStore.find_converter(
+        catalog_attribute.dataset.data_type, catalog_attribute.granularity
+    )
+    if isinstance(converter, StringConverter):
+        return pyarrow.array(result_values, type=pyarrow.string()).dictionary_encode()
+
+    return pyarrow.array(converter.to_external_type_batch(result_values))
+
+
+def _extract_arrow_for_metrics_only(response: ExecutionResponse, cols: list, col_to_metric_idx: dict) -> pyarrow.Table:
+    data = _extract_for_metrics_only(response, cols, col_to_metric_idx)
+
+    return pyarrow.table({col: pyarrow.array(values, type=pyarrow.float64()) for col, values in data.items()})
+
+
+def _extract_arrow_from_attributes_and_maybe_metrics(
+    response: ExecutionResponse,
+    catalog: Catalog,
+    cols: list[str],
+    col_to_attr_idx: dict[str, int],
+    col_to_metric_idx: dict[str, int],
+    index_to_attr_idx: Optional[dict[str, int]] = None,
+    page_size: PageSize = _RESULT_PAGE_LEN,
+) -> pyarrow.Table:
+    exec_def = response.exec_def
+    attribute_dim = 1 if exec_def.has_metrics() else 0
+    safe_index_to_attr_idx = index_to_attr_idx if index_to_attr_idx is not None else dict()
+
+    # mappings from column name to Attribute
+    index_to_attribute = {index_name: exec_def.attributes[i] for index_name, i in safe_index_to_attr_idx.items()}
+    col_to_attribute = {col: exec_def.attributes[i] for col, i, in col_to_attr_idx.items()}
+
+    # each page is converted to arrow arrays right away; the arrays then become chunks of the table columns
+    index_chunks: dict[str, list[pyarrow.Array]] = {idx_name: [] for idx_name in safe_index_to_attr_idx}
+    data_chunks: dict[str, list[pyarrow.Array]] = {col: [] for col in cols}
+
+    for result in _read_attribute_pages(response, attribute_dim, page_size):
+        header_columns = result.get_all_header_columns(attribute_dim)
+        for idx_name in index_chunks:
+            rs = header_columns[safe_index_to_attr_idx[idx_name]]
+            index_chunks[idx_name].append(_typed_result_arrow(catalog, index_to_attribute[idx_name], rs))
+        for col in cols:
+            if col in col_to_attr_idx:
+                rs = header_columns[col_to_attr_idx[col]]
+                data_chunks[col].append(_typed_result_arrow(catalog, col_to_attribute[col], rs))
+            else:
+                values = result.data[col_to_metric_idx[col]]
+                data_chunks[col].append(pyarrow.array(values, type=pyarrow.float64()))
+
+    chunks = [*index_chunks.values(), *data_chunks.values()]
+
+    return pyarrow.table(
+        [pyarrow.chunked_array(column_chunks) for column_chunks in chunks],
+        names=[*index_chunks.keys(), *data_chunks.keys()],
+    )
+
+
 def compute_and_extract(
     sdk: GoodDataSdk,
     workspace_id: str,
     columns: ColumnsDef,
     index_by: Optional[IndexDef] = None,
     filter_by: Optional[Union[Filter, list[Filter]]] = None,
+    page_size: Optional[PageSize] = None,
 ) -> tuple[dict, dict]:
     """
     Convenience function to drive computation & data extraction on behalf of the series and data frame factories.
@@ -278,6 +403,9 @@ def compute_and_extract(
 
     Note that as convenience it is possible to pass just single index. in that case the index dict will contain exactly
     one key of '0' (just get first value from dict when consuming the result).
+
+    The result is read in pages of `page_size` - either fixed number of rows or adaptive paging; when not specified,
+    page size configured on the SDK is used.
     """
     result = _compute(
         sdk=sdk,
@@ -304,4 +432,57 @@ def compute_and_extract(
             col_to_attr_idx,
             col_to_metric_idx,
             index_to_attr_idx,
+            _page_size(sdk, page_size),
         )
+
+
+def compute_and_extract_arrow(
+    sdk: GoodDataSdk,
+    workspace_id: str,
+    columns: ColumnsDef,
+    index_by: Optional[IndexDef] = None,
+    filter_by: Optional[Union[Filter, list[Filter]]] = None,
+    page_size: Optional[PageSize] = None,
+) -> tuple[pyarrow.Table, list[str]]:
+    """
+    Arrow-based variant of `compute_and_extract`. Instead of growing python lists, each page of the result is
+    converted to arrow arrays right away: labels are dictionary-encoded, metric values are float64 and labels of
+    date attributes are converted to their respective types.
+
+    The returned table contains the index columns (if any) first, followed by the data columns. Names of the index
+    columns are returned as well so that the caller can set up the index after converting to pandas.
+
+    Paging of the result can be configured using `page_size`, see `compute_and_extract`.
+
+    Requires pyarrow to be installed.
+    """
+    _ensure_pyarrow()
+
+    result = _compute(
+        sdk=sdk,
+        workspace_id=workspace_id,
+        index_by=index_by,
+        columns=columns,
+        filter_by=filter_by,
+    )
+
+    response, col_to_attr_idx, col_to_metric_idx, index_to_attr_idx = result
+
+    exec_def = response.exec_def
+    cols = list(columns.keys())
+
+    if not exec_def.has_attributes():
+        return _extract_arrow_for_metrics_only(response, cols, col_to_metric_idx), []
+
+    catalog = sdk.catalog.get_full_catalog(workspace_id)
+    table = _extract_arrow_from_attributes_and_maybe_metrics(
+        response,
+        catalog,
+        cols,
+        col_to_attr_idx,
+        col_to_metric_idx,
+        index_to_attr_idx,
+        _page_size(sdk, page_size),
+    )
+
+    return table, list(index_to_attr_idx.keys())
@@ -1,11 +1,11 @@
 # (C) 2021 GoodData Corporation
 from __future__ import annotations
 
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Optional, Union
 
 import pandas
 
-from gooddata_pandas.data_access import compute_and_extract
+from gooddata_pandas.data_access import compute_and_extract, compute_and_extract_arrow
 from gooddata_pandas.utils import (
     ColumnsDef,
     DefaultInsightColumnNaming,
@@ -14,7 +14,10 @@ from gooddata_pandas.utils import (
     _to_item,
     make_pandas_index,
 )
-from gooddata_sdk import Attribute, Filter, GoodDataSdk
+from gooddata_sdk import Attribute, Filter, GoodDataSdk, PageSize
+
+if TYPE_CHECKING:
+    import pyarrow
 
 
 class DataFrameFactory:
@@ -34,11 +37,27 @@ class DataFrameFactory:
 
     Note that all of these methods have additional levels of convenience and flexibility so their purpose is not
     limited to just what is listed above.
+
+    There are also Arrow variants of the methods - indexed_arrow(), not_indexed_arrow() and for_insight_arrow() -
+    which return pyarrow.Table instead of DataFrame. These require the pyarrow package.
     """
 
-    def __init__(self, sdk: GoodDataSdk, workspace_id: str) -> None:
+    def __init__(
+        self, sdk: GoodDataSdk, workspace_id: str, use_arrow: bool = False, page_size: Optional[PageSize] = None
+    ) -> None:
+        """
+        :param sdk: GoodDataSdk instance to use for computations
+        :param workspace_id: workspace to which the factory is bound
+        :param use_arrow: optionally materialize data frames through pyarrow; the result pages are converted to arrow
+            arrays right away and the DataFrame is created using pyarrow.Table.to_pandas(). This lowers peak memory
+            for large frames. Note that label columns will be of categorical data type. Requires pyarrow.
+        :param page_size: optionally specify size of the result pages to read: either fixed number of rows or
+            adaptive paging (see `AdaptivePaging`); by default, page size configured on the SDK is used
+        """
         self._sdk = sdk
         self._workspace_id = workspace_id
+        self._use_arrow = use_arrow
+        self._page_size = page_size
 
     def indexed(
         self, index_by: IndexDef, columns: ColumnsDef, filter_by: Optional[Union[Filter, list[Filter]]] = None
@@ -76,12 +95,25 @@ class DataFrameFactory:
 
         :return: pandas dataframe instance
         """
+        if self._use_arrow:
+            return _arrow_to_pandas(
+                *compute_and_extract_arrow(
+                    self._sdk,
+                    self._workspace_id,
+                    columns=columns,
+                    index_by=index_by,
+                    filter_by=filter_by,
+                    page_size=self._page_size,
+                )
+            )
+
         data, index = compute_and_extract(
             self._sdk,
             self._workspace_id,
             columns=columns,
             index_by=index_by,
             filter_by=filter_by,
+            page_size=self._page_size,
         )
 
         _idx = make_pandas_index(index)
@@ -113,8 +145,12 @@ class DataFrameFactory:
 
         :return: pandas dataframe instance
         """
+        if self._use_arrow:
+            return _arrow_to_pandas(self.not_indexed_arrow(columns=columns, filter_by=filter_by), [])
 
-        data, _ = compute_and_extract(self._sdk, self._workspace_id, columns=columns, filter_by=filter_by)
+        data, _ = compute_and_extract(
+            self._sdk, self._workspace_id, columns=columns, filter_by=filter_by, page_size=self._page_size
+        )
 
         return pandas.DataFrame(data=data)
 
@@ -203,6 +239,62 @@ class DataFrameFactory:
 
         :return: pandas dataframe instance
         """
+        columns, filter_by = self._insight_columns(insight_id)
+
+        return self.for_items(columns, filter_by=filter_by, auto_index=auto_index)
+
+    def indexed_arrow(
+        self, index_by: IndexDef, columns: ColumnsDef, filter_by: Optional[Union[Filter, list[Filter]]] = None
+    ) -> pyarrow.Table:
+        """
+        Arrow variant of `indexed`. Arrow tables have no index; the returned table contains the index columns
+        first, followed by the data columns. Label values are dictionary-encoded, metric values are float64.
+
+        :param index_by: see `indexed`
+        :param columns: see `indexed`
+        :param filter_by: see `indexed`
+        :return: pyarrow table instance
+        """
+        table, _ = compute_and_extract_arrow(
+            self._sdk,
+            self._workspace_id,
+            columns=columns,
+            index_by=index_by,
+            filter_by=filter_by,
+            page_size=self._page_size,
+        )
+
+        return table
+
+    def not_indexed_arrow(
+        self, columns: ColumnsDef, filter_by: Optional[Union[Filter, list[Filter]]] = None
+    ) -> pyarrow.Table:
+        """
+        Arrow variant of `not_indexed`. Label values are dictionary-encoded, metric values are float64.
+
+        :param columns: see `not_indexed`
+        :param filter_by: see `not_indexed`
+        :return: pyarrow table instance
+        """
+        table, _ = compute_and_extract_arrow(
+            self._sdk, self._workspace_id, columns=columns, filter_by=filter_by, page_size=self._page_size
+        )
+
+        return table
+
+    def for_insight_arrow(self, insight_id: str) -> pyarrow.Table:
+        """
+        Arrow variant of `for_insight`. The returned table contains column per each attribute and metric in
+        the insight.
+
+        :param insight_id: insight identifier
+        :return: pyarrow table instance
+        """
+        columns, filter_by = self._insight_columns(insight_id)
+
+        return self.not_indexed_arrow(columns=columns, filter_by=filter_by)
+
+    def _insight_columns(self, insight_id: str) -> tuple[ColumnsDef, list[Filter]]:
         naming = DefaultInsightColumnNaming()
         insight = self._sdk.insights.get_insight(workspace_id=self._workspace_id, insight_id=insight_id)
         filter_by = [f.as_computable() for f in insight.filters]
@@ -211,4 +303,18 @@ class DataFrameFactory:
             **{naming.col_name_for_metric(m): m.as_computable() for m in insight.metrics},
         }
 
-        return self.for_items(columns, filter_by=filter_by, auto_index=auto_index)
+        return columns, filter_by
+
+
+def _arrow_to_pandas(table: pyarrow.Table, index_names: list[str]) -> pandas.DataFrame:
+    # index columns are first in the table; pick them by position - index may be named same as some data column
+    index = {name: table.column(i).to_pandas() for i, name in enumerate(index_names)}
+    data_table = table.select(list(range(len(index_names), table.num_columns)))
+
+    df = data_table.to_pandas(split_blocks=True)
+    _idx = make_pandas_index(index)
+
+    if _idx is not None:
+        df.index = _idx
+
+    return df
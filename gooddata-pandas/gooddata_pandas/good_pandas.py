@@ -6,7 +6,7 @@ from typing import Optional
 from gooddata_pandas import __version__
 from gooddata_pandas.dataframe import DataFrameFactory
 from gooddata_pandas.series import SeriesFactory
-from gooddata_sdk import GoodDataSdk
+from gooddata_sdk import GoodDataSdk, PageSize
 
 USER_AGENT = f"gooddata-pandas/{__version__}"
 """Extra segment of the User-Agent header that will be appended to standard gooddata-sdk user agent."""
@@ -17,8 +17,17 @@ class GoodPandas:
     Facade to access factories that create pandas Series and DataFrames using analytics computed by GoodData.CN.
     """
 
-    def __init__(self, host: str, token: str, headers_host: Optional[str] = None) -> None:
-        self._sdk = GoodDataSdk.create(host, token, USER_AGENT, Host=headers_host)
+    def __init__(
+        self, host: str, token: str, headers_host: Optional[str] = None, page_size: Optional[PageSize] = None
+    ) -> None:
+        """
+        :param host: host of GoodData.CN
+        :param token: API token to use
+        :param headers_host: optionally specify value of the Host header
+        :param page_size: optionally specify size of the result pages read by all the factories: either fixed number
+            of rows or adaptive paging (see `AdaptivePaging`)
+        """
+        self._sdk = GoodDataSdk.create(host, token, USER_AGENT, page_size_=page_size, Host=headers_host)
         self._series_per_ws: dict[str, SeriesFactory] = dict()
         self._frames_per_ws: dict[str, DataFrameFactory] = dict()
 
@@ -7,13 +7,20 @@ import pandas
 
 from gooddata_pandas.data_access import compute_and_extract
 from gooddata_pandas.utils import IndexDef, LabelItemDef, make_pandas_index
-from gooddata_sdk import Attribute, Filter, GoodDataSdk, ObjId, SimpleMetric
+from gooddata_sdk import Attribute, Filter, GoodDataSdk, ObjId, PageSize, SimpleMetric
 
 
 class SeriesFactory:
-    def __init__(self, sdk: GoodDataSdk, workspace_id: str) -> None:
+    def __init__(self, sdk: GoodDataSdk, workspace_id: str, page_size: Optional[PageSize] = None) -> None:
+        """
+        :param sdk: GoodDataSdk instance to use for computations
+        :param workspace_id: workspace to which the factory is bound
+        :param page_size: optionally specify size of the result pages to read: either fixed number of rows or
+            adaptive paging (see `AdaptivePaging`); by default, page size configured on the SDK is used
+        """
         self._sdk = sdk
         self._workspace_id = workspace_id
+        self._page_size = page_size
 
     def indexed(
         self,
@@ -57,6 +64,7 @@ class SeriesFactory:
             index_by=index_by,
             columns={"_series": data_by},
             filter_by=filter_by,
+            page_size=self._page_size,
         )
 
         _idx = make_pandas_index(index)
@@ -113,6 +121,7 @@ class SeriesFactory:
             index_by=_index,
             columns={"_series": data_by},
             filter_by=filter_by,
+            page_size=self._page_size,
         )
 
         return pandas.Series(data=data["_series"])
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import hashlib
 import uuid
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 import pandas
 from pandas.core.index import Index, MultiIndex
@@ -17,11 +17,23 @@ IndexDef = Union[LabelItemDef, Dict[str, LabelItemDef]]
 ColumnsDef = Dict[str, DataItemDef]
 
 
+def _to_datetime_batch(values: list[str], to_format: Callable[[str], str]) -> pandas.DatetimeIndex:
+    # all values of a label come in the same format; knowing it upfront lets pandas parse the values vectorized
+    fmt = to_format(values[0]) if len(values) else None
+    return pandas.to_datetime(values, format=fmt)
+
+
 # register external pandas types to converters
 IntegerConverter.set_external_fnc(lambda self, value: pandas.to_numeric(value))
 DateConverter.set_external_fnc(lambda self, value: pandas.to_datetime(value))
 DatetimeConverter.set_external_fnc(lambda self, value: pandas.to_datetime(value))
 
+IntegerConverter.set_external_batch_fnc(lambda self, values: pandas.to_numeric(values))
+DateConverter.set_external_batch_fnc(lambda self, values: _to_datetime_batch(values, DateConverter.to_date_format))
+DatetimeConverter.set_external_batch_fnc(
+    lambda self, values: _to_datetime_batch(values, DatetimeConverter.to_datetime_format)
+)
+
 
 def _unique_local_id() -> str:
     return uuid.uuid4().hex.replace("-", "")
@@ -74,9 +86,9 @@ def _to_attribute(val: LabelItemDef, local_id: Optional[str] = None) -> Attribut
         raise ValueError(f"Invalid attribute input: {val}")
 
 
-def _typed_attribute_value(ct_attr: CatalogAttribute, value: Any) -> Any:
+def _typed_attribute_values(ct_attr: CatalogAttribute, values: list[Any]) -> Any:
     converter = AttributeConverterStore.find_converter(ct_attr.dataset.data_type, ct_attr.granularity)
-    return converter.to_external_type(value)
+    return converter.to_external_type_batch(values)
 
 
 def make_pandas_index(index: dict) -> Optional[Union[Index, MultiIndex]]:
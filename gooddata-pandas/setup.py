@@ -25,6 +25,7 @@ setup(
     license_file="LICENSE.txt",
     license_files=("LICENSE.txt",),
     install_requires=REQUIRES,
+    extras_require={"arrow": ["pyarrow"]},
     packages=find_packages(exclude=["tests"]),
     python_requires=">=3.7.0",
     project_urls={
@@ -0,0 +1,87 @@
+# (C) 2022 GoodData Corporation
+from pathlib import Path
+
+import pandas
+import pytest
+import vcr
+
+from gooddata_pandas import DataFrameFactory
+from tests import VCR_MATCH_ON
+
+pyarrow = pytest.importorskip("pyarrow")
+
+_current_dir = Path(__file__).parent.absolute()
+_fixtures_dir = _current_dir / "fixtures"
+
+gd_vcr = vcr.VCR(filter_headers=["authorization", "user-agent"], serializer="json", match_on=VCR_MATCH_ON)
+
+
+@pytest.fixture
+def gdf_arrow(gdf: DataFrameFactory) -> DataFrameFactory:
+    return DataFrameFactory(sdk=gdf._sdk, workspace_id=gdf._workspace_id, use_arrow=True)
+
+
+@gd_vcr.use_cassette(str(_fixtures_dir / "not_indexed_metrics.json"))
+def test_not_indexed_metrics_arrow(gdf: DataFrameFactory):
+    table = gdf.not_indexed_arrow(
+        columns=dict(
+            order_amount="metric/order_amount",
+            order_count="metric/amount_of_orders",
+        )
+    )
+
+    assert table.num_rows == 1
+    assert table.column_names == ["order_amount", "order_count"]
+    assert table.schema.field("order_amount").type == pyarrow.float64()
+
+
+@gd_vcr.use_cassette(str(_fixtures_dir / "not_indexed_metrics_and_labels.json"))
+def test_not_indexed_metrics_and_labels_arrow(gdf: DataFrameFactory):
+    table = gdf.not_indexed_arrow(
+        columns=dict(
+            reg="label/customers.region",
+            order_amount="metric/order_amount",
+            order_count="metric/amount_of_orders",
+        )
+    )
+
+    assert table.num_rows == 5
+    assert table.column_names == ["reg", "order_amount", "order_count"]
+    assert pyarrow.types.is_dictionary(table.schema.field("reg").type)
+    assert table.schema.field("order_count").type == pyarrow.float64()
+
+
+@gd_vcr.use_cassette(str(_fixtures_dir / "simple_index_metrics_and_label.json"))
+def test_simple_index_metrics_and_label_arrow(gdf: DataFrameFactory):
+    columns = {
+        "Price": "fact/order_lines.price",
+        "Quantity ($special$%^&)": "fact/order_lines.quantity",
+        "Region code ($special$%^&)": "label/customers.region",
+    }
+    table = gdf.indexed_arrow(index_by=dict(reg="label/customers.region"), columns=columns)
+
+    assert table.num_rows == 5
+    assert table.column_names == ["reg", *columns.keys()]
+
+
+@gd_vcr.use_cassette(str(_fixtures_dir / "simple_index_metrics_and_label.json"), allow_playback_repeats=True)
+def test_simple_index_metrics_and_label_use_arrow(gdf: DataFrameFactory, gdf_arrow: DataFrameFactory):
+    columns = {
+        "Price": "fact/order_lines.price",
+        "Quantity ($special$%^&)": "fact/order_lines.quantity",
+        "Region code ($special$%^&)": "label/customers.region",
+    }
+    df = gdf.indexed(index_by=dict(reg="label/customers.region"), columns=columns)
+    df_arrow = gdf_arrow.indexed(index_by=dict(reg="label/customers.region"), columns=columns)
+
+    pandas.testing.assert_frame_equal(df, df_arrow, check_dtype=False, check_categorical=False, check_index_type=False)
+
+
+@gd_vcr.use_cassette(str(_fixtures_dir / "dataframe_for_insight_date.json"))
+def test_dataframe_for_insight_date_use_arrow(gdf_arrow: DataFrameFactory):
+    df = gdf_arrow.for_insight(insight_id="customers_trend")
+
+    assert len(df) == 12
+    assert df.index.name == "date.month"
+    assert df.index.dtype.name == "datetime64[ns]"
+    assert list(df.columns) == ["amount_of_active_customers", "revenue_per_customer"]
@@ -14,16 +14,25 @@ from gooddata_sdk.catalog import (
     CatalogMetric,
     CatalogService,
 )
-from gooddata_sdk.client import GoodDataApiClient
-from gooddata_sdk.compute import ComputeService, ExecutionDefinition, ExecutionResponse, ExecutionResult
+from gooddata_sdk.client import CircuitBreaker, CircuitBreakerOpenError, GoodDataApiClient, RetryPolicy
+from gooddata_sdk.compute import (
+    AdaptivePaging,
+    ComputeService,
+    ExecutionDefinition,
+    ExecutionResponse,
+    ExecutionResult,
+    PageSize,
+)
 from gooddata_sdk.compute_model import (
     AbsoluteDateFilter,
     AllTimeFilter,
     ArithmeticMetric,
     Attribute,
+    AttributeSortKey,
     ExecModelEntity,
     Filter,
     Metric,
+    MetricSortKey,
     MetricValueFilter,
     NegativeAttributeFilter,
     ObjId,
@@ -35,8 +44,10 @@ from gooddata_sdk.compute_model import (
     RankingFilter,
     RelativeDateFilter,
     SimpleMetric,
+    SortKey,
 )
 from gooddata_sdk.insight import Insight, InsightAttribute, InsightBucket, InsightMetric, InsightService
+from gooddata_sdk.result_cache import DiskResultCache, MemoryResultCache, ResultCache
 from gooddata_sdk.sdk import GoodDataSdk
 from gooddata_sdk.table import ExecutionTable, TableService
 from gooddata_sdk.utils import SideLoads
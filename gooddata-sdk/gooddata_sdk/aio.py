@@ -0,0 +1,650 @@
+# (C) 2022 GoodData Corporation
+"""
+Module containing asyncio variant of the SDK. The services mirror their synchronous counterparts but all operations
+that talk to GoodData.CN are coroutines and HTTP requests are done using aiohttp; a single event loop can thus drive
+many concurrent computations without a thread per request.
+
+The aiohttp package is an optional dependency, install it using the `async` extra: `pip install gooddata-sdk[async]`.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import itertools
+from collections import deque
+from typing import Any, AsyncGenerator, Optional, Union
+
+from gooddata_afm_client import ApiClient as AfmApiClient
+from gooddata_sdk.catalog import (
+    DEFAULT_CATALOG_CACHE_SIZE,
+    DEFAULT_CATALOG_CACHE_TTL,
+    Catalog,
+    CatalogService,
+    ValidObjects,
+    ValidObjectsInputType,
+    _create_catalog,
+    _prepare_valid_objects_query,
+    _valid_objects_by_type,
+)
+from gooddata_sdk.client import USER_AGENT, GoodDataApiClient
+from gooddata_sdk.compute import DEFAULT_TILE_CONCURRENCY, ExecutionDefinition, ExecutionResult, _stitch_tiles
+from gooddata_sdk.compute_model import Attribute, Filter, Metric, SortKey
+from gooddata_sdk.insight import Insight
+from gooddata_sdk.table import (
+    _TABLE_ROW_BATCH_SIZE,
+    _BaseExecutionTable,
+    _first_page_paging,
+    _prepare_tabular_definition,
+    _split_items,
+    _tile_limit,
+)
+from gooddata_sdk.utils import AllPagedEntities, SideLoads, TtlCache, load_json
+
+try:
+    import aiohttp
+except ImportError as e:
+    raise ImportError(
+        "The asyncio variant of GoodData SDK requires aiohttp. Install it using: pip install gooddata-sdk[async]"
+    ) from e
+
+
+class AsyncGoodDataApiClient:
+    """
+    Provides asynchronous access to GoodData.CN APIs. All requests are done using single aiohttp session whose
+    connections are reused.
+
+    The session is created when the first request is made and must be closed using `close` (or by using the client
+    as async context manager) once the client is no longer needed.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        token: str,
+        custom_headers: Optional[dict[str, str]] = None,
+        extra_user_agent: Optional[str] = None,
+        connection_pool_size: Optional[int] = None,
+        keep_alive: bool = True,
+    ) -> None:
+        """Take url, token for connecting to GoodData.CN.
+
+        `custom_headers` and `extra_user_agent` work the same way as for `GoodDataApiClient`.
+
+        `connection_pool_size` is the maximum number of concurrently open connections to the host; when not
+        specified aiohttp default is used. `keep_alive` can be used to turn off reuse of connections.
+        """
+        self._hostname = host.rstrip("/")
+        self._token = token
+        self._custom_headers = custom_headers
+        self._extra_user_agent = extra_user_agent
+        self._connection_pool_size = connection_pool_size
+        self._keep_alive = keep_alive
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        headers = {"Authorization": f"Bearer {token}"}
+        GoodDataApiClient._set_default_headers(headers)
+        headers.update(custom_headers or {})
+        headers["User-Agent"] = f"{USER_AGENT} {extra_user_agent}" if extra_user_agent is not None else USER_AGENT
+
+        self._headers = headers
+
+    @property
+    def host(self) -> str:
+        return self._hostname
+
+    def create_sync_client(self) -> GoodDataApiClient:
+        """
+        Creates synchronous client that connects to the same host with the same token and headers.
+        """
+        return GoodDataApiClient(
+            self._hostname,
+            self._token,
+            custom_headers=self._custom_headers,
+            extra_user_agent=self._extra_user_agent,
+            connection_pool_size=self._connection_pool_size,
+            keep_alive=self._keep_alive,
+        )
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # aiohttp session has to be created from within running event loop
+        if self._session is None or self._session.closed:
+            connector_args: dict[str, Any] = dict(force_close=not self._keep_alive)
+            if self._connection_pool_size is not None:
+                connector_args["limit"] = self._connection_pool_size
+
+            self._session = aiohttp.ClientSession(
+                headers=self._headers, connector=aiohttp.TCPConnector(**connector_args)
+            )
+
+        return self._session
+
+    async def get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
+        """
+        Sends GET request to the host and returns parsed JSON response.
+
+        :param path: path of the resource, starting with slash
+        :param params: optionally specify query parameters; list values are sent as comma-separated values
+        :return: parsed response body
+        """
+        async with self._get_session().get(f"{self._hostname}{path}", params=_query_params(params)) as response:
+            response.raise_for_status()
+
+            return load_json(await response.read())
+
+    async def post(self, path: str, body: Any) -> Any:
+        """
+        Sends POST request with JSON body to the host and returns parsed JSON response.
+
+        :param path: path of the resource, starting with slash
+        :param body: request body; must be JSON-serializable
+        :return: parsed response body
+        """
+        async with self._get_session().post(f"{self._hostname}{path}", json=body) as response:
+            response.raise_for_status()
+
+            return load_json(await response.read())
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> AsyncGoodDataApiClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
+def _query_params(params: Optional[dict[str, Any]]) -> Optional[dict[str, str]]:
+    if params is None:
+        return None
+
+    return {
+        key: ",".join(str(v) for v in value) if isinstance(value, list) else str(value)
+        for key, value in params.items()
+        if value is not None
+    }
+
+
+async def load_all_entities_async(
+    client: AsyncGoodDataApiClient, path: str, params: Optional[dict[str, Any]] = None, page_size: int = 500
+) -> AllPagedEntities:
+    """
+    Asynchronous counterpart of `load_all_entities`. Loads all entities from a paged resource and merges them into
+    a single 'pseudo-response' containing data and included attributes.
+
+    :param client: client to use
+    :param path: path of the paged entity collection
+    :param params: optionally specify additional query parameters such as `include`
+    :param page_size: optionally specify page length, default is 500
+    :return:
+    """
+    all_paged_entities = AllPagedEntities(data=[], included=[])
+    current_page = 0
+
+    while True:
+        result = await client.get(path, params={**(params or {}), "page": current_page, "size": page_size})
+
+        all_paged_entities.data.extend(result["data"])
+        all_paged_entities.included.extend(result.get("included", []))
+
+        if len(result["data"]) < page_size:
+            break
+
+        current_page += 1
+
+    return all_paged_entities
+
+
+class AsyncCatalogService:
+    """
+    Asynchronous variant of `CatalogService`.
+    """
+
+    def __init__(
+        self,
+        api_client: AsyncGoodDataApiClient,
+        catalog_cache_ttl: Optional[float] = DEFAULT_CATALOG_CACHE_TTL,
+        catalog_cache_size: int = DEFAULT_CATALOG_CACHE_SIZE,
+    ) -> None:
+        """
+        :param api_client: AsyncGoodDataApiClient to use
+        :param catalog_cache_ttl: see `CatalogService`
+        :param catalog_cache_size: see `CatalogService`
+        """
+        self._client = api_client
+        self._catalog_cache = TtlCache(max_size=catalog_cache_size, ttl=catalog_cache_ttl)
+        self._sync_service: Optional[CatalogService] = None
+
+    async def get_full_catalog(self, workspace_id: str, use_cache: bool = True) -> Catalog:
+        """
+        Retrieves catalog for a workspace. Datasets, attributes and metrics are loaded concurrently.
+
+        `Catalog.catalog_with_valid_objects` of the returned catalog computes valid objects using a synchronous
+        request, which blocks the event loop; use `catalog_with_valid_objects` of this service in async code.
+
+        :param workspace_id: workspace identifier
+        :param use_cache: see `CatalogService.get_full_catalog`
+        :return:
+        """
+        if use_cache:
+            catalog = self._catalog_cache.get(workspace_id)
+
+            if catalog is not None:
+                return catalog
+
+        entities_path = f"/api/entities/workspaces/{workspace_id}"
+        attributes, datasets, metrics = await asyncio.gather(
+            load_all_entities_async(self._client, f"{entities_path}/attributes", dict(include=["labels"])),
+            load_all_entities_async(self._client, f"{entities_path}/datasets", dict(include=["attributes", "facts"])),
+            load_all_entities_async(self._client, f"{entities_path}/metrics"),
+        )
+
+        valid_obj_fun = functools.partial(self._compute_valid_objects_sync, workspace_id)
+        catalog = _create_catalog(valid_obj_fun, datasets, attributes, metrics)
+        self._catalog_cache.put(workspace_id, catalog)
+
+        return catalog
+
+    async def catalog_with_valid_objects(
+        self, workspace_id: str, ctx: ValidObjectsInputType, use_cache: bool = True
+    ) -> Catalog:
+        """
+        Retrieves catalog for a workspace that contains only entities valid in the provided context. See
+        `Catalog.catalog_with_valid_objects`.
+
+        :param workspace_id: workspace identifier
+        :param ctx: existing context, see `CatalogService.compute_valid_objects`
+        :param use_cache: see `CatalogService.get_full_catalog`
+        :return:
+        """
+        catalog, valid_objects = await asyncio.gather(
+            self.get_full_catalog(workspace_id, use_cache), self.compute_valid_objects(workspace_id, ctx)
+        )
+
+        return catalog.filter_by_valid_objects(valid_objects)
+
+    def _compute_valid_objects_sync(self, workspace_id: str, ctx: ValidObjectsInputType) -> ValidObjects:
+        # catalogs are usable outside of event loop too; synchronous client is created only when needed
+        if self._sync_service is None:
+            self._sync_service = CatalogService(self._client.create_sync_client(), catalog_cache_size=0)
+
+        return self._sync_service.compute_valid_objects(workspace_id, ctx)
+
+    def invalidate_catalog_cache(self, workspace_id: Optional[str] = None) -> None:
+        """
+        See `CatalogService.invalidate_catalog_cache`.
+        """
+        self._catalog_cache.invalidate(workspace_id)
+
+    async def compute_valid_objects(self, workspace_id: str, ctx: ValidObjectsInputType) -> ValidObjects:
+        """
+        See `CatalogService.compute_valid_objects`.
+        """
+        query = AfmApiClient.sanitize_for_serialization(_prepare_valid_objects_query(ctx))
+        response = await self._client.post(
+            f"/api/actions/workspaces/{workspace_id}/execution/afm/computeValidObjects", query
+        )
+
+        return _valid_objects_by_type(response["items"])
+
+
+class AsyncInsightService:
+    """
+    Asynchronous variant of `InsightService`.
+    """
+
+    def __init__(self, api_client: AsyncGoodDataApiClient) -> None:
+        self._client = api_client
+
+    async def get_insights(self, workspace_id: str) -> list[Insight]:
+        """
+        See `InsightService.get_insights`.
+        """
+        vis_objects = await load_all_entities_async(
+            self._client, f"/api/entities/workspaces/{workspace_id}/visualizationObjects", dict(include=["ALL"])
+        )
+        side_loads = SideLoads(vis_objects.included)
+
+        return [Insight(vis_obj, side_loads) for vis_obj in vis_objects.data]
+
+    async def get_insight(self, workspace_id: str, insight_id: str) -> Insight:
+        """
+        See `InsightService.get_insight`.
+        """
+        vis_obj = await self._client.get(
+            f"/api/entities/workspaces/{workspace_id}/visualizationObjects/{insight_id}", dict(include=["ALL"])
+        )
+        side_loads = SideLoads(vis_obj.get("included", []))
+
+        return Insight(vis_obj["data"], side_loads)
+
+
+class AsyncExecutionResponse:
+    """
+    Asynchronous variant of `ExecutionResponse`.
+    """
+
+    def __init__(
+        self,
+        api_client: AsyncGoodDataApiClient,
+        workspace_id: str,
+        exec_def: ExecutionDefinition,
+        response: dict[str, Any],
+    ) -> None:
+        self._client = api_client
+        self._workspace_id = workspace_id
+        self._exec_def = exec_def
+        self._r = response["executionResponse"]
+
+    @property
+    def workspace_id(self) -> str:
+        return self._workspace_id
+
+    @property
+    def exec_def(self) -> ExecutionDefinition:
+        return self._exec_def
+
+    @property
+    def result_id(self) -> str:
+        return self._r["links"]["executionResult"]
+
+    async def read_result(
+        self, limit: Union[int, list[int]], offset: Union[None, int, list[int]] = None
+    ) -> ExecutionResult:
+        """
+        See `ExecutionResponse.read_result`.
+        """
+        _offset = offset if isinstance(offset, list) else [offset] if offset is not None else None
+        _limit = limit if isinstance(limit, list) else [limit]
+
+        # if limit is specified but offset is not, server will ignore paging completely (bug)
+        # this makes sure that offset gets defaulted to start of result
+        _offset = [0 for _ in _limit] if _offset is None else _offset
+
+        raw = await self._client.get(
+            f"/api/actions/workspaces/{self._workspace_id}/execution/afm/execute/result/{self.result_id}",
+            dict(offset=_offset, limit=_limit),
+        )
+
+        return ExecutionResult(
+            dict(
+                data=raw["data"],
+                dimension_headers=raw["dimensionHeaders"],
+                grand_totals=raw["grandTotals"],
+                paging=raw["paging"],
+            )
+        )
+
+    async def read_result_tiled(
+        self,
+        limit: list[int],
+        tile_limit: list[int],
+        offset: Optional[list[int]] = None,
+        max_concurrency: int = DEFAULT_TILE_CONCURRENCY,
+    ) -> ExecutionResult:
+        """
+        See `ExecutionResponse.read_result_tiled`.
+        """
+        _offset = offset if offset is not None else [0 for _ in limit]
+        first_tile = await self.read_result(offset=_offset, limit=[min(lim, t) for lim, t in zip(limit, tile_limit)])
+
+        starts = [
+            list(range(start, max(min(start + lim, total), start + 1), t))
+            for start, lim, total, t in zip(_offset, limit, first_tile.paging_total, tile_limit)
+        ]
+        tile_offsets = [list(tile_offset) for tile_offset in itertools.product(*starts)]
+
+        if len(tile_offsets) == 1:
+            return first_tile
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _read_tile(tile_offset: list[int]) -> ExecutionResult:
+            tile_end = [min(o + lim, s + t) for o, lim, s, t in zip(_offset, limit, tile_offset, tile_limit)]
+            async with semaphore:
+                return await self.read_result(offset=tile_offset, limit=[e - s for e, s in zip(tile_end, tile_offset)])
+
+        tiles = await asyncio.gather(*[_read_tile(tile_offset) for tile_offset in tile_offsets[1:]])
+
+        return _stitch_tiles([first_tile] + list(tiles), [len(dim_starts) for dim_starts in starts])
+
+    async def read_page(self, offset: list[int], limit: list[int]) -> ExecutionResult:
+        """
+        Reads page of a table; metrics of pages with more metrics than can be read at once are read in tiles.
+        """
+        tile_limit = _tile_limit(self._exec_def, limit)
+
+        if any(lim > t for lim, t in zip(limit, tile_limit)):
+            return await self.read_result_tiled(offset=offset, limit=limit, tile_limit=tile_limit)
+
+        return await self.read_result(offset=offset, limit=limit)
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return f"AsyncExecutionResponse(workspace_id={self.workspace_id}, result_id={self.result_id})"
+
+
+class AsyncComputeService:
+    """
+    Asynchronous variant of `ComputeService`.
+    """
+
+    def __init__(self, api_client: AsyncGoodDataApiClient) -> None:
+        self._client = api_client
+
+    async def for_exec_def(self, workspace_id: str, exec_def: ExecutionDefinition) -> AsyncExecutionResponse:
+        """
+        See `ComputeService.for_exec_def`.
+        """
+        body = AfmApiClient.sanitize_for_serialization(exec_def.as_api_model())
+        response = await self._client.post(f"/api/actions/workspaces/{workspace_id}/execution/afm/execute", body)
+
+        return AsyncExecutionResponse(self._client, workspace_id=workspace_id, exec_def=exec_def, response=response)
+
+
+class AsyncExecutionTable(_BaseExecutionTable):
+    """
+    Asynchronous variant of `ExecutionTable`; rows and column batches are yielded by async generators.
+    """
+
+    def __init__(self, response: AsyncExecutionResponse, first_page: ExecutionResult) -> None:
+        super(AsyncExecutionTable, self).__init__(response.exec_def, first_page)
+        self._response = response
+
+    async def _read_remaining_pages(
+        self, last_loaded: ExecutionResult, prefetch_pages: int
+    ) -> AsyncGenerator[ExecutionResult, None]:
+        remaining = [
+            self._next_page_paging(last_loaded, start)
+            for start in range(last_loaded.next_page_start(), last_loaded.paging_total[0], _TABLE_ROW_BATCH_SIZE)
+        ]
+        in_flight: deque = deque()
+
+        def _schedule_next() -> None:
+            if remaining:
+                offset, limit = remaining.pop(0)
+                in_flight.append(asyncio.ensure_future(self._response.read_page(offset=offset, limit=limit)))
+
+        try:
+            # without prefetch, the next page is requested only once the previous one is consumed
+            for _ in range(max(prefetch_pages, 1)):
+                _schedule_next()
+
+            while in_flight:
+                page = await in_flight.popleft()
+                if prefetch_pages > 0:
+                    _schedule_next()
+
+                yield page
+
+                if prefetch_pages <= 0:
+                    _schedule_next()
+        finally:
+            # reading may be abandoned half-way; do not wait for pages nobody needs
+            for task in in_flight:
+                task.cancel()
+
+    async def _read_pages(self, prefetch_pages: int, replayable: bool) -> AsyncGenerator[ExecutionResult, None]:
+        loaded = list(self._pages) if replayable else [self._first_page]
+        for page in loaded:
+            yield page
+
+        async for page in self._read_remaining_pages(loaded[-1], prefetch_pages):
+            if replayable:
+                self._pages.append(page)
+
+            yield page
+
+    async def read_all(self, prefetch_pages: int = 0, replayable: bool = False) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Async generator yielding execution result as rows. See `ExecutionTable.read_all`; with `prefetch_pages`
+        the pages are read ahead concurrently on the event loop.
+        """
+        if not self._exec_def.has_attributes():
+            for row in self._read_all_metrics_in_one_row():
+                yield row
+
+            return
+
+        async for page in self._read_pages(prefetch_pages, replayable):
+            for row in self._read_page_rows(page):
+                yield row
+
+    async def read_all_columns(
+        self, prefetch_pages: int = 0, replayable: bool = False
+    ) -> AsyncGenerator[dict[str, list[Any]], None]:
+        """
+        Async generator yielding execution result in columnar fashion, one batch per page. See
+        `ExecutionTable.read_all_columns`.
+        """
+        if not self._exec_def.has_attributes():
+            for batch in self._read_all_metrics_in_one_batch():
+                yield batch
+
+            return
+
+        cols = self.column_ids
+
+        async for page in self._read_pages(prefetch_pages, replayable):
+            yield dict(zip(cols, self._read_page_columns(page)))
+
+    def __repr__(self) -> str:
+        return f"AsyncExecutionTable(response={self._response}, columns={self.column_ids}, rows={len(self)})"
+
+
+async def _as_table(response: AsyncExecutionResponse) -> AsyncExecutionTable:
+    first_page_offset, first_page_limit = _first_page_paging(response.exec_def)
+    first_page = await response.read_page(offset=first_page_offset, limit=first_page_limit)
+
+    return AsyncExecutionTable(response=response, first_page=first_page)
+
+
+class AsyncTableService:
+    """
+    Asynchronous variant of `TableService`.
+    """
+
+    def __init__(self, api_client: AsyncGoodDataApiClient) -> None:
+        self._compute = AsyncComputeService(api_client)
+
+    async def for_insight(self, workspace_id: str, insight: Insight) -> AsyncExecutionTable:
+        exec_def = _prepare_tabular_definition(
+            attributes=[a.as_computable() for a in insight.attributes],
+            metrics=[m.as_computable() for m in insight.metrics],
+            filters=[cf for cf in [f.as_computable() for f in insight.filters] if not cf.is_noop()],
+        )
+
+        response = await self._compute.for_exec_def(workspace_id=workspace_id, exec_def=exec_def)
+
+        return await _as_table(response)
+
+    async def for_items(
+        self,
+        workspace_id: str,
+        items: list[Union[Attribute, Metric]],
+        filters: Optional[list[Filter]] = None,
+        sorts: Optional[list[SortKey]] = None,
+    ) -> AsyncExecutionTable:
+        attributes, metrics = _split_items(items)
+        exec_def = _prepare_tabular_definition(
+            attributes=attributes, metrics=metrics, filters=filters or [], sorts=sorts
+        )
+        response = await self._compute.for_exec_def(workspace_id=workspace_id, exec_def=exec_def)
+
+        return await _as_table(response)
+
+
+class AsyncGoodDataSdk:
+    """Asynchronous variant of `GoodDataSdk`. Close it using `close` or use it as async context manager."""
+
+    @classmethod
+    def create(
+        cls,
+        host_: str,
+        token_: str,
+        extra_user_agent_: Optional[str] = None,
+        connection_pool_size_: Optional[int] = None,
+        keep_alive_: bool = True,
+        **custom_headers_: Optional[str],
+    ) -> AsyncGoodDataSdk:
+        """
+        Create AsyncGoodDataApiClient and return new AsyncGoodDataSdk instance. See `GoodDataSdk.create`.
+        """
+        filtered_headers = {key: value for key, value in custom_headers_.items() if value is not None}
+        client = AsyncGoodDataApiClient(
+            host_,
+            token_,
+            custom_headers=filtered_headers,
+            extra_user_agent=extra_user_agent_,
+            connection_pool_size=connection_pool_size_,
+            keep_alive=keep_alive_,
+        )
+        return cls(client)
+
+    def __init__(
+        self,
+        client: AsyncGoodDataApiClient,
+        catalog_cache_ttl: Optional[float] = DEFAULT_CATALOG_CACHE_TTL,
+        catalog_cache_size: int = DEFAULT_CATALOG_CACHE_SIZE,
+    ) -> None:
+        self._client = client
+
+        self._catalog = AsyncCatalogService(
+            self._client, catalog_cache_ttl=catalog_cache_ttl, catalog_cache_size=catalog_cache_size
+        )
+        self._compute = AsyncComputeService(self._client)
+        self._insights = AsyncInsightService(self._client)
+        self._tables = AsyncTableService(self._client)
+
+    @property
+    def catalog(self) -> AsyncCatalogService:
+        return self._catalog
+
+    @property
+    def compute(self) -> AsyncComputeService:
+        return self._compute
+
+    @property
+    def insights(self) -> AsyncInsightService:
+        return self._insights
+
+    @property
+    def tables(self) -> AsyncTableService:
+        return self._tables
+
+    @property
+    def client(self) -> AsyncGoodDataApiClient:
+        return self._client
+
+    async def close(self) -> None:
+        await self._client.close()
+
+    async def __aenter__(self) -> AsyncGoodDataSdk:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
@@ -2,6 +2,13 @@
 from __future__ import annotations
 
 import functools
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Union, cast
 
 import gooddata_afm_client.apis as afm_apis
@@ -10,11 +17,56 @@ import gooddata_metadata_client.apis as metadata_apis
 from gooddata_sdk.client import GoodDataApiClient
 from gooddata_sdk.compute import ExecutionDefinition
 from gooddata_sdk.compute_model import Attribute, Filter, Metric, ObjId, SimpleMetric, compute_model_to_api_model
-from gooddata_sdk.utils import AllPagedEntities, IdObjType, SideLoads, id_obj_to_key, load_all_entities
+from gooddata_sdk.utils import (
+    AllPagedEntities,
+    IdObjType,
+    SideLoads,
+    TtlCache,
+    id_obj_to_key,
+    load_all_entities,
+    load_json,
+)
 
 # Use typing collection types to support python < py3.9
 ValidObjects = Dict[str, Set[str]]
 
+DEFAULT_CATALOG_CACHE_TTL = 300.0
+"""
+Number of seconds for which the workspace catalog loaded by CatalogService is cached by default.
+"""
+
+DEFAULT_CATALOG_CACHE_SIZE = 16
+"""
+Maximum number of workspace catalogs cached by CatalogService by default.
+"""
+
+DEFAULT_CATALOG_LOAD_WORKERS = 3
+"""
+Number of threads that CatalogService uses to load workspace catalog by default. Datasets, attributes and metrics
+are loaded concurrently and pages of large collections are requested ahead. Set to 1 to load everything sequentially.
+"""
+
+_CATALOG_PARALLEL_PAGES = 4
+"""
+Maximum number of pages of each entity type that are requested concurrently when loading large catalogs. All
+concurrent requests share the connection pool of the API client; fewer pages are requested ahead when the pool
+is smaller than needed.
+"""
+
+CATALOG_SNAPSHOT_VERSION = 1
+"""
+Version of the catalog snapshot format. Snapshots with different version are ignored and loaded again.
+"""
+
+
+def _obj_id_str(obj_id: Union[str, ObjId], obj_type: str) -> str:
+    if isinstance(obj_id, ObjId):
+        return str(obj_id)
+    elif not obj_id.startswith(f"{obj_type}/"):
+        return f"{obj_type}/{obj_id}"
+
+    return obj_id
+
 
 class CatalogEntry:
     @property
@@ -246,6 +298,7 @@ class CatalogDataset(CatalogEntry):
         self._attributes = attributes
         self._facts = facts
         self._obj_id = ObjId(self._dataset["id"], self._dataset["type"])
+        self._label_attribute_idx = {str(label.obj_id): attr for attr in attributes for label in attr.labels}
 
         for attr in self.attributes:
             attr.dataset = self
@@ -283,11 +336,7 @@ class CatalogDataset(CatalogEntry):
         return self._facts
 
     def find_label_attribute(self, id_obj: IdObjType) -> Union[CatalogAttribute, None]:
-        for attr in self._attributes:
-            if attr.find_label(id_obj) is not None:
-                return attr
-
-        return None
+        return self._label_attribute_idx.get(id_obj_to_key(id_obj))
 
     def filter_dataset(self, valid_objects: ValidObjects) -> Union[CatalogDataset, None]:
         """
@@ -331,6 +380,14 @@ class Catalog:
         self._metrics = metrics
         self._metric_idx = dict([(str(m.obj_id), m) for m in metrics])
         self._datasets_idx = dict([(str(d.obj_id), d) for d in datasets])
+        self._attributes_idx = dict([(str(a.obj_id), a) for d in datasets for a in d.attributes])
+        self._facts_idx = dict([(str(f.obj_id), f) for d in datasets for f in d.facts])
+        self._labels_idx = dict(
+            [(str(label.obj_id), label) for a in self._attributes_idx.values() for label in a.labels]
+        )
+        self._label_attribute_idx = dict(
+            [(str(label.obj_id), a) for a in self._attributes_idx.values() for label in a.labels]
+        )
 
     @property
     def datasets(self) -> list[CatalogDataset]:
@@ -351,14 +408,7 @@ class Catalog:
 
         :rtype CatalogMetric
         """
-        if isinstance(metric_id, ObjId):
-            obj_id_str = str(metric_id)
-        elif not metric_id.startswith("metric/"):
-            obj_id_str = f"metric/{metric_id}"
-        else:
-            obj_id_str = metric_id
-
-        return self._metric_idx[obj_id_str] if obj_id_str in self._metric_idx else None
+        return self._metric_idx.get(_obj_id_str(metric_id, "metric"))
 
     def get_dataset(self, dataset_id: Union[str, ObjId]) -> Union[CatalogDataset, None]:
         """
@@ -371,24 +421,50 @@ class Catalog:
 
         :rtype CatalogDataset
         """
-        if isinstance(dataset_id, ObjId):
-            obj_id_str = str(dataset_id)
-        elif not dataset_id.startswith("dataset/"):
-            obj_id_str = f"dataset/{dataset_id}"
-        else:
-            obj_id_str = dataset_id
+        return self._datasets_idx.get(_obj_id_str(dataset_id, "dataset"))
 
-        return self._datasets_idx[obj_id_str] if obj_id_str in self._datasets_idx else None
+    def get_attribute(self, attribute_id: Union[str, ObjId]) -> Union[CatalogAttribute, None]:
+        """
+        Gets attribute by id. The id can be either an instance of ObjId or string containing serialized ObjId
+        ('attribute/some.attribute.id') or contain just the id part ('some.attribute.id').
 
-    def find_label_attribute(self, id_obj: IdObjType) -> Union[CatalogAttribute, None]:
-        """Get attribute by label id."""
-        for dataset in self._datasets:
-            res = dataset.find_label_attribute(id_obj)
+        :param attribute_id: fully qualified attribute entity id (type/id) or just the identifier of attribute entity
+
+        :return: instance of CatalogAttribute or None if no such attribute in catalog
+
+        :rtype CatalogAttribute
+        """
+        return self._attributes_idx.get(_obj_id_str(attribute_id, "attribute"))
+
+    def get_fact(self, fact_id: Union[str, ObjId]) -> Union[CatalogFact, None]:
+        """
+        Gets fact by id. The id can be either an instance of ObjId or string containing serialized ObjId
+        ('fact/some.fact.id') or contain just the id part ('some.fact.id').
+
+        :param fact_id: fully qualified fact entity id (type/id) or just the identifier of fact entity
+
+        :return: instance of CatalogFact or None if no such fact in catalog
+
+        :rtype CatalogFact
+        """
+        return self._facts_idx.get(_obj_id_str(fact_id, "fact"))
+
+    def get_label(self, label_id: Union[str, ObjId]) -> Union[CatalogLabel, None]:
+        """
+        Gets label by id. The id can be either an instance of ObjId or string containing serialized ObjId
+        ('label/some.label.id') or contain just the id part ('some.label.id').
+
+        :param label_id: fully qualified label entity id (type/id) or just the identifier of label entity
 
-            if res is not None:
-                return res
+        :return: instance of CatalogLabel or None if no such label in catalog
 
-        return None
+        :rtype CatalogLabel
+        """
+        return self._labels_idx.get(_obj_id_str(label_id, "label"))
+
+    def find_label_attribute(self, id_obj: IdObjType) -> Union[CatalogAttribute, None]:
+        """Get attribute by label id."""
+        return self._label_attribute_idx.get(id_obj_to_key(id_obj))
 
     def _valid_objects(self, ctx: ValidObjectsInputType) -> ValidObjects:
         return self._valid_obf_fun(ctx)
@@ -406,8 +482,17 @@ class Catalog:
 
         :return:
         """
-        valid_objects = self._valid_objects(ctx)
+        return self.filter_by_valid_objects(self._valid_objects(ctx))
+
+    def filter_by_valid_objects(self, valid_objects: ValidObjects) -> Catalog:
+        """
+        Returns a new instance of catalog which contains only those datasets (attributes and facts) and metrics that
+        are part of the provided valid objects structure.
 
+        :param valid_objects: mapping of object type to a set of valid object ids, as returned by
+            `CatalogService.compute_valid_objects`
+        :return:
+        """
         new_datasets = list(filter(None, [d.filter_dataset(valid_objects) for d in self.datasets]))
         new_metrics = [m for m in self.metrics if m.id in valid_objects[m.type]]
 
@@ -417,6 +502,59 @@ class Catalog:
             metrics=new_metrics,
         )
 
+    def as_snapshot(self) -> dict[str, Any]:
+        """
+        Returns JSON-serializable snapshot of the catalog. The snapshot contains entities as they were received
+        from the metadata API; catalog can be restored from it using `Catalog.from_snapshot`.
+
+        :return: dict with catalog snapshot
+        """
+        return dict(
+            version=CATALOG_SNAPSHOT_VERSION,
+            datasets=[
+                dict(
+                    dataset=dataset._dataset,
+                    attributes=[
+                        dict(attribute=attr._attribute, labels=[label._label for label in attr.labels])
+                        for attr in dataset.attributes
+                    ],
+                    facts=[fact._fact for fact in dataset.facts],
+                )
+                for dataset in self.datasets
+            ],
+            metrics=[metric._metric for metric in self.metrics],
+        )
+
+    @classmethod
+    def from_snapshot(cls, valid_obj_fun: functools.partial[dict[str, set[str]]], snapshot: dict[str, Any]) -> Catalog:
+        """
+        Restores catalog from snapshot created using `as_snapshot`.
+
+        :param valid_obj_fun: function to compute valid objects in the catalog's workspace
+        :param snapshot: catalog snapshot
+        :return: restored catalog
+        """
+        if snapshot.get("version") != CATALOG_SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported catalog snapshot version {snapshot.get('version')}")
+
+        datasets = [
+            CatalogDataset(
+                dataset["dataset"],
+                [
+                    CatalogAttribute(attr["attribute"], [CatalogLabel(label) for label in attr["labels"]])
+                    for attr in dataset["attributes"]
+                ],
+                [CatalogFact(fact) for fact in dataset["facts"]],
+            )
+            for dataset in snapshot["datasets"]
+        ]
+
+        return cls(
+            valid_obj_fun,
+            datasets=datasets,
+            metrics=[CatalogMetric(metric) for metric in snapshot["metrics"]],
+        )
+
     def __str__(self) -> str:
         return self.__repr__()
 
@@ -501,6 +639,33 @@ def _prepare_afm_for_availability(items: list[ValidObjectTypes]) -> afm_models.A
     return compute_model_to_api_model(attributes=attributes, metrics=metrics, filters=filters)
 
 
+def _prepare_valid_objects_query(ctx: ValidObjectsInputType) -> afm_models.AfmValidObjectsQuery:
+    if isinstance(ctx, ExecutionDefinition):
+        afm = compute_model_to_api_model(attributes=ctx.attributes, metrics=ctx.metrics, filters=ctx.filters)
+    else:
+        _ctx = ctx if isinstance(ctx, list) else [ctx]
+        afm = _prepare_afm_for_availability(_ctx)
+
+    return afm_models.AfmValidObjectsQuery(afm=afm, types=["facts", "attributes", "measures"])
+
+
+def _valid_objects_by_type(items: list[Any]) -> ValidObjects:
+    by_type: dict[str, set[str]] = dict()
+
+    for available in items:
+        _type = available["type"]
+
+        if _type not in by_type:
+            items_of_type: set[str] = set()
+            by_type[_type] = items_of_type
+        else:
+            items_of_type = by_type[_type]
+
+        items_of_type.add(available["id"])
+
+    return by_type
+
+
 class CatalogService:
     # Note on the disabled checking:
     # generated client has issues parsing the vis objects; .. have to avoid return type checks
@@ -508,18 +673,161 @@ class CatalogService:
     # note: the parsing is done lazily so it does not necessarily bomb on the next line but when trying to
     #  access returned object's properties
 
-    def __init__(self, api_client: GoodDataApiClient) -> None:
+    def __init__(
+        self,
+        api_client: GoodDataApiClient,
+        catalog_cache_ttl: Optional[float] = DEFAULT_CATALOG_CACHE_TTL,
+        catalog_cache_size: int = DEFAULT_CATALOG_CACHE_SIZE,
+        catalog_load_workers: Optional[int] = None,
+    ) -> None:
+        """
+        :param api_client: GoodDataApiClient to use
+        :param catalog_cache_ttl: optionally specify number of seconds for which a loaded workspace catalog is
+            cached; None = cached catalogs never expire
+        :param catalog_cache_size: optionally specify maximum number of cached workspace catalogs; least recently
+            used catalog is evicted when the limit is reached; 0 = do not cache catalogs at all
+        :param catalog_load_workers: optionally specify number of threads used to load workspace catalog;
+            None = use DEFAULT_CATALOG_LOAD_WORKERS, 1 = load catalog sequentially
+        """
         self._client = api_client
         self._api = metadata_apis.WorkspaceObjectControllerApi(api_client.metadata_client)
         self._valid_objects = afm_apis.ValidObjectsControllerApi(api_client.afm_client)
+        self._catalog_cache = TtlCache(max_size=catalog_cache_size, ttl=catalog_cache_ttl)
+        self._catalog_load_workers = catalog_load_workers
 
-    def get_full_catalog(self, workspace_id: str) -> Catalog:
+    def get_full_catalog(
+        self, workspace_id: str, use_cache: bool = True, cache_dir: Optional[Union[str, Path]] = None
+    ) -> Catalog:
         """
         Retrieves catalog for a workspace. Catalog contains all data sets and metrics defined in that workspace.
 
+        The catalog is cached; subsequent calls for the same workspace return the cached catalog until it expires
+        or is invalidated using `invalidate_catalog_cache`.
+
+        When `cache_dir` is specified, the catalog is additionally stored as a snapshot file in that directory, so
+        that other processes can load it without talking to the server. The snapshot is used as long as it is
+        not older than the catalog cache TTL.
+
         :param workspace_id: workspace identifier
+        :param use_cache: optionally bypass the cache and load fresh catalog from the server; the cache is
+            updated with the fresh catalog
+        :param cache_dir: optionally specify directory where to keep catalog snapshots
         :return:
         """
+        if use_cache:
+            catalog = self._catalog_cache.get(workspace_id)
+
+            if catalog is not None:
+                return catalog
+
+            if cache_dir is not None:
+                catalog = self._read_catalog_snapshot(workspace_id, Path(cache_dir))
+
+                if catalog is not None:
+                    self._catalog_cache.put(workspace_id, catalog)
+                    return catalog
+
+        catalog = self._load_full_catalog(workspace_id)
+        self._catalog_cache.put(workspace_id, catalog)
+
+        if cache_dir is not None:
+            self._write_catalog_snapshot(workspace_id, Path(cache_dir), catalog)
+
+        return catalog
+
+    def invalidate_catalog_cache(
+        self, workspace_id: Optional[str] = None, cache_dir: Optional[Union[str, Path]] = None
+    ) -> None:
+        """
+        Drops cached catalog so that it is loaded from the server next time it is requested. Use this when
+        the workspace's semantic model changed.
+
+        :param workspace_id: workspace identifier; if not specified, catalogs of all workspaces are dropped
+        :param cache_dir: optionally specify directory with catalog snapshots; snapshots of the dropped catalogs
+            are removed from it as well
+        """
+        self._catalog_cache.invalidate(workspace_id)
+
+        if cache_dir is None:
+            return
+
+        if workspace_id is not None:
+            snapshots = [self._catalog_snapshot_path(workspace_id, Path(cache_dir))]
+        else:
+            snapshots = list(Path(cache_dir).glob("catalog-*.json"))
+
+        for snapshot in snapshots:
+            try:
+                snapshot.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _catalog_snapshot_path(self, workspace_id: str, cache_dir: Path) -> Path:
+        # snapshots of different hosts may share directory; file name must not contain anything unsafe
+        key = hashlib.sha256(f"{self._client.host}|{workspace_id}".encode("utf-8")).hexdigest()
+
+        return cache_dir / f"catalog-{key[:32]}.json"
+
+    def _read_catalog_snapshot(self, workspace_id: str, cache_dir: Path) -> Optional[Catalog]:
+        path = self._catalog_snapshot_path(workspace_id, cache_dir)
+
+        try:
+            ttl = self._catalog_cache.ttl
+            if ttl is not None and time.time() - path.stat().st_mtime > ttl:
+                return None
+
+            snapshot = load_json(path.read_bytes())
+            if snapshot.get("host") != self._client.host or snapshot.get("workspace_id") != workspace_id:
+                return None
+
+            valid_obj_fun = functools.partial(self.compute_valid_objects, workspace_id)
+
+            return Catalog.from_snapshot(valid_obj_fun, snapshot["catalog"])
+        except (OSError, ValueError, KeyError, TypeError):
+            # missing, unreadable or incompatible snapshot; catalog will be loaded from the server
+            return None
+
+    def _write_catalog_snapshot(self, workspace_id: str, cache_dir: Path, catalog: Catalog) -> None:
+        snapshot = dict(host=self._client.host, workspace_id=workspace_id, catalog=catalog.as_snapshot())
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # write to temporary file first so that concurrent readers never see partially written snapshot
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".catalog-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f, separators=(",", ":"))
+
+                os.replace(tmp_path, self._catalog_snapshot_path(workspace_id, cache_dir))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            # snapshot is just an optimization, failure to write it must not fail loading of the catalog
+            pass
+
+    def _catalog_load_concurrency(self) -> tuple[int, int]:
+        """
+        :return: number of entity types loaded concurrently and number of pages of each type requested concurrently;
+            together they never need more connections than there are in the connection pool
+        """
+        workers = self._catalog_load_workers
+        if workers is None:
+            workers = DEFAULT_CATALOG_LOAD_WORKERS
+
+        # there are just three entity types to load concurrently
+        pool_size = self._client.connection_pool_size
+        workers = max(1, min(workers, 3, pool_size))
+        if workers == 1:
+            return 1, 0
+
+        parallel_pages = min(_CATALOG_PARALLEL_PAGES, pool_size // workers)
+
+        # requesting single page ahead is the same as requesting pages one-by-one
+        return workers, parallel_pages if parallel_pages > 1 else 0
+
+    def _load_full_catalog(self, workspace_id: str) -> Catalog:
         get_datasets = functools.partial(
             self._api.get_all_entities_datasets,
             workspace_id,
@@ -536,9 +844,23 @@ class CatalogService:
 
         get_metrics = functools.partial(self._api.get_all_entities_metrics, workspace_id, _check_return_type=False)
 
-        attributes = load_all_entities(get_attributes)
-        datasets = load_all_entities(get_datasets)
-        metrics = load_all_entities(get_metrics)
+        workers, parallel_pages = self._catalog_load_concurrency()
+
+        if workers <= 1:
+            attributes = load_all_entities(get_attributes)
+            datasets = load_all_entities(get_datasets)
+            metrics = load_all_entities(get_metrics)
+        else:
+            # attributes, datasets and metrics are independent collections; load them concurrently
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gooddata-catalog") as pool:
+                load = functools.partial(load_all_entities, parallel_pages=parallel_pages)
+                attributes_future = pool.submit(load, get_attributes)
+                datasets_future = pool.submit(load, get_datasets)
+                metrics_future = pool.submit(load, get_metrics)
+
+                attributes = attributes_future.result()
+                datasets = datasets_future.result()
+                metrics = metrics_future.result()
 
         valid_obj_fun = functools.partial(self.compute_valid_objects, workspace_id)
 
@@ -560,26 +882,7 @@ class CatalogService:
         :return: a dict of sets; type of available object is used as key in the dict,
             the value is a set containing id's of available items
         """
-        if isinstance(ctx, ExecutionDefinition):
-            afm = compute_model_to_api_model(attributes=ctx.attributes, metrics=ctx.metrics, filters=ctx.filters)
-        else:
-            _ctx = ctx if isinstance(ctx, list) else [ctx]
-            afm = _prepare_afm_for_availability(_ctx)
-
-        query = afm_models.AfmValidObjectsQuery(afm=afm, types=["facts", "attributes", "measures"])
+        query = _prepare_valid_objects_query(ctx)
         response = self._valid_objects.compute_valid_objects(workspace_id=workspace_id, afm_valid_objects_query=query)
 
-        by_type: dict[str, set[str]] = dict()
-
-        for available in response.items:
-            _type = available["type"]
-
-            if _type not in by_type:
-                items_of_type: set[str] = set()
-                by_type[_type] = items_of_type
-            else:
-                items_of_type = by_type[_type]
-
-            items_of_type.add(available["id"])
-
-        return by_type
+        return _valid_objects_by_type(response.items)
@@ -5,7 +5,17 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import functools
+import random
+import socket
+import threading
+import time
+from typing import Any, Callable, Collection, List, Optional, Tuple, Union
+
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import HTTPError
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 
 import gooddata_afm_client as afm_client
 import gooddata_metadata_client as metadata_client
@@ -14,6 +24,186 @@ from gooddata_sdk import __version__
 
 USER_AGENT = f"gooddata-python-sdk/{__version__}"
 
+# Use typing collection types to support python < py3.9
+SocketOptions = List[Tuple[int, int, Any]]
+
+DEFAULT_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+"""
+HTTP statuses of responses that are retried by default: throttling and transient server-side failures.
+"""
+
+DEFAULT_RETRY_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "POST", "PUT", "TRACE")
+"""
+HTTP methods of requests that are retried by default. Unlike urllib3 defaults, POST is included - the SDK uses POST
+to start executions and to query valid objects, both of which are safe to repeat.
+"""
+
+
+class RetryPolicy:
+    """
+    Prescribes how requests that failed due to connection errors or transient server-side errors are retried.
+
+    The retries are delayed using exponential backoff: n-th retry waits `backoff_factor * 2 ** (n - 1)` seconds,
+    at most `backoff_max` seconds. To avoid many clients retrying at the same moment, up to `jitter` fraction of the
+    delay is randomized. If the server responds with Retry-After header, the retry waits for the time requested by
+    the server instead.
+
+    When all retries are exhausted, the error of the last attempt is raised as if there was no retry policy.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: float = 0.5,
+        status_codes: Collection[int] = DEFAULT_RETRY_STATUS_CODES,
+        methods: Collection[str] = DEFAULT_RETRY_METHODS,
+    ) -> None:
+        """
+        :param max_retries: maximum number of retries of single request
+        :param backoff_factor: base of the exponential backoff in seconds
+        :param backoff_max: maximum delay between retries in seconds
+        :param jitter: fraction of the delay that is randomized; 0 = no randomization
+        :param status_codes: HTTP statuses of responses that are retried
+        :param methods: HTTP methods of requests that are retried
+        """
+        if not 0 <= jitter <= 1:
+            raise ValueError(f"Retry jitter must be between 0 and 1, got {jitter}")
+
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.status_codes = status_codes
+        self.methods = methods
+
+    def as_urllib3_retry(self) -> Retry:
+        return _JitteredRetry(
+            total=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=self.status_codes,
+            allowed_methods=self.methods,
+            # the last response is handed over to the API client which raises the usual exception for it
+            raise_on_status=False,
+            respect_retry_after_header=True,
+        ).with_jitter(self.backoff_max, self.jitter)
+
+
+class _JitteredRetry(Retry):
+    _backoff_cap: float = float("inf")
+    _jitter: float = 0.0
+
+    def with_jitter(self, backoff_cap: float, jitter: float) -> _JitteredRetry:
+        self._backoff_cap = backoff_cap
+        self._jitter = jitter
+
+        return self
+
+    def new(self, **kw: Any) -> _JitteredRetry:
+        # urllib3 creates new instance after each attempt, the extra settings must be carried over
+        return super().new(**kw).with_jitter(self._backoff_cap, self._jitter)
+
+    def get_backoff_time(self) -> float:
+        backoff = min(super().get_backoff_time(), self._backoff_cap)
+
+        return backoff * (1 - self._jitter * random.random())
+
+
+class CircuitBreakerOpenError(Exception):
+    """
+    Raised instead of sending a request while the circuit breaker is open because the server keeps failing.
+    """
+
+
+class CircuitBreaker:
+    """
+    Stops sending requests to a server that keeps failing so that callers fail fast instead of waiting for requests
+    that are bound to fail.
+
+    The breaker opens after `failure_threshold` consecutive requests fail with connection errors or server-side
+    errors (5xx) - after retries, if there is a retry policy. While open, requests fail immediately with
+    CircuitBreakerOpenError. After `reset_timeout` seconds, single trial request is let through: the breaker closes
+    if it succeeds and opens again if it fails.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        """
+        :param failure_threshold: number of consecutive failures after which the breaker opens
+        :param reset_timeout: number of seconds after which open breaker lets a trial request through
+        """
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._opened_at is not None
+
+    def before_request(self) -> None:
+        """
+        Checks whether request may be sent.
+
+        :raises CircuitBreakerOpenError: when the breaker is open
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+
+            if self._trial_in_flight or time.monotonic() - self._opened_at < self._reset_timeout:
+                raise CircuitBreakerOpenError(
+                    f"Requests are not sent because the last {self._failures} requests to the server failed."
+                )
+
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+
+            if self._opened_at is not None or self._failures >= self._failure_threshold:
+                self._opened_at = time.monotonic()
+
+    def wrap(self, request: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wraps function that sends request using the generated REST clients so that it is guarded by the breaker.
+        """
+
+        @functools.wraps(request)
+        def _request(*args: Any, **kwargs: Any) -> Any:
+            self.before_request()
+
+            try:
+                response = request(*args, **kwargs)
+            except HTTPError:
+                self.record_failure()
+                raise
+            except Exception as e:
+                # generated clients raise their own ApiException types; status 0 means the request was not sent
+                status = getattr(e, "status", None)
+                if status is not None and (status == 0 or status >= 500):
+                    self.record_failure()
+                else:
+                    self.record_success()
+                raise
+
+            self.record_success()
+
+            return response
+
+        return _request
+
 
 class GoodDataApiClient:
     """Provide access to metadata and afm services."""
@@ -24,6 +214,13 @@ class GoodDataApiClient:
         token: str,
         custom_headers: Optional[dict[str, str]] = None,
         extra_user_agent: Optional[str] = None,
+        connection_pool_size: Optional[int] = None,
+        keep_alive: bool = True,
+        socket_options: Optional[SocketOptions] = None,
+        compression: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        http2: bool = False,
     ) -> None:
         """Take url, token for connecting to GoodData.CN.
 
@@ -32,51 +229,138 @@ class GoodDataApiClient:
 
         `extra_user_agent` is optional string to be added to default http User-Agent
         header. This takes precedence over custom_headers setting.
+
+        All API clients share single pool of HTTP connections. `connection_pool_size` is the maximum number
+        of connections to the host that are kept open for reuse; it should be at least the number of threads
+        that use the client concurrently. When not specified, the default of the generated clients is used.
+
+        `keep_alive` turns on TCP keep-alive on the connections so that idle pooled connections are not
+        silently dropped by firewalls and proxies. `socket_options` are additional options set on each
+        socket, as (level, option, value) tuples.
+
+        `compression` turns on compression of the responses: the server is asked to compress the responses using
+        any of the encodings that the installed urllib3 can decode (gzip and deflate; brotli and zstd when the
+        respective packages are installed). The responses are decompressed transparently as they are read.
+        Execution results are repetitive JSON documents and compress very well, which saves bandwidth at the cost
+        of some CPU time on both sides.
+
+        `retry_policy` prescribes retrying of requests that failed with transient errors, see `RetryPolicy`. When not
+        specified, urllib3 defaults are used: failed connections are retried, error responses are not.
+        `circuit_breaker` makes the requests fail fast while the server is down, see `CircuitBreaker`.
+
+        `http2` sends the requests over HTTP/2 using httpx instead of urllib3, see `gooddata_sdk.http2`. Concurrent
+        requests, such as parallel reads of result pages, are then multiplexed on a single connection. Install the
+        SDK with the `http2` extra to use it.
         """
         self._hostname = host
         self._token = token
         self._custom_headers = custom_headers or {}
+        self._connection_pool_size = connection_pool_size
+        self._socket_options = self._create_socket_options(keep_alive, socket_options)
+        self._retry_policy = retry_policy
+        self._circuit_breaker = circuit_breaker
 
         user_agent = f"{USER_AGENT} {extra_user_agent}" if extra_user_agent is not None else USER_AGENT
 
         self._metadata_config = metadata_client.Configuration(host=host)
+        self._set_connection_options(self._metadata_config)
         self._metadata_client = metadata_client.ApiClient(
             configuration=self._metadata_config,
             header_name="Authorization",
             header_value=f"Bearer {token}",
         )
-        self._set_default_headers(self._metadata_client.default_headers)
+        self._set_default_headers(self._metadata_client.default_headers, compression)
         for header_name, header_value in self._custom_headers.items():
             self._metadata_client.default_headers[header_name] = header_value
         self._metadata_client.user_agent = user_agent
 
         self._scan_config = scan_client.Configuration(host=host)
+        self._set_connection_options(self._scan_config)
         self._scan_client = scan_client.ApiClient(
             configuration=self._scan_config,
             header_name="Authorization",
             header_value=f"Bearer {token}",
         )
-        self._set_default_headers(self._scan_client.default_headers)
+        self._set_default_headers(self._scan_client.default_headers, compression)
         for header_name, header_value in self._custom_headers.items():
             self._scan_client.default_headers[header_name] = header_value
         self._scan_client.user_agent = user_agent
 
         self._afm_config = afm_client.Configuration(host=host)
+        self._set_connection_options(self._afm_config)
         self._afm_client = afm_client.ApiClient(
             configuration=self._afm_config,
             header_name="Authorization",
             header_value=f"Bearer {token}",
         )
-        self._set_default_headers(self._afm_client.default_headers)
+        self._set_default_headers(self._afm_client.default_headers, compression)
         for header_name, header_value in self._custom_headers.items():
             self._afm_client.default_headers[header_name] = header_value
         self._afm_client.user_agent = user_agent
 
+        # all clients talk to the same host; make them share the connections instead of each keeping its own
+        pool_manager = self._create_pool_manager() if http2 else self._metadata_client.rest_client.pool_manager
+        self._metadata_client.rest_client.pool_manager = pool_manager
+        self._scan_client.rest_client.pool_manager = pool_manager
+        self._afm_client.rest_client.pool_manager = pool_manager
+
+        if circuit_breaker is not None:
+            for api_client in [self._metadata_client, self._scan_client, self._afm_client]:
+                api_client.rest_client.request = circuit_breaker.wrap(api_client.rest_client.request)
+
+    def _create_pool_manager(self) -> Any:
+        # imported lazily, httpx is an optional dependency
+        from gooddata_sdk.http2 import Http2PoolManager
+
+        return Http2PoolManager(self._metadata_config)
+
     @staticmethod
-    def _set_default_headers(headers: dict) -> None:
+    def _set_default_headers(headers: dict, compression: bool = False) -> None:
         headers["X-Requested-With"] = "XMLHttpRequest"
         headers["X-GDC-VALIDATE-RELATIONS"] = "true"
 
+        if compression:
+            headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+    @staticmethod
+    def _create_socket_options(keep_alive: bool, socket_options: Optional[SocketOptions]) -> SocketOptions:
+        # keep urllib3 defaults (TCP_NODELAY) unless explicitly overridden
+        options = list(HTTPConnection.default_socket_options)
+
+        if keep_alive:
+            options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+
+        if socket_options is not None:
+            options.extend(socket_options)
+
+        return options
+
+    def _set_connection_options(
+        self, config: Union[metadata_client.Configuration, scan_client.Configuration, afm_client.Configuration]
+    ) -> None:
+        if self._connection_pool_size is not None:
+            config.connection_pool_maxsize = self._connection_pool_size
+
+        config.socket_options = self._socket_options
+
+        if self._retry_policy is not None:
+            config.retries = self._retry_policy.as_urllib3_retry()
+
+    @property
+    def host(self) -> str:
+        return self._hostname
+
+    @property
+    def connection_pool_size(self) -> int:
+        """
+        Maximum number of connections to the host kept open for reuse, shared by all API clients.
+        """
+        return self._metadata_config.connection_pool_maxsize
+
+    @property
+    def circuit_breaker(self) -> Optional[CircuitBreaker]:
+        return self._circuit_breaker
+
     @property
     def afm_client(self) -> afm_client.ApiClient:
         return self._afm_client
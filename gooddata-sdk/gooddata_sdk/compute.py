@@ -1,12 +1,56 @@
 # (C) 2021 GoodData Corporation
 from __future__ import annotations
 
-from typing import Any, Optional, Union
+import hashlib
+import itertools
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Generator, Optional, Union
 
 import gooddata_afm_client.apis as apis
 import gooddata_afm_client.models as models
+from gooddata_afm_client import ApiClient
+from gooddata_afm_client.exceptions import ApiException
 from gooddata_sdk.client import GoodDataApiClient
-from gooddata_sdk.compute_model import Attribute, Filter, Metric, compute_model_to_api_model
+from gooddata_sdk.compute_model import Attribute, Filter, Metric, SortKey, compute_model_to_api_model
+from gooddata_sdk.result_cache import ResultCache
+from gooddata_sdk.utils import TtlCache, load_json
+
+DEFAULT_BATCH_CONCURRENCY = 8
+"""
+Maximum number of executions that ComputeService.for_exec_defs submits to the server at the same time by default.
+"""
+
+DEFAULT_RESULT_ID_CACHE_TTL = 300.0
+"""
+Number of seconds for which ComputeService remembers result ids of computed execution definitions by default.
+"""
+
+DEFAULT_MAX_PAGE_SIZE = 10000
+"""
+Maximum number of rows in a result page that adaptive paging grows to by default.
+"""
+
+DEFAULT_MAX_PAGE_PAYLOAD = 16 * 1024 * 1024
+"""
+Maximum size of a result page payload in bytes that adaptive paging grows to by default.
+"""
+
+DEFAULT_TILE_CONCURRENCY = 4
+"""
+Maximum number of tiles that ExecutionResponse.read_result_tiled reads at the same time by default.
+"""
+
+DEFAULT_LABEL_ELEMENTS_CACHE_TTL = 3600.0
+"""
+Number of seconds for which ComputeService remembers counts of label elements.
+"""
+
+_LABEL_ELEMENTS_CACHE_SIZE = 1024
+
+_RESULT_GONE_STATUSES = (404, 410)
 
 
 class ExecutionDefinition:
@@ -16,11 +60,20 @@ class ExecutionDefinition:
         metrics: Optional[list[Metric]],
         filters: Optional[list[Filter]],
         dimensions: list[Optional[list[str]]],
+        sorts: Optional[list[SortKey]] = None,
     ) -> None:
+        """
+        :param attributes: attributes to compute
+        :param metrics: metrics to compute
+        :param filters: filters to apply
+        :param dimensions: layout of the result: local ids of items in each dimension, "measureGroup" for metrics
+        :param sorts: sort keys that order the first dimension of the result - the rows of tabular results
+        """
         self._attributes = attributes or []
         self._metrics = metrics or []
         self._filters = filters or []
         self._dimensions = [dim for dim in dimensions if dim is not None]
+        self._sorts = sorts or []
 
     @property
     def attributes(self) -> list[Attribute]:
@@ -47,6 +100,10 @@ class ExecutionDefinition:
     def dimensions(self) -> list[list[str]]:
         return self._dimensions
 
+    @property
+    def sorts(self) -> list[SortKey]:
+        return self._sorts
+
     def is_one_dim(self) -> bool:
         return len(self.dimensions) == 1
 
@@ -55,9 +112,18 @@ class ExecutionDefinition:
 
     def as_api_model(self) -> models.AfmExecution:
         dimensions = []
+        measure_dimension = next(
+            (f"dim_{idx}" for idx, dim in enumerate(self._dimensions) if "measureGroup" in dim), None
+        )
 
         for idx, dim in enumerate(self._dimensions):
-            dimensions.append(models.Dimension(local_identifier=f"dim_{idx}", item_identifiers=dim))
+            kwargs: dict[str, Any] = {}
+            if idx == 0 and self._sorts:
+                kwargs["sorting"] = [sort.as_api_model(measure_dimension) for sort in self._sorts]
+
+            dimensions.append(
+                models.Dimension(local_identifier=f"dim_{idx}", item_identifiers=dim, _check_type=False, **kwargs)
+            )
 
         execution = compute_model_to_api_model(attributes=self.attributes, metrics=self.metrics, filters=self.filters)
 
@@ -65,9 +131,32 @@ class ExecutionDefinition:
 
         return models.AfmExecution(execution=execution, result_spec=result_spec)
 
+    def fingerprint(self) -> str:
+        """
+        Computes fingerprint of the execution definition. Definitions that are bound to produce the same result have
+        the same fingerprint: the order in which attributes and filters are listed does not matter - the layout of the
+        result is prescribed by the dimensions and all filters apply at once. The order of metrics is kept as it
+        determines the order of metric values in the result.
+
+        :return: hex digest which is stable across processes and SDK sessions
+        """
+        afm = ApiClient.sanitize_for_serialization(self.as_api_model())
+        execution = afm["execution"]
+        execution["attributes"] = sorted(execution.get("attributes", []), key=lambda a: a["localIdentifier"])
+        execution["filters"] = sorted(execution.get("filters", []), key=lambda f: json.dumps(f, sort_keys=True))
+        canonical = json.dumps(afm, sort_keys=True, separators=(",", ":"))
+
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
 
 class ExecutionResult:
-    def __init__(self, result: models.ExecutionResult):
+    def __init__(self, result: models.ExecutionResult, payload_size: Optional[int] = None):
+        """
+        :param result: the result page
+        :param payload_size: optionally specify size of the payload in bytes as it was received from the server;
+            None if the page was not received from server (e.g. it was served from a cache)
+        """
+        self._payload_size = payload_size
         self._data: list[Any] = result["data"]
         self._headers: list[models.DimensionHeader] = result["dimension_headers"]
         self._grand_totals: list[models.ExecutionResultGrandTotal] = result["grand_totals"]
@@ -89,6 +178,10 @@ class ExecutionResult:
     def paging(self) -> models.ExecutionResultPaging:
         return self._paging
 
+    @property
+    def payload_size(self) -> Optional[int]:
+        return self._payload_size
+
     @property
     def paging_total(self) -> list[int]:
         return self._paging["total"]
@@ -113,6 +206,41 @@ class ExecutionResult:
             for header in self.headers[dim]["headerGroups"][header_idx]["headers"]
         ]
 
+    def get_all_header_columns(self, dim: int) -> list[list[str]]:
+        """
+        Gets label values of all attributes placed in the dimension in one go. The dimension must contain only
+        attributes.
+
+        :param dim: index of the dimension
+        :return: list with one item per attribute in the dimension (in the order of the dimension); each item is list
+            of label values
+        """
+        return [
+            [header["attributeHeader"]["labelValue"] for header in header_group["headers"]]
+            for header_group in self.headers[dim]["headerGroups"]
+        ]
+
+    def get_all_data_columns(self, dim: int) -> list[list[Any]]:
+        """
+        Gets values of all metrics in one go. The metrics are expected to be alone in their dimension.
+
+        :param dim: index of the dimension which contains the metrics (the measureGroup)
+        :return: list with one item per metric (in the order of the dimension); each item is list of metric values
+        """
+        if len(self.paging_count) == 1:
+            # single dim result with just the metrics, there is single value for each of them
+            return [[value] for value in self._data]
+
+        if dim == 0:
+            # metrics in the first dimension = each row of data already contains values of one metric
+            return [list(values) for values in self._data]
+
+        if not len(self._data):
+            return [[] for _ in range(self.paging_count[dim])]
+
+        # metrics in the second dimension = each row of data contains values of all metrics, transpose
+        return [list(values) for values in zip(*self._data)]
+
     def __str__(self) -> str:
         return self.__repr__()
 
@@ -127,10 +255,25 @@ class ExecutionResponse:
         workspace_id: str,
         exec_def: ExecutionDefinition,
         response: models.AfmExecutionResponse,
+        result_cache: Optional[ResultCache] = None,
+        execute: Optional[Callable[[], models.AfmExecutionResponse]] = None,
     ):
+        """
+        :param result_api: API used to read the result
+        :param workspace_id: workspace identifier
+        :param exec_def: execution definition that was computed
+        :param response: response of the execution
+        :param result_cache: optionally specify cache of the result pages
+        :param execute: optionally specify function that computes the execution definition again; when specified,
+            the computation is repeated once if the result is no longer available on the server
+        """
         self._result_api = result_api
         self._workspace_id = workspace_id
         self._exec_def = exec_def
+        self._result_cache = result_cache
+        self._fingerprint: Optional[str] = None
+        self._execute = execute
+        self._lock = threading.Lock()
 
         self._r: models.ExecutionResponse = response["execution_response"]
         self._response = response
@@ -147,9 +290,23 @@ class ExecutionResponse:
     def result_id(self) -> str:
         return self._r["links"]["executionResult"]
 
+    def _result_cache_key(self, result_id: str, offset: list[int], limit: list[int]) -> str:
+        if self._fingerprint is None:
+            self._fingerprint = self._exec_def.fingerprint()
+
+        api_client = self._result_api.api_client
+        host = api_client.configuration.host
+        # users may see different data in the same workspace; pages are shared only by clients with the same token
+        token = hashlib.sha256(api_client.default_headers.get("Authorization", "").encode("utf-8")).hexdigest()[:32]
+        paging = ",".join(str(v) for v in offset) + "/" + ",".join(str(v) for v in limit)
+
+        return f"{host}/{token}/{self._workspace_id}/{result_id}/{self._fingerprint}/{paging}"
+
     def read_result(self, limit: Union[int, list[int]], offset: Union[None, int, list[int]] = None) -> ExecutionResult:
         """
-        Reads from the execution result.
+        Reads from the execution result. If the response was created with result cache, the page is served from
+        the cache when the same page of the same result was read before using the same token.
+
         :param offset:
         :param limit:
         :return:
@@ -162,16 +319,102 @@ class ExecutionResponse:
         # this makes sure that offset gets defaulted to start of result
         _offset = [0 for _ in _limit] if _limit is not None and _offset is None else _offset
 
-        return ExecutionResult(
-            self._result_api.retrieve_result(
-                workspace_id=self._workspace_id,
-                result_id=self.result_id,
-                offset=_offset,
-                limit=_limit,
-                _check_return_type=False,
-            )
+        result_id = self.result_id
+        if self._result_cache is not None:
+            cached = self._result_cache.get(self._result_cache_key(result_id, _offset, _limit))
+
+            if cached is not None:
+                return ExecutionResult(cached)
+
+        try:
+            payload = self._retrieve_result(result_id, _offset, _limit)
+        except ApiException as e:
+            if e.status not in _RESULT_GONE_STATUSES:
+                raise
+
+            # result computed earlier was evicted from the server meanwhile, compute it again; pages read
+            # concurrently may hit the same error, they read the result computed by the first of them
+            with self._lock:
+                if self.result_id == result_id:
+                    if self._execute is None:
+                        raise
+                    self._response = self._execute()
+                    self._r = self._response["execution_response"]
+                    self._execute = None
+
+            payload = self._retrieve_result(self.result_id, _offset, _limit)
+
+        raw = load_json(payload)
+        result = dict(
+            data=raw["data"],
+            dimension_headers=raw["dimensionHeaders"],
+            grand_totals=raw["grandTotals"],
+            paging=raw["paging"],
         )
 
+        if self._result_cache is not None:
+            # the result may have been computed again meanwhile
+            self._result_cache.put(self._result_cache_key(self.result_id, _offset, _limit), result)
+
+        return ExecutionResult(result, payload_size=len(payload))
+
+    def read_result_tiled(
+        self,
+        limit: list[int],
+        tile_limit: list[int],
+        offset: Optional[list[int]] = None,
+        max_concurrency: int = DEFAULT_TILE_CONCURRENCY,
+    ) -> ExecutionResult:
+        """
+        Reads area of the execution result that is too large to be read in one request. The area is split into tiles
+        that are at most `tile_limit` large in each dimension; the tiles are read in parallel and stitched together
+        into single ExecutionResult - as if the whole area was read at once. Each of the tiles is read using
+        `read_result` and so it is served from the result cache if possible.
+
+        Note that the grand totals of the stitched result are those of the first tile.
+
+        :param limit: size of the area to read in each dimension
+        :param tile_limit: maximum size of a tile in each dimension
+        :param offset: optionally specify start of the area to read; default is the start of the result
+        :param max_concurrency: optionally specify maximum number of tiles being read at the same time
+        :return: the area of the result
+        """
+        _offset = offset if offset is not None else [0 for _ in limit]
+        first_tile = self.read_result(offset=_offset, limit=[min(lim, t) for lim, t in zip(limit, tile_limit)])
+
+        # the first tile tells the totals, the area is clipped to them; there is always at least one tile per dim
+        starts = [
+            list(range(start, max(min(start + lim, total), start + 1), t))
+            for start, lim, total, t in zip(_offset, limit, first_tile.paging_total, tile_limit)
+        ]
+        tile_offsets = [list(tile_offset) for tile_offset in itertools.product(*starts)]
+
+        if len(tile_offsets) == 1:
+            return first_tile
+
+        def _read_tile(tile_offset: list[int]) -> ExecutionResult:
+            tile_end = [min(o + lim, s + t) for o, lim, s, t in zip(_offset, limit, tile_offset, tile_limit)]
+            return self.read_result(offset=tile_offset, limit=[e - s for e, s in zip(tile_end, tile_offset)])
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            tiles = [first_tile] + list(pool.map(_read_tile, tile_offsets[1:]))
+
+        return _stitch_tiles(tiles, [len(dim_starts) for dim_starts in starts])
+
+    def _retrieve_result(self, result_id: str, offset: list[int], limit: list[int]) -> bytes:
+        # the result is not deserialized by the generated client; constructing the API models for large results
+        # is costly and SDK only needs plain structures anyway
+        response = self._result_api.retrieve_result(
+            workspace_id=self._workspace_id,
+            result_id=result_id,
+            offset=offset,
+            limit=limit,
+            _check_return_type=False,
+            _preload_content=False,
+        )
+        # reading all data returns the connection back to the pool
+        return response.data
+
     def __str__(self) -> str:
         return self.__repr__()
 
@@ -179,16 +422,194 @@ class ExecutionResponse:
         return f"ExecutionResponse(workspace_id={self.workspace_id}, result_id={self.result_id})"
 
 
+class AdaptivePaging:
+    """
+    Prescribes adaptive sizing of result pages. Reading starts with pages of `initial_size` rows; after each page is
+    received, the size of the next page is adjusted so that reading a page takes about `target_seconds` and its
+    payload does not exceed `max_payload` bytes. The size at most doubles or halves after each page and always stays
+    between `min_size` and `max_size` - keep the latter at or below the maximum page size accepted by the server.
+
+    Compared to small fixed pages, this reduces number of round trips when reading large results over fast
+    connections while keeping pages small when the server or the connection is slow.
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 512,
+        min_size: int = 100,
+        max_size: int = DEFAULT_MAX_PAGE_SIZE,
+        target_seconds: float = 1.0,
+        max_payload: int = DEFAULT_MAX_PAGE_PAYLOAD,
+    ) -> None:
+        if not 0 < min_size <= initial_size <= max_size:
+            raise ValueError(
+                f"Invalid adaptive paging: expecting 0 < min_size <= initial_size <= max_size, got "
+                f"min_size={min_size}, initial_size={initial_size}, max_size={max_size}"
+            )
+
+        self.initial_size = initial_size
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_seconds = target_seconds
+        self.max_payload = max_payload
+
+    def __repr__(self) -> str:
+        return (
+            f"AdaptivePaging(initial_size={self.initial_size}, min_size={self.min_size}, max_size={self.max_size}, "
+            f"target_seconds={self.target_seconds}, max_payload={self.max_payload})"
+        )
+
+
+PageSize = Union[int, AdaptivePaging]
+"""
+Size of result pages: either fixed number of rows or prescription of adaptive paging.
+"""
+
+
+class PageSizer:
+    """
+    Determines size of the pages while reading single execution result. With fixed page size, all pages have the
+    same size. With adaptive paging, the size is adjusted based on how long it took to read the previous pages and on
+    their payload size, see `AdaptivePaging`. Pages may be read concurrently from multiple threads.
+    """
+
+    def __init__(self, page_size: PageSize) -> None:
+        self._adaptive = page_size if isinstance(page_size, AdaptivePaging) else None
+        self._size = page_size.initial_size if isinstance(page_size, AdaptivePaging) else page_size
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def observe(self, page: ExecutionResult, requested_size: int, seconds: float, dim: int = 0) -> None:
+        """
+        Adjusts the page size based on a page that was read.
+
+        :param page: the page that was read
+        :param requested_size: number of rows that were requested in the dimension being paged
+        :param seconds: number of seconds that reading the page took
+        :param dim: index of the dimension being paged
+        """
+        paging = self._adaptive
+        rows = page.paging_count[dim]
+
+        # pages not received from server say nothing about the server; the last, partial, page is not representative
+        if paging is None or page.payload_size is None or rows < requested_size or rows == 0:
+            return
+
+        # aim for the target time; limit the change so that single slow or fast read does not swing the size
+        size = int(requested_size * paging.target_seconds / max(seconds, 1e-3))
+        size = max(requested_size // 2, min(size, requested_size * 2))
+        size = min(size, paging.max_payload * rows // max(page.payload_size, 1))
+
+        with self._lock:
+            self._size = max(paging.min_size, min(size, paging.max_size))
+
+    def read(
+        self,
+        response: ExecutionResponse,
+        offset: list[int],
+        limit: list[int],
+        dim: int = 0,
+        tile_limit: Optional[list[int]] = None,
+    ) -> ExecutionResult:
+        """
+        Reads page of the result and adjusts the page size accordingly.
+
+        :param response: execution response to read the page from
+        :param offset: offset of the page
+        :param limit: limit of the page; the limit in the dimension being paged should be the current size
+        :param dim: index of the dimension being paged
+        :param tile_limit: optionally specify maximum size of the page that can be read in one request; larger pages
+            are read in tiles, see `ExecutionResponse.read_result_tiled`
+        :return: the page
+        """
+        started = time.monotonic()
+
+        if tile_limit is not None and any(lim > t for lim, t in zip(limit, tile_limit)):
+            page = response.read_result_tiled(offset=offset, limit=limit, tile_limit=tile_limit)
+        else:
+            page = response.read_result(offset=offset, limit=limit)
+
+        self.observe(page, limit[dim], time.monotonic() - started, dim)
+
+        return page
+
+
 class ComputeService:
     """
     Compute service drives computation of analytics for a GoodData.CN workspaces. The prescription of what to compute
     is encapsulated by the ExecutionDefinition which consists of attributes, metrics, filters and definition of
     dimensions that influence how to organize the data in the result.
+
+    Optionally, the service can be created with a result cache; pages of results read through the execution responses
+    are then stored in the cache and reading the same page of the same result is served from the cache without
+    downloading it again. Pages are cached per result id, so a fresh computation never reads pages of an older one;
+    remember the result ids (see below) to serve identical execution definitions from the cache without computing
+    them again.
+
+    The service can also remember ids of results computed for the execution definitions. Computing an identical
+    execution definition then does not contact the server at all: the response reads the remembered result. The
+    results are remembered only for a limited time, `result_id_cache_ttl`, because the result may become stale as the
+    data in the workspace change. Remembering is disabled by default; enable it with positive `result_id_cache_size`.
+
+    The service does not read the results on its own; it holds the `page_size` that components reading the results
+    through it (such as data frame factories) should use by default. None means that they use their own default.
     """
 
-    def __init__(self, api_client: GoodDataApiClient):
+    def __init__(
+        self,
+        api_client: GoodDataApiClient,
+        result_cache: Optional[ResultCache] = None,
+        result_id_cache_size: int = 0,
+        result_id_cache_ttl: Optional[float] = DEFAULT_RESULT_ID_CACHE_TTL,
+        page_size: Optional[PageSize] = None,
+    ):
+        """
+        :param api_client: client to use
+        :param result_cache: optionally specify cache of result pages
+        :param result_id_cache_size: maximum number of remembered result ids; 0 = do not remember result ids
+        :param result_id_cache_ttl: number of seconds for which result ids are remembered; None = remember forever
+        :param page_size: optionally specify default size of result pages: fixed number of rows or adaptive paging
+        """
         self._exec_api = apis.AfmControllerApi(api_client.afm_client)
         self._result_api = apis.ResultControllerApi(api_client.afm_client)
+        self._elements_api = apis.ElementsControllerApi(api_client.afm_client)
+        self._result_cache = result_cache
+        self._result_ids = TtlCache(max_size=result_id_cache_size, ttl=result_id_cache_ttl)
+        self._page_size = page_size
+        self._label_element_counts = TtlCache(max_size=_LABEL_ELEMENTS_CACHE_SIZE, ttl=DEFAULT_LABEL_ELEMENTS_CACHE_TTL)
+
+    @property
+    def result_cache(self) -> Optional[ResultCache]:
+        return self._result_cache
+
+    @property
+    def page_size(self) -> Optional[PageSize]:
+        return self._page_size
+
+    def count_label_elements(self, workspace_id: str, label_id: str) -> int:
+        """
+        Counts elements (distinct values) of a label. Only single element is read from the server, the count is
+        taken from the paging. The counts are remembered for `DEFAULT_LABEL_ELEMENTS_CACHE_TTL` seconds; they serve
+        as estimates, e.g. of result sizes, and do not need to be exact.
+
+        :param workspace_id: workspace identifier
+        :param label_id: label identifier
+        :return: number of elements of the label
+        """
+        key = (workspace_id, label_id)
+        count = self._label_element_counts.get(key)
+
+        if count is None:
+            response = self._elements_api.compute_label_elements(
+                workspace_id, label_id, limit=1, _check_return_type=False
+            )
+            count = response["paging"]["total"]
+            self._label_element_counts.put(key, count)
+
+        return count
 
     def for_exec_def(self, workspace_id: str, exec_def: ExecutionDefinition) -> ExecutionResponse:
         """
@@ -200,11 +621,164 @@ class ComputeService:
 
         :return:
         """
-        response = self._exec_api.compute_report(workspace_id, exec_def.as_api_model(), _check_return_type=False)
+        if self._result_ids.max_size <= 0:
+            return self._create_response(workspace_id, exec_def, self._compute(workspace_id, exec_def))
+
+        key = (workspace_id, exec_def.fingerprint())
+        result_id = self._result_ids.get(key)
+
+        if result_id is None:
+            response = self._compute(workspace_id, exec_def)
+            self._result_ids.put(key, response["execution_response"]["links"]["executionResult"])
+
+            return self._create_response(workspace_id, exec_def, response)
+
+        def _execute() -> models.AfmExecutionResponse:
+            recomputed = self._compute(workspace_id, exec_def)
+            self._result_ids.put(key, recomputed["execution_response"]["links"]["executionResult"])
+
+            return recomputed
 
+        return self._create_response(workspace_id, exec_def, _result_id_response(result_id), execute=_execute)
+
+    def for_result_id(self, workspace_id: str, exec_def: ExecutionDefinition, result_id: str) -> ExecutionResponse:
+        """
+        Creates response for result which was already computed in GoodData.CN workspace, without starting the
+        computation again. Use this when you hold result id (see `ExecutionResponse.result_id`) obtained earlier
+        for the execution definition.
+
+        Note that server keeps results only for a limited time; reading the result fails if it is no longer available.
+
+        :param workspace_id: workspace identifier
+        :param exec_def: execution definition for which the result was computed
+        :param result_id: identifier of the result
+        :return:
+        """
+        return self._create_response(workspace_id, exec_def, _result_id_response(result_id))
+
+    def _compute(self, workspace_id: str, exec_def: ExecutionDefinition) -> models.AfmExecutionResponse:
+        return self._exec_api.compute_report(workspace_id, exec_def.as_api_model(), _check_return_type=False)
+
+    def _create_response(
+        self,
+        workspace_id: str,
+        exec_def: ExecutionDefinition,
+        response: models.AfmExecutionResponse,
+        execute: Optional[Callable[[], models.AfmExecutionResponse]] = None,
+    ) -> ExecutionResponse:
         return ExecutionResponse(
             result_api=self._result_api,
             workspace_id=workspace_id,
             exec_def=exec_def,
             response=response,
+            result_cache=self._result_cache,
+            execute=execute,
         )
+
+    def for_exec_defs(
+        self,
+        workspace_id: str,
+        exec_defs: list[ExecutionDefinition],
+        max_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> Generator[tuple[int, ExecutionResponse], None, None]:
+        """
+        Starts computations of multiple execution definitions in GoodData.CN workspace. The computations are started
+        concurrently using a pool of worker threads; identical execution definitions are computed just once.
+
+        The returned generator yields responses as the computations are started, not in the order of the input. Each
+        response is yielded together with index of its execution definition in `exec_defs`; response of a definition
+        that appears multiple times in the input is yielded once for each of its indexes.
+
+        If starting any computation fails, the exception is raised by the generator and the computations that were not
+        yet submitted are cancelled. The same happens when the generator is closed before it is exhausted.
+
+        :param workspace_id: workspace identifier
+        :param exec_defs: execution definitions to compute
+        :param max_concurrency: optionally specify maximum number of computations being started at the same time
+        :return: generator yielding tuples of (index of execution definition, execution response)
+        """
+        indexes_by_key: dict[str, list[int]] = dict()
+        unique_exec_defs: dict[str, ExecutionDefinition] = dict()
+
+        for idx, exec_def in enumerate(exec_defs):
+            key = exec_def.fingerprint()
+
+            if key not in indexes_by_key:
+                indexes_by_key[key] = []
+                unique_exec_defs[key] = exec_def
+
+            indexes_by_key[key].append(idx)
+
+        pool = ThreadPoolExecutor(max_workers=max_concurrency)
+        futures = {
+            pool.submit(self.for_exec_def, workspace_id, exec_def): key for key, exec_def in unique_exec_defs.items()
+        }
+
+        try:
+            for future in as_completed(futures):
+                response = future.result()
+
+                for idx in indexes_by_key[futures[future]]:
+                    yield idx, response
+        finally:
+            for future in futures:
+                future.cancel()
+
+            pool.shutdown(wait=False)
+
+
+def _stitch_headers(tiles: list[ExecutionResult], dim: int) -> dict[str, Any]:
+    header_groups = tiles[0].headers[dim]["headerGroups"]
+
+    return dict(
+        headerGroups=[
+            {
+                **group,
+                "headers": [header for tile in tiles for header in tile.headers[dim]["headerGroups"][idx]["headers"]],
+            }
+            for idx, group in enumerate(header_groups)
+        ]
+    )
+
+
+def _stitch_tiles(tiles: list[ExecutionResult], counts: list[int]) -> ExecutionResult:
+    """
+    Stitches tiles of a result area together. The tiles are expected in row-major order: all tiles in the first band
+    of the first dimension, then the second band and so on.
+
+    :param tiles: tiles covering the area
+    :param counts: number of tiles in each dimension
+    :return: result containing the whole area
+    """
+    first = tiles[0]
+    # tiles[i * columns + j] is the j-th tile in the i-th band of the first dimension
+    columns = counts[1] if len(counts) > 1 else 1
+    bands = [tiles[i : i + columns] for i in range(0, len(tiles), columns)]
+    along_dims = [[band[0] for band in bands], bands[0]]
+
+    if len(counts) == 1:
+        data = [value for tile in tiles for value in tile.data]
+    else:
+        data = [sum((tile.data[row] for tile in band), []) for band in bands for row in range(len(band[0].data))]
+
+    payload_sizes = [tile.payload_size for tile in tiles if tile.payload_size is not None]
+    paging = dict(
+        offset=first.paging_offset,
+        count=[sum(tile.paging_count[dim] for tile in along_dims[dim]) for dim in range(len(counts))],
+        total=first.paging_total,
+    )
+
+    return ExecutionResult(
+        dict(
+            data=data,
+            dimension_headers=[_stitch_headers(along_dims[dim], dim) for dim in range(len(counts))],
+            grand_totals=first.grand_totals,
+            paging=paging,
+        ),
+        payload_size=sum(payload_sizes) if len(payload_sizes) == len(tiles) else None,
+    )
+
+
+def _result_id_response(result_id: str) -> dict[str, Any]:
+    # minimal execution response pointing to already computed result
+    return dict(execution_response=dict(links=dict(executionResult=result_id)))
@@ -638,6 +638,15 @@ class MetricValueFilter(Filter):
             body = afm_models.RangeMeasureValueFilterBody(**kwargs)
             return afm_models.RangeMeasureValueFilter(body)
 
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, MetricValueFilter)
+            and self._metric == other._metric
+            and self._operator == other._operator
+            and self._values == other._values
+            and self._treat_nulls_as == other._treat_nulls_as
+        )
+
 
 _RANKING_OPERATORS = {"TOP", "BOTTOM"}
 
@@ -693,6 +702,75 @@ class RankingFilter(Filter):
         return afm_models.RankingFilter(body)
 
 
+_SORT_DIRECTIONS = {"ASC", "DESC"}
+
+
+class SortKey:
+    """
+    Base class of sort keys which order the rows of a result.
+    """
+
+    def __init__(self, local_id: str, direction: str = "ASC") -> None:
+        if direction not in _SORT_DIRECTIONS:
+            raise ValueError(f"Invalid sort direction '{direction}'. It is expected to be one of: {_SORT_DIRECTIONS}")
+
+        self._local_id = local_id
+        self._direction = direction
+
+    @property
+    def local_id(self) -> str:
+        return self._local_id
+
+    @property
+    def direction(self) -> str:
+        return self._direction
+
+    def as_api_model(self, measure_dimension: Optional[str]) -> OpenApiModel:
+        """
+        :param measure_dimension: local identifier of the dimension that contains metrics; None if there is no such
+            dimension
+        :return: sort key to include in sorting of result dimension
+        """
+        raise NotImplementedError()
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+
+class AttributeSortKey(SortKey):
+    """
+    Orders rows by values of an attribute.
+    """
+
+    def __init__(self, attribute: Union[str, Attribute], direction: str = "ASC") -> None:
+        super(AttributeSortKey, self).__init__(
+            attribute if isinstance(attribute, str) else attribute.local_id, direction
+        )
+
+    def as_api_model(self, measure_dimension: Optional[str]) -> afm_models.SortKeyAttribute:
+        body = afm_models.SortKeyAttributeAttribute(
+            attribute_identifier=self.local_id, direction=self.direction, _check_type=False
+        )
+        return afm_models.SortKeyAttribute(attribute=body, _check_type=False)
+
+
+class MetricSortKey(SortKey):
+    """
+    Orders rows by values of a metric.
+    """
+
+    def __init__(self, metric: Union[str, Metric], direction: str = "ASC") -> None:
+        super(MetricSortKey, self).__init__(_extract_local_id(metric), direction)
+
+    def as_api_model(self, measure_dimension: Optional[str]) -> afm_models.SortKeyValue:
+        if measure_dimension is None:
+            raise ValueError(f"Unable to sort by metric '{self.local_id}', the result has no dimension with metrics.")
+
+        locators = {measure_dimension: afm_models.DataColumnLocator(measureGroup=self.local_id)}
+        body = afm_models.SortKeyValueValue(data_column_locators=locators, direction=self.direction, _check_type=False)
+        return afm_models.SortKeyValue(value=body, _check_type=False)
+
+
 def compute_model_to_api_model(
     attributes: Optional[list[Attribute]] = None,
     metrics: Optional[list[Metric]] = None,
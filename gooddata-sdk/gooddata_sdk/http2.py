@@ -0,0 +1,198 @@
+# (C) 2022 GoodData Corporation
+"""
+Module containing HTTP/2 transport for the generated API clients. The transport is used in place of urllib3 pool
+manager inside the generated `RESTClientObject`s, so the clients keep their usual interface and error handling, but
+all requests are sent using httpx. Concurrent requests to the same host are multiplexed on a single HTTP/2
+connection instead of each one needing its own TCP connection.
+
+The httpx package is an optional dependency, install it using the `http2` extra: `pip install gooddata-sdk[http2]`.
+The extra requires Python 3.8 or newer.
+"""
+from __future__ import annotations
+
+import ssl
+from typing import Any, Optional, Union
+
+import urllib3
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError as e:
+    raise ImportError(
+        "HTTP/2 transport of GoodData SDK requires httpx. Install it using: pip install gooddata-sdk[http2]"
+    ) from e
+
+
+class Http2Response:
+    """
+    Response of the HTTP/2 transport, it provides the subset of urllib3 response interface used by the generated
+    clients and by urllib3 retries. The body is always read completely.
+    """
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._response = response
+        self.status = response.status_code
+        self.reason = response.reason_phrase
+        self.version = response.http_version
+        self.headers = response.headers
+        self.data = response.content
+
+    def getheaders(self) -> httpx.Headers:
+        return self.headers
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        return self.headers.get(name, default)
+
+    def get_redirect_location(self) -> bool:
+        # redirects are not followed
+        return False
+
+    def read(self, *args: Any, **kwargs: Any) -> bytes:
+        return self.data
+
+    def release_conn(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self._response.close()
+
+
+class Http2PoolManager:
+    """
+    Drop-in replacement of urllib3 pool manager which sends requests over HTTP/2 using httpx.
+
+    HTTP/2 is negotiated during TLS handshake; requests to hosts which do not support it, and all requests to plain
+    http hosts, fall back to HTTP/1.1. Connection settings (SSL verification and certificates, proxy, socket options,
+    maximum number of connections and retries) are taken from configuration of the generated client.
+    """
+
+    def __init__(self, configuration: Any) -> None:
+        """
+        :param configuration: configuration of the generated API client
+        """
+        self._retries = configuration.retries if configuration.retries is not None else Retry.DEFAULT
+
+        transport = httpx.HTTPTransport(
+            http2=True,
+            verify=self._create_ssl_context(configuration),
+            cert=(configuration.cert_file, configuration.key_file) if configuration.cert_file else None,
+            limits=httpx.Limits(max_connections=configuration.connection_pool_maxsize),
+            proxy=configuration.proxy,
+            socket_options=configuration.socket_options,
+        )
+        self._client = httpx.Client(transport=transport, timeout=None, follow_redirects=False)
+        # urllib3 does not ask for compressed responses unless told to; compression is turned on by the headers
+        del self._client.headers["Accept-Encoding"]
+
+    @staticmethod
+    def _create_ssl_context(configuration: Any) -> Union[ssl.SSLContext, bool]:
+        if not configuration.verify_ssl:
+            return False
+
+        return ssl.create_default_context(cafile=configuration.ssl_ca_cert)
+
+    @property
+    def client(self) -> httpx.Client:
+        return self._client
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        fields: Optional[Any] = None,
+        headers: Optional[dict[str, str]] = None,
+        body: Optional[Union[str, bytes]] = None,
+        encode_multipart: bool = True,
+        preload_content: bool = True,
+        timeout: Optional[urllib3.Timeout] = None,
+    ) -> Http2Response:
+        """
+        Sends request with the same arguments as urllib3's `PoolManager.request`. Requests are retried the same way
+        as by urllib3: transport errors are raised as the corresponding urllib3 exceptions.
+        """
+        request = self._build_request(method, url, fields, headers, body, encode_multipart, timeout)
+        retries = self._retries
+
+        while True:
+            try:
+                response = Http2Response(self._client.send(request))
+            except httpx.TransportError as e:
+                # raises the error when it is not to be retried, MaxRetryError when there are no retries left
+                retries = retries.increment(method, url, error=_urllib3_error(e, url), _stacktrace=e.__traceback__)
+                retries.sleep()
+                continue
+
+            has_retry_after = "Retry-After" in response.headers
+            if not retries.is_retry(method, response.status, has_retry_after):
+                return response
+
+            try:
+                retries = retries.increment(method, url, response=response)  # type: ignore[arg-type]
+            except MaxRetryError:
+                if retries.raise_on_status:
+                    raise
+                return response
+
+            retries.sleep(response)  # type: ignore[arg-type]
+
+    def _build_request(
+        self,
+        method: str,
+        url: str,
+        fields: Optional[Any],
+        headers: Optional[dict[str, str]],
+        body: Optional[Union[str, bytes]],
+        encode_multipart: bool,
+        timeout: Optional[urllib3.Timeout],
+    ) -> httpx.Request:
+        timeout_ext = dict(timeout=_httpx_timeout(timeout).as_dict())
+
+        # same as urllib3, fields of these methods are sent as query parameters
+        if method in ["DELETE", "GET", "HEAD", "OPTIONS"] and fields:
+            return self._client.build_request(method, url, params=fields, headers=headers, extensions=timeout_ext)
+
+        if not fields:
+            return self._client.build_request(method, url, content=body, headers=headers, extensions=timeout_ext)
+
+        items = fields.items() if isinstance(fields, dict) else fields
+        if not encode_multipart:
+            return self._client.build_request(method, url, data=dict(items), headers=headers, extensions=timeout_ext)
+
+        # files are passed as (filename, data, mime type) tuples, other fields as plain values
+        files = [(name, value) for name, value in items if isinstance(value, tuple)]
+        data = {name: value for name, value in items if not isinstance(value, tuple)}
+        return self._client.build_request(method, url, data=data, files=files, headers=headers, extensions=timeout_ext)
+
+    def clear(self) -> None:
+        """
+        Closes all connections.
+        """
+        self._client.close()
+
+
+def _httpx_timeout(timeout: Optional[urllib3.Timeout]) -> httpx.Timeout:
+    if timeout is None:
+        return httpx.Timeout(None)
+
+    # read timeout of urllib3 depends on time it took to connect; with just total timeout, it is used for both
+    started = timeout.clone()
+    started.start_connect()
+    connect, read = timeout.connect_timeout, started.read_timeout
+
+    return httpx.Timeout(
+        None,
+        connect=connect if isinstance(connect, (int, float)) else None,
+        read=read if isinstance(read, (int, float)) else None,
+    )
+
+
+def _urllib3_error(error: httpx.TransportError, url: str) -> Exception:
+    # urllib3 retries distinguish connection errors, which are always safe to retry, from read errors
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+        return NewConnectionError(None, str(error))  # type: ignore[arg-type]
+    if isinstance(error, httpx.ReadTimeout):
+        return ReadTimeoutError(None, url, str(error))  # type: ignore[arg-type]
+
+    return ProtocolError(str(error), error)
@@ -0,0 +1,168 @@
+# (C) 2022 GoodData Corporation
+""" Module containing caches of execution result pages.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from gooddata_sdk.utils import TtlCache, load_json
+
+DEFAULT_RESULT_CACHE_TTL = 300.0
+"""
+Number of seconds for which result pages are cached by default.
+"""
+
+DEFAULT_RESULT_CACHE_SIZE = 256
+"""
+Maximum number of result pages held in a result cache by default.
+"""
+
+
+class ResultCache:
+    """
+    Base class for caches of execution result pages. The cache maps a key identifying page of a result of particular
+    execution definition to the raw result page: a dict with `data`, `dimension_headers`, `grand_totals` and `paging`.
+
+    The cache is used by ComputeService (and thus TableService) when reading results; see `GoodDataSdk`.
+    """
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        raise NotImplementedError()
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        raise NotImplementedError()
+
+    def invalidate(self) -> None:
+        """
+        Drops all cached result pages.
+        """
+        raise NotImplementedError()
+
+
+class MemoryResultCache(ResultCache):
+    """
+    Keeps result pages in memory of the current process. Least recently used pages are evicted when the cache is
+    full, pages older than ttl are never served.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_RESULT_CACHE_SIZE, ttl: Optional[float] = DEFAULT_RESULT_CACHE_TTL):
+        """
+        :param max_size: maximum number of cached result pages
+        :param ttl: number of seconds after which cached page expires; None = pages do not expire
+        """
+        self._cache = TtlCache(max_size=max_size, ttl=ttl)
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        return self._cache.get(key)
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        self._cache.put(key, result)
+
+    def invalidate(self) -> None:
+        self._cache.invalidate()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class DiskResultCache(ResultCache):
+    """
+    Keeps result pages as files in a directory so that they can be shared by multiple processes. Least recently used
+    pages are evicted when the cache is full, pages older than ttl are never served.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        max_size: int = DEFAULT_RESULT_CACHE_SIZE,
+        ttl: Optional[float] = DEFAULT_RESULT_CACHE_TTL,
+    ):
+        """
+        :param cache_dir: directory where to store result pages; it is created if it does not exist
+        :param max_size: maximum number of cached result pages
+        :param ttl: number of seconds after which cached page expires; None = pages do not expire
+        """
+        self._cache_dir = Path(cache_dir)
+        self._max_size = max_size
+        self._ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        return self._cache_dir / f"result-{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def _entries(self) -> list[Path]:
+        return list(self._cache_dir.glob("result-*.json"))
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        path = self._path(key)
+
+        try:
+            # file is written once and then only touched when read; creation time is kept in the content
+            cached = load_json(path.read_bytes())
+
+            if self._ttl is not None and time.time() - cached["created"] > self._ttl:
+                path.unlink()
+                return None
+
+            # modification time tracks use of the page for the LRU eviction
+            os.utime(path)
+
+            return cached["result"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        if self._max_size <= 0:
+            return
+
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+            # write to temporary file first so that concurrent readers never see partially written page
+            fd, tmp_path = tempfile.mkstemp(dir=self._cache_dir, prefix=".result-", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(dict(created=time.time(), result=result), f, separators=(",", ":"))
+
+                os.replace(tmp_path, self._path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            self._evict()
+        except OSError:
+            # caching is just an optimization, failure to store the page must not fail reading of the result
+            pass
+
+    def _evict(self) -> None:
+        entries = self._entries()
+
+        if len(entries) <= self._max_size:
+            return
+
+        def _mtime(path: Path) -> float:
+            try:
+                return path.stat().st_mtime
+            except FileNotFoundError:
+                return 0.0
+
+        for path in sorted(entries, key=_mtime)[: len(entries) - self._max_size]:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def invalidate(self) -> None:
+        for path in self._entries():
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def __len__(self) -> int:
+        return len(self._entries())
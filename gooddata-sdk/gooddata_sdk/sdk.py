@@ -3,10 +3,11 @@ from __future__ import annotations
 
 from typing import Optional
 
-from gooddata_sdk.catalog import CatalogService
-from gooddata_sdk.client import GoodDataApiClient
-from gooddata_sdk.compute import ComputeService
+from gooddata_sdk.catalog import DEFAULT_CATALOG_CACHE_SIZE, DEFAULT_CATALOG_CACHE_TTL, CatalogService
+from gooddata_sdk.client import CircuitBreaker, GoodDataApiClient, RetryPolicy, SocketOptions
+from gooddata_sdk.compute import DEFAULT_RESULT_ID_CACHE_TTL, ComputeService, PageSize
 from gooddata_sdk.insight import InsightService
+from gooddata_sdk.result_cache import ResultCache
 from gooddata_sdk.table import TableService
 
 
@@ -19,6 +20,17 @@ class GoodDataSdk:
         host_: str,
         token_: str,
         extra_user_agent_: Optional[str] = None,
+        connection_pool_size_: Optional[int] = None,
+        keep_alive_: bool = True,
+        socket_options_: Optional[SocketOptions] = None,
+        compression_: bool = False,
+        retry_policy_: Optional[RetryPolicy] = None,
+        circuit_breaker_: Optional[CircuitBreaker] = None,
+        http2_: bool = False,
+        result_cache_: Optional[ResultCache] = None,
+        result_id_cache_size_: int = 0,
+        result_id_cache_ttl_: Optional[float] = DEFAULT_RESULT_ID_CACHE_TTL,
+        page_size_: Optional[PageSize] = None,
         **custom_headers_: Optional[str],
     ) -> GoodDataSdk:
         """
@@ -26,24 +38,75 @@ class GoodDataSdk:
         Custom headers are filtered. Headers with None value are removed. It simplifies usage because headers
         can be created directly from optional values.
 
+        `connection_pool_size_`, `keep_alive_`, `socket_options_`, `compression_`, `retry_policy_`,
+        `circuit_breaker_` and `http2_` tweak connections to the host, see `GoodDataApiClient`. `result_cache_`
+        enables caching of execution results, `result_id_cache_size_` and `result_id_cache_ttl_` enable reuse of
+        already computed results, see `ComputeService`. `page_size_` sets size of result pages, see `AdaptivePaging`.
+
         This is preferred way of creating GoodDataSdk, when no tweaks are needed.
         """
         filtered_headers = {key: value for key, value in custom_headers_.items() if value is not None}
-        client = GoodDataApiClient(host_, token_, custom_headers=filtered_headers, extra_user_agent=extra_user_agent_)
-        return cls(client)
+        client = GoodDataApiClient(
+            host_,
+            token_,
+            custom_headers=filtered_headers,
+            extra_user_agent=extra_user_agent_,
+            connection_pool_size=connection_pool_size_,
+            keep_alive=keep_alive_,
+            socket_options=socket_options_,
+            compression=compression_,
+            retry_policy=retry_policy_,
+            circuit_breaker=circuit_breaker_,
+            http2=http2_,
+        )
+        return cls(
+            client,
+            result_cache=result_cache_,
+            result_id_cache_size=result_id_cache_size_,
+            result_id_cache_ttl=result_id_cache_ttl_,
+            page_size=page_size_,
+        )
 
-    def __init__(self, client: GoodDataApiClient) -> None:
+    def __init__(
+        self,
+        client: GoodDataApiClient,
+        catalog_cache_ttl: Optional[float] = DEFAULT_CATALOG_CACHE_TTL,
+        catalog_cache_size: int = DEFAULT_CATALOG_CACHE_SIZE,
+        catalog_load_workers: Optional[int] = None,
+        result_cache: Optional[ResultCache] = None,
+        result_id_cache_size: int = 0,
+        result_id_cache_ttl: Optional[float] = DEFAULT_RESULT_ID_CACHE_TTL,
+        page_size: Optional[PageSize] = None,
+    ) -> None:
         """Take instance of GoodDataApiClient and return new GoodDataSdk instance.
 
         Useful when customized GoodDataApiClient is needed. Usually users should use
         `GoodDataSdk.create` classmethod.
+
+        `catalog_cache_ttl` and `catalog_cache_size` tweak caching of workspace catalogs and `catalog_load_workers`
+        tweaks how many threads are used to load them, see `CatalogService`. `result_cache` is shared by compute
+        and table services to cache pages of execution results, `result_id_cache_size` and `result_id_cache_ttl`
+        tweak reuse of already computed results, see `ComputeService`. `page_size` sets size of result pages
+        (fixed or adaptive, see `AdaptivePaging`) read by table service and by components built on top of the SDK.
         """
         self._client = client
 
-        self._catalog = CatalogService(self._client)
-        self._compute = ComputeService(self._client)
+        self._catalog = CatalogService(
+            self._client,
+            catalog_cache_ttl=catalog_cache_ttl,
+            catalog_cache_size=catalog_cache_size,
+            catalog_load_workers=catalog_load_workers,
+        )
+        self._compute = ComputeService(
+            self._client,
+            result_cache=result_cache,
+            result_id_cache_size=result_id_cache_size,
+            result_id_cache_ttl=result_id_cache_ttl,
+            page_size=page_size,
+        )
         self._insights = InsightService(self._client)
-        self._tables = TableService(self._client)
+        # tables compute through the same service, so that results computed by either of them are reused by both
+        self._tables = TableService(self._client, page_size=page_size, compute_service=self._compute)
 
     @property
     def catalog(self) -> CatalogService:
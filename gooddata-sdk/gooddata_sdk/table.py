@@ -1,47 +1,44 @@
 # (C) 2021 GoodData Corporation
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Generator, Optional, Union
 
 from gooddata_sdk.client import GoodDataApiClient
-from gooddata_sdk.compute import ComputeService, ExecutionDefinition, ExecutionResponse, ExecutionResult
-from gooddata_sdk.compute_model import Attribute, Filter, Metric
+from gooddata_sdk.compute import (
+    DEFAULT_RESULT_ID_CACHE_TTL,
+    ComputeService,
+    ExecutionDefinition,
+    ExecutionResponse,
+    ExecutionResult,
+    PageSize,
+    PageSizer,
+)
+from gooddata_sdk.compute_model import Attribute, Filter, Metric, SortKey
 from gooddata_sdk.insight import Insight
+from gooddata_sdk.result_cache import ResultCache
 
 _TABLE_ROW_BATCH_SIZE = 512
 """
-Number of rows that the code reads from backed at once.
+Number of rows that the code reads from backed at once, unless configured otherwise.
 """
 
 _MAX_METRICS = 256
 """
-Maximum number of metrics that this code is prepared to handle. This is to simplify the paging business - so that
-code only pages 'down' across one (row) dimension.
+Maximum number of metrics that the code reads from backend at once. Pages of results with more metrics are read in
+tiles which are then stitched together, so that code can keep paging only 'down' across one (row) dimension.
 """
 
 
-class ExecutionTable:
+class _BaseExecutionTable:
     """
-    Represents execution result as a table. This is a convenience wrapper for executions constructed using
-    the following convention:
-
-    -  all attributes are in the first dimension
-    -  all metrics are in the second dimension
-    -  if the execution is attribute- or metric-less, then there is always single dimension
-
-    The mapping to rows is then as follows:
-
-    -  both attributes + metrics are on the execution = iteration over first dimension; as many rows as total records
-       in the first dimension (paging.total[0])
-    -  just attributes = iteration over just headers in first dimension; as many rows as total records in the
-       first dimension (paging.total[0])
-    -  just metrics = single row, all metrics values returned in one row
-
+    Contains logic shared by synchronous and asynchronous execution tables: the table layout and conversion of
+    result pages into rows and columns. The subclasses take care of reading the pages.
     """
 
-    def __init__(self, response: ExecutionResponse, first_page: ExecutionResult) -> None:
-        self._exec_def = response.exec_def
-        self._response = response
+    def __init__(self, exec_def: ExecutionDefinition, first_page: ExecutionResult) -> None:
+        self._exec_def = exec_def
         self._first_page = first_page
         self._pages = [first_page]
 
@@ -71,29 +68,15 @@ class ExecutionTable:
         """
         return {**{a.local_id: a for a in self.attributes}, **{m.local_id: m for m in self.metrics}}
 
-    def _read_next_page(self) -> bool:
-        if not self._exec_def.has_attributes():
-            # result without attributes has just one row with all the metrics, there is no next page to load
-            return False
-
-        last_loaded = self._pages[-1]
-        offset = last_loaded.paging_offset
-        count = last_loaded.paging_count
-        total = last_loaded.paging_total
-
-        # no more data on the backend, bail out
-        if offset[0] + count[0] >= total[0]:
-            return False
-
-        next_offset = [offset[0] + count[0]] + offset[1:]
+    @staticmethod
+    def _next_page_paging(
+        last_loaded: ExecutionResult, start: int, size: int = _TABLE_ROW_BATCH_SIZE
+    ) -> tuple[list[int], list[int]]:
+        next_offset = [start] + last_loaded.paging_offset[1:]
         # backend is smart enough to cap if the limit is greater than number of remaining rows
-        next_limit = [_TABLE_ROW_BATCH_SIZE] + count[1:]
-
-        next_page = self._response.read_result(offset=next_offset, limit=next_limit)
+        next_limit = [size] + last_loaded.paging_count[1:]
 
-        self._pages.append(next_page)
-
-        return True
+        return next_offset, next_limit
 
     def _read_all_metrics_in_one_row(self) -> Generator[dict[str, Any], None, None]:
         data = self._first_page.data
@@ -101,46 +84,25 @@ class ExecutionTable:
 
         yield dict(zip(cols, data))
 
-    def _read_all_paged(self) -> Generator[dict[str, Any], None, None]:
-        page_idx = 0
+    def _read_all_metrics_in_one_batch(self) -> Generator[dict[str, list[Any]], None, None]:
+        columns = self._first_page.get_all_data_columns(0)
         cols = self.column_ids
 
-        while page_idx < len(self._pages):
-            page = self._pages[page_idx]
-            attribute_headers = page.headers[0]
-            data = page.data
-            paging = page.paging
-            page_row_idx = 0
-
-            # yield all data from current page
-            while page_row_idx < paging["count"][0]:
-                headers = [
-                    header["headers"][page_row_idx]["attributeHeader"]["labelValue"]
-                    for header in attribute_headers["headerGroups"]
-                ]
-                metric_data = data[page_row_idx] if self._exec_def.has_metrics() else []
-
-                yield dict(zip(cols, headers + metric_data))
-                page_row_idx += 1
+        yield dict(zip(cols, columns))
 
-            # try to read next page of data. False means the end was reached so just bail out
-            if not self._read_next_page():
-                break
+    def _read_page_columns(self, page: ExecutionResult) -> list[list[Any]]:
+        columns = page.get_all_header_columns(0)
 
-            # otherwise the self._pages was updated so go on with next page
-            page_idx += 1
+        if self._exec_def.has_metrics():
+            columns += page.get_all_data_columns(1)
 
-    def read_all(self) -> Generator[dict[str, Any], None, None]:
-        """
-        Returns a generator that will be yielding execution result as rows. Each row is a dict() mapping column
-        identifier to value of that column.
+        return columns
 
-        :return: generator yielding dict() representing rows of the table
-        """
-        if not self._exec_def.has_attributes():
-            return self._read_all_metrics_in_one_row()
+    def _read_page_rows(self, page: ExecutionResult) -> Generator[dict[str, Any], None, None]:
+        cols = self.column_ids
 
-        return self._read_all_paged()
+        for values in zip(*self._read_page_columns(page)):
+            yield dict(zip(cols, values))
 
     def __len__(self) -> int:
         if self._exec_def.has_attributes():
@@ -156,37 +118,248 @@ class ExecutionTable:
     def __str__(self) -> str:
         return self.__repr__()
 
+
+class ExecutionTable(_BaseExecutionTable):
+    """
+    Represents execution result as a table. This is a convenience wrapper for executions constructed using
+    the following convention:
+
+    -  all attributes are in the first dimension
+    -  all metrics are in the second dimension
+    -  if the execution is attribute- or metric-less, then there is always single dimension
+
+    The mapping to rows is then as follows:
+
+    -  both attributes + metrics are on the execution = iteration over first dimension; as many rows as total records
+       in the first dimension (paging.total[0])
+    -  just attributes = iteration over just headers in first dimension; as many rows as total records in the
+       first dimension (paging.total[0])
+    -  just metrics = single row, all metrics values returned in one row
+
+    """
+
+    def __init__(
+        self, response: ExecutionResponse, first_page: ExecutionResult, page_sizer: Optional[PageSizer] = None
+    ) -> None:
+        """
+        :param response: execution response to read the pages from
+        :param first_page: first page of the result, already read
+        :param page_sizer: optionally specify sizer that determines size of the pages read by the table; by default,
+            pages have fixed size
+        """
+        super(ExecutionTable, self).__init__(response.exec_def, first_page)
+        self._response = response
+        self._page_sizer = page_sizer or PageSizer(_TABLE_ROW_BATCH_SIZE)
+
+    def _read_page_after(self, last_loaded: ExecutionResult, sizer: PageSizer) -> ExecutionResult:
+        next_offset, next_limit = self._next_page_paging(last_loaded, last_loaded.next_page_start(), sizer.size)
+
+        return sizer.read(
+            self._response, offset=next_offset, limit=next_limit, tile_limit=_tile_limit(self._exec_def, next_limit)
+        )
+
+    def _read_remaining_pages(
+        self, last_loaded: ExecutionResult, sizer: PageSizer
+    ) -> Generator[ExecutionResult, None, None]:
+        page = last_loaded
+
+        while not page.is_complete():
+            page = self._read_page_after(page, sizer)
+
+            yield page
+
+    def _read_remaining_pages_prefetched(
+        self, last_loaded: ExecutionResult, prefetch_pages: int, sizer: PageSizer
+    ) -> Generator[ExecutionResult, None, None]:
+        """
+        Yields pages in order while keeping up to `prefetch_pages` page reads in flight on a pool of worker threads.
+
+        Offsets of all the remaining pages are known from the total number of rows reported in the paging of the last
+        loaded page and from sizes of the pages requested so far, so the reads do not have to wait for each other.
+        """
+        next_start = last_loaded.next_page_start()
+        total = last_loaded.paging_total[0]
+
+        pool = ThreadPoolExecutor(max_workers=prefetch_pages)
+        in_flight: deque = deque()
+
+        def _submit_next() -> None:
+            nonlocal next_start
+
+            if next_start < total:
+                offset, limit = self._next_page_paging(last_loaded, next_start, sizer.size)
+                next_start += limit[0]
+                tile_limit = _tile_limit(self._exec_def, limit)
+                in_flight.append(pool.submit(sizer.read, self._response, offset, limit, tile_limit=tile_limit))
+
+        try:
+            for _ in range(prefetch_pages):
+                _submit_next()
+
+            while in_flight:
+                page = in_flight.popleft().result()
+                _submit_next()
+
+                yield page
+        finally:
+            # reading may be abandoned half-way (e.g. consumer stopped iterating); do not wait for pages nobody needs
+            for future in in_flight:
+                future.cancel()
+
+            pool.shutdown(wait=False)
+
+    def _read_pages(
+        self, prefetch_pages: int, replayable: bool, page_size: Optional[PageSize]
+    ) -> Generator[ExecutionResult, None, None]:
+        # in replayable mode all pages loaded so far are kept and served again; otherwise only the first page is
+        # retained (it is needed anyway to determine the table length) and every other page is read from backend
+        # and dropped as soon as the consumer moves on
+        loaded = list(self._pages) if replayable else [self._first_page]
+        yield from loaded
+
+        last_loaded = loaded[-1]
+        sizer = PageSizer(page_size) if page_size is not None else self._page_sizer
+
+        if prefetch_pages > 0:
+            remaining = self._read_remaining_pages_prefetched(last_loaded, prefetch_pages, sizer)
+        else:
+            remaining = self._read_remaining_pages(last_loaded, sizer)
+
+        for page in remaining:
+            if replayable:
+                self._pages.append(page)
+
+            yield page
+
+    def _read_all_paged(
+        self, prefetch_pages: int, replayable: bool, page_size: Optional[PageSize]
+    ) -> Generator[dict[str, Any], None, None]:
+        for page in self._read_pages(prefetch_pages, replayable, page_size):
+            yield from self._read_page_rows(page)
+
+    def _read_all_paged_columns(
+        self, prefetch_pages: int, replayable: bool, page_size: Optional[PageSize]
+    ) -> Generator[dict[str, list[Any]], None, None]:
+        cols = self.column_ids
+
+        for page in self._read_pages(prefetch_pages, replayable, page_size):
+            yield dict(zip(cols, self._read_page_columns(page)))
+
+    def read_all(
+        self, prefetch_pages: int = 0, replayable: bool = False, page_size: Optional[PageSize] = None
+    ) -> Generator[dict[str, Any], None, None]:
+        """
+        Returns a generator that will be yielding execution result as rows. Each row is a dict() mapping column
+        identifier to value of that column.
+
+        By default, the table streams the result: pages are read from backend as the rows are consumed and are
+        dropped once their rows were yielded so memory stays bounded regardless of the result size. Iterating
+        the table again reads the pages from backend again.
+
+        :param prefetch_pages: optionally specify number of pages to read ahead in parallel; the pages are read
+            using a pool of worker threads and rows are still yielded in order. Default is 0 = pages are read
+            one after another, each only once the previous one is fully consumed.
+        :param replayable: optionally keep all pages loaded by this and any previous replayable iteration in memory;
+            subsequent replayable iterations serve rows from memory and read only pages that were not yet loaded.
+            Default is False = stream the result.
+        :param page_size: optionally specify size of the pages to read: either fixed number of rows or adaptive
+            paging, see `AdaptivePaging`. Default is None = use page size configured on the TableService.
+        :return: generator yielding dict() representing rows of the table
+        """
+        if not self._exec_def.has_attributes():
+            return self._read_all_metrics_in_one_row()
+
+        return self._read_all_paged(prefetch_pages, replayable, page_size)
+
+    def read_all_columns(
+        self, prefetch_pages: int = 0, replayable: bool = False, page_size: Optional[PageSize] = None
+    ) -> Generator[dict[str, list[Any]], None, None]:
+        """
+        Returns a generator that will be yielding execution result in a columnar fashion, one batch per page of
+        the result. Each batch is a dict() mapping column identifier to a list with values of that column.
+
+        This is more efficient than `read_all` when the consumer anyway needs to work with whole columns as
+        there is no need to construct dict() for each row.
+
+        :param prefetch_pages: see `read_all`
+        :param replayable: see `read_all`
+        :param page_size: see `read_all`
+        :return: generator yielding dict() representing batches of columns
+        """
+        if not self._exec_def.has_attributes():
+            return self._read_all_metrics_in_one_batch()
+
+        return self._read_all_paged_columns(prefetch_pages, replayable, page_size)
+
     def __repr__(self) -> str:
         return f"ExecutionTable(response={self._response}, columns={self.column_ids}, rows={len(self)})"
 
 
 def _prepare_tabular_definition(
-    attributes: list[Attribute], filters: list[Filter], metrics: list[Metric]
+    attributes: list[Attribute],
+    filters: list[Filter],
+    metrics: list[Metric],
+    sorts: Optional[list[SortKey]] = None,
 ) -> ExecutionDefinition:
     dims = [
         [a.local_id for a in attributes] if len(attributes) else None,
         ["measureGroup"] if len(metrics) else None,
     ]
+    # without attributes, there is at most one row - nothing to sort
+    sorts = sorts if len(attributes) else None
+
+    return ExecutionDefinition(attributes=attributes, metrics=metrics, filters=filters, dimensions=dims, sorts=sorts)
 
-    return ExecutionDefinition(attributes=attributes, metrics=metrics, filters=filters, dimensions=dims)
 
+def _split_items(items: list[Union[Attribute, Metric]]) -> tuple[list[Attribute], list[Metric]]:
+    attributes: list[Attribute] = []
+    metrics: list[Metric] = []
+
+    for item in items:
+        if isinstance(item, Attribute):
+            attributes.append(item)
+        elif isinstance(item, Metric):
+            metrics.append(item)
+        else:
+            raise ValueError(f"Invalid input item: {item}. Expecting instance of Attribute or Metric")
 
-def _as_table(response: ExecutionResponse) -> ExecutionTable:
+    return attributes, metrics
+
+
+def _first_page_paging(exec_def: ExecutionDefinition, size: int = _TABLE_ROW_BATCH_SIZE) -> tuple[list[int], list[int]]:
     first_page_offset = [0, 0]
-    first_page_limit = [_TABLE_ROW_BATCH_SIZE, _MAX_METRICS]
+    # backend caps the limit to the number of metrics; when there are more metrics than can be read at once,
+    # the pages are read in tiles
+    first_page_limit = [size, max(len(exec_def.metrics), _MAX_METRICS)]
 
-    if not response.exec_def.has_attributes():
+    if not exec_def.has_attributes():
         # there are no attributes, there shall be at most one row with the metrics, so get that as first page
         first_page_limit = [first_page_limit[1]]
         first_page_offset = [0]
-    elif not response.exec_def.has_metrics():
+    elif not exec_def.has_metrics():
         # there are no metrics; there may be many attribute headers
         first_page_limit = [first_page_limit[0]]
         first_page_offset = [0]
 
-    first_page = response.read_result(offset=first_page_offset, limit=first_page_limit)
+    return first_page_offset, first_page_limit
+
 
-    return ExecutionTable(response=response, first_page=first_page)
+def _tile_limit(exec_def: ExecutionDefinition, limit: list[int]) -> list[int]:
+    # page spans single band of rows, only the metrics - always in the last dimension - may need to be read in tiles
+    return limit[:-1] + [_MAX_METRICS] if exec_def.has_metrics() else limit
+
+
+def _as_table(response: ExecutionResponse, page_size: PageSize) -> ExecutionTable:
+    sizer = PageSizer(page_size)
+    first_page_offset, first_page_limit = _first_page_paging(response.exec_def, sizer.size)
+    first_page = sizer.read(
+        response,
+        offset=first_page_offset,
+        limit=first_page_limit,
+        tile_limit=_tile_limit(response.exec_def, first_page_limit),
+    )
+
+    return ExecutionTable(response=response, first_page=first_page, page_sizer=sizer)
 
 
 class TableService:
@@ -197,10 +370,47 @@ class TableService:
     do not have to have to work with execution response, access the data using paging.
 
     The ExecutionTable returned by the TableService allows you to iterate over the rows of the calculated data.
+    Pages of the tables are served from the optional result cache and results of identical computations are reused
+    when remembering of result ids is enabled, see `ComputeService`.
+
+    The tables read result in pages of fixed size by default; use `page_size` to change the size or to enable
+    adaptive paging (see `AdaptivePaging`) for all the tables or specify it when reading particular table.
     """
 
-    def __init__(self, api_client: GoodDataApiClient) -> None:
-        self._compute = ComputeService(api_client)
+    def __init__(
+        self,
+        api_client: GoodDataApiClient,
+        result_cache: Optional[ResultCache] = None,
+        result_id_cache_size: int = 0,
+        result_id_cache_ttl: Optional[float] = DEFAULT_RESULT_ID_CACHE_TTL,
+        page_size: Optional[PageSize] = None,
+        compute_service: Optional[ComputeService] = None,
+    ) -> None:
+        """
+        :param api_client: client to use
+        :param result_cache: see `ComputeService`
+        :param result_id_cache_size: see `ComputeService`
+        :param result_id_cache_ttl: see `ComputeService`
+        :param page_size: optionally specify default size of result pages: fixed number of rows or adaptive paging
+        :param compute_service: optionally specify compute service to start computations with, so that it is shared
+            with other components; result cache and result ids are then those of the compute service and the
+            parameters above are ignored
+        """
+        if compute_service is None:
+            compute_service = ComputeService(
+                api_client,
+                result_cache=result_cache,
+                result_id_cache_size=result_id_cache_size,
+                result_id_cache_ttl=result_id_cache_ttl,
+                page_size=page_size,
+            )
+
+        self._compute = compute_service
+        self._page_size = page_size if page_size is not None else _TABLE_ROW_BATCH_SIZE
+
+    @property
+    def page_size(self) -> PageSize:
+        return self._page_size
 
     def for_insight(self, workspace_id: str, insight: Insight) -> ExecutionTable:
         exec_def = _prepare_tabular_definition(
@@ -211,26 +421,29 @@ class TableService:
 
         response = self._compute.for_exec_def(workspace_id=workspace_id, exec_def=exec_def)
 
-        return _as_table(response)
+        return _as_table(response, self._page_size)
 
     def for_items(
-        self, workspace_id: str, items: list[Union[Attribute, Metric]], filters: Optional[list[Filter]] = None
+        self,
+        workspace_id: str,
+        items: list[Union[Attribute, Metric]],
+        filters: Optional[list[Filter]] = None,
+        sorts: Optional[list[SortKey]] = None,
     ) -> ExecutionTable:
+        """
+        Computes table with the given items.
+
+        :param workspace_id: workspace identifier
+        :param items: attributes and metrics to compute, attributes are in rows and metrics in columns
+        :param filters: optionally specify filters to apply
+        :param sorts: optionally specify sort keys that order rows of the table
+        :return: execution table
+        """
         if filters is None:
             filters = []
 
-        attributes: list[Attribute] = []
-        metrics: list[Metric] = []
-
-        for item in items:
-            if isinstance(item, Attribute):
-                attributes.append(item)
-            elif isinstance(item, Metric):
-                metrics.append(item)
-            else:
-                raise ValueError(f"Invalid input item: {item}. Expecting instance of Attribute or Metric")
-
-        exec_def = _prepare_tabular_definition(attributes=attributes, metrics=metrics, filters=filters)
+        attributes, metrics = _split_items(items)
+        exec_def = _prepare_tabular_definition(attributes=attributes, metrics=metrics, filters=filters, sorts=sorts)
         response = self._compute.for_exec_def(workspace_id=workspace_id, exec_def=exec_def)
 
-        return _as_table(response)
+        return _as_table(response, self._page_size)
@@ -16,11 +16,20 @@ class Converter:
     DEFAULT_DB_DATA_TYPE = "VARCHAR(255)"
 
     _EXTERNAL_CONVERSION_FNC: Optional[Callable[[object, Any], Any]] = None
+    _EXTERNAL_BATCH_CONVERSION_FNC: Optional[Callable[[object, list[str]], Any]] = None
 
     @classmethod
     def set_external_fnc(cls, fnc: Callable[[object, Any], Any]) -> None:
         cls._EXTERNAL_CONVERSION_FNC = fnc
 
+    @classmethod
+    def set_external_batch_fnc(cls, fnc: Callable[[object, list[str]], Any]) -> None:
+        """
+        Plug-in function that converts whole batch of values at once. Unlike the function set by `set_external_fnc`,
+        the batch function gets the raw string values so that it can parse them in a vectorized fashion.
+        """
+        cls._EXTERNAL_BATCH_CONVERSION_FNC = fnc
+
     def to_type(self, value: str) -> Any:
         raise NotImplementedError
 
@@ -31,6 +40,19 @@ class Converter:
         else:
             return typed_value
 
+    def to_external_type_batch(self, values: list[str]) -> Any:
+        """
+        Convert batch of values. If external batch conversion function is set, it is used to convert all the values
+        at once. Otherwise, the values are converted one-by-one using `to_external_type`.
+
+        :param values: list of values to convert
+        :return: converted values; list or sequence-like object returned by the external batch function
+        """
+        if self._EXTERNAL_BATCH_CONVERSION_FNC:
+            return self._EXTERNAL_BATCH_CONVERSION_FNC(values)  # type: ignore
+        else:
+            return [self.to_external_type(value) for value in values]
+
     def db_data_type(self) -> str:
         raise NotImplementedError
 
@@ -73,6 +95,15 @@ class DateConverter(Converter):
         int_parts.extend([1] * missing_count)
         return int_parts
 
+    @staticmethod
+    def to_date_format(value: str) -> str:
+        """Return strptime format of (possibly incomplete) iso date string.
+
+        >>> assert DateConverter.to_date_format("2021-01") == "%Y-%m"
+        >>> assert DateConverter.to_date_format("1992") == "%Y"
+        """
+        return "-".join(["%Y", "%m", "%d"][: len(value.split("-"))])
+
     @classmethod
     def to_date(cls, value: str) -> date:
         """Add first month and first date to incomplete iso date string.
@@ -100,6 +131,15 @@ class DatetimeConverter(Converter):
         """
         return parse(cls._sanitize_timestamp(value))
 
+    @staticmethod
+    def to_datetime_format(value: str) -> str:
+        """Return strptime format of (possibly incomplete) datetime string.
+
+        >>> assert DatetimeConverter.to_datetime_format("2021-01-01 02") == "%Y-%m-%d %H"
+        >>> assert DatetimeConverter.to_datetime_format("2021-01-01 12:34") == "%Y-%m-%d %H:%M"
+        """
+        return "%Y-%m-%d %H" if len(value.split(":")) == 1 else "%Y-%m-%d %H:%M"
+
     @staticmethod
     def _sanitize_timestamp(value: str) -> str:
         """Append minutes to incomplete datetime string.
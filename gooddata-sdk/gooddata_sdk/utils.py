@@ -2,11 +2,23 @@
 from __future__ import annotations
 
 import functools
-from typing import Any, Dict, NamedTuple, Union, cast
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Union, cast
 
 from gooddata_metadata_client import ApiAttributeError
 from gooddata_sdk.compute_model import ObjId
 
+try:
+    import orjson
+
+    _json_loads: Callable[[Union[bytes, str]], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Use typing collection types to support python < py3.9
 IdObjType = Union[str, ObjId, Dict[str, Dict[str, str]], Dict[str, str]]
 
@@ -50,18 +62,45 @@ def id_obj_to_key(id_obj: IdObjType) -> str:
     return f"{unwrapped['type']}/{unwrapped['id']}"
 
 
+def load_json(raw: Union[bytes, str]) -> Any:
+    """
+    Parses JSON document into plain python structures. Uses orjson if it is installed, otherwise falls back to
+    the standard json module.
+
+    :param raw: JSON document
+    :return: parsed document
+    """
+    return _json_loads(raw)
+
+
 class AllPagedEntities(NamedTuple):
     data: list[Any]
     included: list[Any]
 
 
 # Use functools.partial instead of Protocol because Protocol is available starting by py3.8
-def load_all_entities(get_page_func: functools.partial[Any], page_size: int = 500) -> AllPagedEntities:
+def _append_page(all_paged_entities: AllPagedEntities, result: Any) -> None:
+    all_paged_entities.data.extend(result.data)
+
+    try:
+        all_paged_entities.included.extend(result.included)
+    except ApiAttributeError:
+        pass
+
+
+def load_all_entities(
+    get_page_func: functools.partial[Any], page_size: int = 500, parallel_pages: int = 0
+) -> AllPagedEntities:
     """
     Loads all entities from a paged resource. The primary input to this function is a partial function that is setup
     with all the fixed parameters. Given this the function will get entities page-by-page and merge them into a single
     'pseudo-response' containing data and included attributes.
 
+    The paged resources do not report total number of entities. When `parallel_pages` is specified, the function
+    reads the first page and if it is full, it speculatively requests the next `parallel_pages` pages concurrently
+    and continues like that until it finds the last page. Pages are always merged in order. Note that this may
+    issue few requests for pages beyond the last one; these come back empty and are ignored.
+
     An example usage:
 
     >>> import functools
@@ -74,27 +113,53 @@ def load_all_entities(get_page_func: functools.partial[Any], page_size: int = 50
 
     :param get_page_func: an API controller from the metadata client
     :param page_size: optionally specify page length, default is 500
+    :param parallel_pages: optionally specify number of pages to request concurrently after the first page,
+     default is 0 - pages are requested one-by-one
     :return:
     """
     all_paged_entities = AllPagedEntities(data=[], included=[])
-    current_page = 0
 
-    while True:
-        result = get_page_func(page=current_page, size=page_size)
+    result = get_page_func(page=0, size=page_size)
+    _append_page(all_paged_entities, result)
+
+    if len(result.data) < page_size:
+        return all_paged_entities
+
+    if parallel_pages <= 0:
+        current_page = 1
+
+        while True:
+            result = get_page_func(page=current_page, size=page_size)
+            _append_page(all_paged_entities, result)
 
-        all_paged_entities.data.extend(result.data)
+            if len(result.data) < page_size:
+                break
 
-        try:
-            all_paged_entities.included.extend(result.included)
-        except ApiAttributeError:
-            pass
+            current_page += 1
 
-        if len(result.data) < page_size:
-            break
+        return all_paged_entities
 
-        current_page += 1
+    with ThreadPoolExecutor(max_workers=parallel_pages, thread_name_prefix="gooddata-entities") as pool:
+        next_page = 1
 
-    return all_paged_entities
+        while True:
+            futures = [
+                pool.submit(get_page_func, page=page, size=page_size)
+                for page in range(next_page, next_page + parallel_pages)
+            ]
+
+            try:
+                for future in futures:
+                    result = future.result()
+                    _append_page(all_paged_entities, result)
+
+                    if len(result.data) < page_size:
+                        return all_paged_entities
+            finally:
+                for future in futures:
+                    future.cancel()
+
+            next_page += parallel_pages
 
 
 class SideLoads:
@@ -120,3 +185,78 @@ class SideLoads:
 
     def __len__(self) -> int:
         return len(self._objects)
+
+
+class TtlCache:
+    """
+    Thread-safe cache with bounded size and optional time-to-live of the entries. When the cache is full, the least
+    recently used entry is evicted.
+    """
+
+    def __init__(self, max_size: int, ttl: Optional[float] = None) -> None:
+        """
+        :param max_size: maximum number of entries in the cache; 0 disables caching
+        :param ttl: optionally specify number of seconds after which the entry expires; None = entries never expire
+        """
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def ttl(self) -> Optional[float]:
+        return self._ttl
+
+    def _is_expired(self, stored_at: float) -> bool:
+        return self._ttl is not None and time.monotonic() - stored_at >= self._ttl
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        :param key: cache key
+        :return: cached value or None if there is no such entry or the entry expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            stored_at, value = entry
+
+            if self._is_expired(stored_at):
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self._max_size <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Removes entry from the cache.
+
+        :param key: key of entry to remove; if not specified, all entries are removed
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -12,6 +12,7 @@ REQUIRES = [
     "gooddata-scan-client~=0.6.0",
     'importlib-metadata >= 1.0 ; python_version < "3.8"',
     "python-dateutil>=2.5.3",
+    "urllib3>=1.26.0",
 ]
 
 
@@ -27,6 +28,11 @@ setup(
     license_file="LICENSE.txt",
     license_files=("LICENSE.txt",),
     install_requires=REQUIRES,
+    extras_require={
+        "async": ["aiohttp>=3.7"],
+        "compression": ["urllib3[brotli]>=1.26.0"],
+        "http2": ["httpx[http2]>=0.26.0"],
+    },
     packages=find_packages(exclude=["tests"]),
     python_requires=">=3.7.0",
     project_urls={
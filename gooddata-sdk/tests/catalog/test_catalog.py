@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import os
 
+import pytest
 import vcr
+from vcr.errors import CannotOverwriteExistingCassetteException
 
 from gooddata_sdk import GoodDataSdk
 from tests import TEST_HOST, TEST_WORKSPACE, test_token
@@ -30,6 +32,88 @@ def test_catalog_load():
     assert catalog.get_dataset("coverage_cancelled_date") is not None
 
 
+@gd_vcr.use_cassette(os.path.join(_fixtures_dir, "insurance_demo_catalog.json"))
+def test_catalog_lookups():
+    sdk = GoodDataSdk.create(host_=TEST_HOST, token_=test_token())
+    catalog = sdk.catalog.get_full_catalog(TEST_WORKSPACE)
+
+    for dataset in catalog.datasets:
+        for attribute in dataset.attributes:
+            assert catalog.get_attribute(attribute.obj_id) is attribute
+            assert catalog.get_attribute(attribute.id) is attribute
+
+            for label in attribute.labels:
+                assert catalog.get_label(label.id) is label
+                assert catalog.find_label_attribute(label.obj_id) is attribute
+                assert catalog.find_label_attribute(f"label/{label.id}") is attribute
+                assert dataset.find_label_attribute(label.obj_id) is attribute
+
+        for fact in dataset.facts:
+            assert catalog.get_fact(fact.obj_id) is fact
+            assert catalog.get_fact(f"fact/{fact.id}") is fact
+
+    assert catalog.get_attribute("nonexistent") is None
+    assert catalog.get_fact("nonexistent") is None
+    assert catalog.get_label("nonexistent") is None
+    assert catalog.find_label_attribute("label/nonexistent") is None
+
+
+@gd_vcr.use_cassette(os.path.join(_fixtures_dir, "insurance_demo_catalog.json"))
+def test_catalog_load_cached():
+    sdk = GoodDataSdk.create(host_=TEST_HOST, token_=test_token())
+    catalog = sdk.catalog.get_full_catalog(TEST_WORKSPACE)
+
+    # recording contains the catalog requests just once; second call must be served from the cache
+    assert sdk.catalog.get_full_catalog(TEST_WORKSPACE) is catalog
+
+    sdk.catalog.invalidate_catalog_cache(TEST_WORKSPACE)
+    with pytest.raises(CannotOverwriteExistingCassetteException):
+        sdk.catalog.get_full_catalog(TEST_WORKSPACE)
+
+
+@gd_vcr.use_cassette(os.path.join(_fixtures_dir, "insurance_demo_catalog.json"))
+def test_catalog_snapshot(tmp_path):
+    sdk = GoodDataSdk.create(host_=TEST_HOST, token_=test_token())
+    catalog = sdk.catalog.get_full_catalog(TEST_WORKSPACE, cache_dir=tmp_path)
+
+    # recording contains the catalog requests just once; fresh sdk must load the catalog from the snapshot
+    other_sdk = GoodDataSdk.create(host_=TEST_HOST, token_=test_token())
+    restored = other_sdk.catalog.get_full_catalog(TEST_WORKSPACE, cache_dir=tmp_path)
+
+    assert restored is not catalog
+    assert restored.as_snapshot() == catalog.as_snapshot()
+    assert str(restored) == str(catalog)
+    assert restored.get_dataset("region") is not None
+    assert restored.get_metric("claim-count") is not None
+
+    label = catalog.datasets[0].attributes[0].labels[0]
+    assert restored.find_label_attribute(label.obj_id).dataset.id == catalog.datasets[0].id
+
+    # snapshot of different host is not used
+    other_host_sdk = GoodDataSdk.create(host_="http://other-host:3000", token_=test_token())
+    with pytest.raises(CannotOverwriteExistingCassetteException):
+        other_host_sdk.catalog.get_full_catalog(TEST_WORKSPACE, cache_dir=tmp_path)
+
+    # dropped snapshot is not used
+    other_sdk.catalog.invalidate_catalog_cache(TEST_WORKSPACE, cache_dir=tmp_path)
+    assert list(tmp_path.glob("catalog-*.json")) == []
+    with pytest.raises(CannotOverwriteExistingCassetteException):
+        other_sdk.catalog.get_full_catalog(TEST_WORKSPACE, cache_dir=tmp_path)
+
+
+@gd_vcr.use_cassette(os.path.join(_fixtures_dir, "insurance_demo_catalog.json"))
+def test_catalog_snapshot_expired(tmp_path):
+    sdk = GoodDataSdk.create(host_=TEST_HOST, token_=test_token())
+    sdk.catalog.get_full_catalog(TEST_WORKSPACE, cache_dir=tmp_path)
+
+    (snapshot,) = tmp_path.glob("catalog-*.json")
+    os.utime(snapshot, (0, 0))
+
+    other_sdk = GoodDataSdk.create(host_=TEST_HOST, token_=test_token())
+    with pytest.raises(CannotOverwriteExistingCassetteException):
+        other_sdk.catalog.get_full_catalog(TEST_WORKSPACE, cache_dir=tmp_path)
+
+
 @gd_vcr.use_cassette(os.path.join(_fixtures_dir, "insurance_demo_catalog_availability.json"))
 def test_catalog_availability():
     sdk = GoodDataSdk.create(host_=TEST_HOST, token_=test_token())
@@ -0,0 +1,47 @@
+# (C) 2022 GoodData Corporation
+from __future__ import annotations
+
+import json
+import os
+
+import pytest
+
+from gooddata_sdk import Attribute, AttributeSortKey, ExecutionDefinition, MetricSortKey, ObjId, SimpleMetric
+
+_current_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def _scenario_to_snapshot_name(scenario: str):
+    return f"{scenario.replace(' ', '_')}.snapshot.json"
+
+
+_attribute = Attribute(local_id="local_id1", label="label.id")
+_simple_measure = SimpleMetric(local_id="local_id2", item=ObjId(type="metric", id="metric_id"))
+
+test_sort_keys = [
+    ["attribute sort key", [AttributeSortKey(_attribute, "DESC")]],
+    ["metric sort key", [MetricSortKey("local_id2", "DESC")]],
+    ["multiple sort keys", [MetricSortKey(_simple_measure), AttributeSortKey("local_id1")]],
+]
+
+
+@pytest.mark.parametrize("scenario,sorts", test_sort_keys)
+def test_sort_keys_to_api_model(scenario, sorts, snapshot):
+    # it is essential to define snapshot dir using absolute path, otherwise snapshots cannot be found when
+    # running in tox
+    snapshot.snapshot_dir = os.path.join(_current_dir, "sort_key")
+    exec_def = ExecutionDefinition([_attribute], [_simple_measure], None, [["local_id1"], ["measureGroup"]], sorts)
+
+    snapshot.assert_match(
+        json.dumps(exec_def.as_api_model().result_spec.to_dict(), indent=4, sort_keys=True),
+        _scenario_to_snapshot_name(scenario),
+    )
+
+
+def test_invalid_sort_keys():
+    with pytest.raises(ValueError):
+        AttributeSortKey("local_id1", "UP")
+
+    exec_def = ExecutionDefinition([_attribute], None, None, [["local_id1"]], [MetricSortKey("local_id2")])
+    with pytest.raises(ValueError):
+        exec_def.as_api_model()
@@ -0,0 +1,8 @@
+# (C) 2022 GoodData Corporation
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def sequential_catalog_load(monkeypatch):
+    # vcrpy cassettes cannot serve concurrent requests reliably; load catalogs sequentially during tests
+    monkeypatch.setattr("gooddata_sdk.catalog.DEFAULT_CATALOG_LOAD_WORKERS", 1)
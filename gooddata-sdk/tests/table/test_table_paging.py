@@ -0,0 +1,205 @@
+# (C) 2022 GoodData Corporation
+from __future__ import annotations
+
+import json
+import threading
+from typing import Any, Optional
+
+import pytest
+
+from gooddata_sdk import (
+    AdaptivePaging,
+    Attribute,
+    ExecutionDefinition,
+    ExecutionResult,
+    ExecutionTable,
+    ObjId,
+    SimpleMetric,
+)
+from gooddata_sdk.compute import PageSizer
+from gooddata_sdk.table import _TABLE_ROW_BATCH_SIZE
+
+_attribute = Attribute(local_id="attr1", label="region.region_name")
+_metric = SimpleMetric(local_id="metric1", item=ObjId(type="metric", id="claim-amount"))
+
+
+class FakeResponse:
+    """
+    Stands in for ExecutionResponse; serves result with `total_rows` rows of single attribute + single metric where
+    each row's attribute value is the row number as string and the metric value is the row number.
+    """
+
+    def __init__(self, total_rows: int) -> None:
+        self._total_rows = total_rows
+        self._lock = threading.Lock()
+        self.exec_def = ExecutionDefinition(
+            attributes=[_attribute], metrics=[_metric], filters=None, dimensions=[["attr1"], ["measureGroup"]]
+        )
+        self.reads: list[list[int]] = []
+        self.limits: list[int] = []
+
+    def read_result(self, limit: list[int], offset: Optional[list[int]] = None) -> ExecutionResult:
+        assert offset is not None
+        with self._lock:
+            self.reads.append(offset)
+            self.limits.append(limit[0])
+
+        start = offset[0]
+        end = min(start + limit[0], self._total_rows)
+        rows = list(range(start, end))
+
+        result: dict[str, Any] = dict(
+            data=[[row] for row in rows],
+            dimension_headers=[
+                dict(headerGroups=[dict(headers=[dict(attributeHeader=dict(labelValue=str(row))) for row in rows])]),
+                dict(headerGroups=[dict(headers=[dict(measureHeader=dict(order=0))])]),
+            ],
+            grand_totals=[],
+            paging=dict(offset=[start, 0], count=[len(rows), 1], total=[self._total_rows, 1]),
+        )
+
+        return ExecutionResult(result, payload_size=len(json.dumps(result)))
+
+
+def _create_table(total_rows: int) -> tuple[FakeResponse, ExecutionTable]:
+    response = FakeResponse(total_rows)
+    first_page = response.read_result(offset=[0, 0], limit=[_TABLE_ROW_BATCH_SIZE, 1])
+
+    return response, ExecutionTable(response=response, first_page=first_page)  # type: ignore
+
+
+@pytest.mark.parametrize("total_rows", [0, 10, _TABLE_ROW_BATCH_SIZE, 5 * _TABLE_ROW_BATCH_SIZE + 7])
+@pytest.mark.parametrize("prefetch_pages", [0, 1, 4])
+def test_read_all_in_order(total_rows, prefetch_pages):
+    response, table = _create_table(total_rows)
+
+    rows = list(table.read_all(prefetch_pages=prefetch_pages))
+
+    assert [row["attr1"] for row in rows] == [str(i) for i in range(total_rows)]
+    assert [row["metric1"] for row in rows] == list(range(total_rows))
+    # each page is read exactly once
+    assert sorted(o[0] for o in response.reads) == list(range(0, max(total_rows, 1), _TABLE_ROW_BATCH_SIZE))
+
+
+def test_read_all_prefetch_abandoned():
+    response, table = _create_table(20 * _TABLE_ROW_BATCH_SIZE)
+    rows = table.read_all(prefetch_pages=2)
+
+    for _ in range(_TABLE_ROW_BATCH_SIZE + 1):
+        next(rows)
+    rows.close()
+
+    # first page + at most the pages that were in flight when reading stopped
+    assert len(response.reads) <= 5
+
+
+@pytest.mark.parametrize("prefetch_pages", [0, 2])
+def test_read_all_streaming_drops_pages(prefetch_pages):
+    total_rows = 3 * _TABLE_ROW_BATCH_SIZE
+    response, table = _create_table(total_rows)
+
+    assert len(list(table.read_all(prefetch_pages=prefetch_pages))) == total_rows
+    assert len(table._pages) == 1
+
+    # second iteration reads the pages from backend again
+    assert len(list(table.read_all(prefetch_pages=prefetch_pages))) == total_rows
+    assert len(response.reads) == 1 + 2 * 2
+
+
+@pytest.mark.parametrize("prefetch_pages", [0, 2])
+def test_read_all_replayable(prefetch_pages):
+    total_rows = 3 * _TABLE_ROW_BATCH_SIZE
+    response, table = _create_table(total_rows)
+
+    first = list(table.read_all(prefetch_pages=prefetch_pages, replayable=True))
+    second = list(table.read_all(prefetch_pages=prefetch_pages, replayable=True))
+
+    assert first == second
+    assert len(first) == total_rows
+    assert len(table._pages) == 3
+    assert len(response.reads) == 3
+
+
+@pytest.mark.parametrize("prefetch_pages", [0, 2])
+def test_read_all_columns(prefetch_pages):
+    total_rows = 2 * _TABLE_ROW_BATCH_SIZE + 3
+    _, table = _create_table(total_rows)
+
+    batches = list(table.read_all_columns(prefetch_pages=prefetch_pages))
+
+    assert len(batches) == 3
+    assert sum((batch["attr1"] for batch in batches), []) == [str(i) for i in range(total_rows)]
+    assert sum((batch["metric1"] for batch in batches), []) == list(range(total_rows))
+
+
+def _page(rows: int, payload_size: Optional[int]) -> ExecutionResult:
+    return ExecutionResult(
+        dict(data=[], dimension_headers=[], grand_totals=[], paging=dict(offset=[0], count=[rows], total=[10**6])),
+        payload_size=payload_size,
+    )
+
+
+def test_page_sizer():
+    sizer = PageSizer(AdaptivePaging(initial_size=1000, min_size=100, max_size=4000, target_seconds=1.0))
+    assert sizer.size == 1000
+
+    # fast read, the size at most doubles
+    sizer.observe(_page(1000, 1000), 1000, 0.01)
+    assert sizer.size == 2000
+    sizer.observe(_page(2000, 2000), 2000, 0.01)
+    sizer.observe(_page(4000, 4000), 4000, 0.01)
+    assert sizer.size == 4000
+
+    # slow read, the size goes towards the target time
+    sizer.observe(_page(4000, 4000), 4000, 1.6)
+    assert sizer.size == 2500
+
+    # cached and partial pages are ignored
+    sizer.observe(_page(2500, None), 2500, 10.0)
+    sizer.observe(_page(10, 10), 2500, 10.0)
+    assert sizer.size == 2500
+
+
+def test_page_sizer_payload_limit():
+    sizer = PageSizer(AdaptivePaging(initial_size=1000, min_size=100, max_size=4000, max_payload=1_000_000))
+
+    # 1kB per row => at most 1000 rows per page
+    sizer.observe(_page(1000, 1_000_000), 1000, 0.01)
+    assert sizer.size == 1000
+
+
+def test_page_sizer_fixed():
+    sizer = PageSizer(100)
+    sizer.observe(_page(100, 100), 100, 0.01)
+
+    assert sizer.size == 100
+
+
+def test_adaptive_paging_invalid():
+    with pytest.raises(ValueError):
+        AdaptivePaging(initial_size=10, min_size=100)
+
+
+@pytest.mark.parametrize("prefetch_pages", [0, 2])
+def test_read_all_adaptive(prefetch_pages):
+    total_rows = 20 * _TABLE_ROW_BATCH_SIZE
+    response, table = _create_table(total_rows)
+    paging = AdaptivePaging(initial_size=_TABLE_ROW_BATCH_SIZE, max_size=4 * _TABLE_ROW_BATCH_SIZE, target_seconds=60)
+
+    rows = list(table.read_all(prefetch_pages=prefetch_pages, page_size=paging))
+
+    assert [row["attr1"] for row in rows] == [str(i) for i in range(total_rows)]
+    # reads are fast, pages grow up to the maximum
+    assert max(response.limits) == 4 * _TABLE_ROW_BATCH_SIZE
+    assert len(response.reads) < 20
+
+
+@pytest.mark.parametrize("page_size", [100, _TABLE_ROW_BATCH_SIZE + 1])
+def test_read_all_columns_fixed_page_size(page_size):
+    total_rows = 3 * _TABLE_ROW_BATCH_SIZE
+    response, table = _create_table(total_rows)
+
+    batches = list(table.read_all_columns(page_size=page_size))
+
+    assert sum((batch["attr1"] for batch in batches), []) == [str(i) for i in range(total_rows)]
+    assert set(response.limits[1:]) == {page_size}
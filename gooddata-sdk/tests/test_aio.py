@@ -0,0 +1,168 @@
+# (C) 2022 GoodData Corporation
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from gooddata_sdk import Attribute, ObjId, SimpleMetric
+from gooddata_sdk.table import _TABLE_ROW_BATCH_SIZE
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import test_utils  # noqa: E402
+from aiohttp import web  # noqa: E402
+
+from gooddata_sdk.aio import AsyncGoodDataSdk  # noqa: E402
+
+_workspace = "demo"
+_items = [
+    Attribute(local_id="attr1", label="region.region_name"),
+    SimpleMetric(local_id="metric1", item=ObjId(type="metric", id="claim-amount")),
+]
+
+
+def _create_app(total_rows: int, requests: list[web.Request], total_metrics: int = 1) -> web.Application:
+    async def execute(request: web.Request) -> web.Response:
+        requests.append(request)
+        return web.json_response(dict(executionResponse=dict(dimensions=[], links=dict(executionResult="result1"))))
+
+    async def result(request: web.Request) -> web.Response:
+        requests.append(request)
+        offset = [int(v) for v in request.query["offset"].split(",")]
+        limit = [int(v) for v in request.query["limit"].split(",")]
+        rows = list(range(offset[0], min(offset[0] + limit[0], total_rows)))
+        # server caps the limit of metrics the same way as GD.CN does
+        metrics = list(range(offset[1], offset[1] + min(limit[1], 256, total_metrics - offset[1])))
+
+        return web.json_response(
+            dict(
+                data=[[row + m * total_rows for m in metrics] for row in rows],
+                dimensionHeaders=[
+                    dict(headerGroups=[dict(headers=[dict(attributeHeader=dict(labelValue=str(r))) for r in rows])]),
+                    dict(headerGroups=[dict(headers=[dict(measureHeader=dict(order=m)) for m in metrics])]),
+                ],
+                grandTotals=[],
+                paging=dict(offset=offset, count=[len(rows), len(metrics)], total=[total_rows, total_metrics]),
+            )
+        )
+
+    async def metrics(request: web.Request) -> web.Response:
+        requests.append(request)
+        metric = dict(id="claim-amount", type="metric", attributes=dict(title="Claim amount", content={}))
+        return web.json_response(dict(data=[metric]))
+
+    async def empty_collection(request: web.Request) -> web.Response:
+        requests.append(request)
+        return web.json_response(dict(data=[], included=[]))
+
+    async def valid_objects(request: web.Request) -> web.Response:
+        requests.append(request)
+        return web.json_response(dict(items=[dict(id="claim-amount", type="metric")]))
+
+    app = web.Application()
+    app.router.add_post(f"/api/actions/workspaces/{_workspace}/execution/afm/computeValidObjects", valid_objects)
+    app.router.add_post(f"/api/actions/workspaces/{_workspace}/execution/afm/execute", execute)
+    app.router.add_get(f"/api/actions/workspaces/{_workspace}/execution/afm/execute/result/result1", result)
+    app.router.add_get(f"/api/entities/workspaces/{_workspace}/metrics", metrics)
+    app.router.add_get(f"/api/entities/workspaces/{_workspace}/attributes", empty_collection)
+    app.router.add_get(f"/api/entities/workspaces/{_workspace}/datasets", empty_collection)
+
+    return app
+
+
+def _run_with_server(total_rows: int, test_fnc, total_metrics: int = 1):
+    requests: list[web.Request] = []
+
+    async def _run():
+        server = test_utils.TestServer(_create_app(total_rows, requests, total_metrics))
+        await server.start_server()
+
+        try:
+            async with AsyncGoodDataSdk.create(str(server.make_url("")), "token", **{"X-Custom": "value"}) as sdk:
+                return await test_fnc(sdk)
+        finally:
+            await server.close()
+
+    return asyncio.run(_run()), requests
+
+
+@pytest.mark.parametrize("prefetch_pages", [0, 3])
+def test_read_all(prefetch_pages):
+    total_rows = 3 * _TABLE_ROW_BATCH_SIZE + 5
+
+    async def _test(sdk):
+        table = await sdk.tables.for_items(_workspace, _items)
+        return len(table), [row async for row in table.read_all(prefetch_pages=prefetch_pages)]
+
+    (length, rows), requests = _run_with_server(total_rows, _test)
+
+    assert length == total_rows
+    assert [row["attr1"] for row in rows] == [str(i) for i in range(total_rows)]
+    assert [row["metric1"] for row in rows] == list(range(total_rows))
+    # execute + 4 pages
+    assert len(requests) == 5
+    assert requests[0].headers["Authorization"] == "Bearer token"
+    assert requests[0].headers["X-Custom"] == "value"
+
+
+def test_read_all_columns():
+    total_rows = _TABLE_ROW_BATCH_SIZE + 1
+
+    async def _test(sdk):
+        table = await sdk.tables.for_items(_workspace, _items)
+        return [batch async for batch in table.read_all_columns()]
+
+    batches, _ = _run_with_server(total_rows, _test)
+
+    assert len(batches) == 2
+    assert batches[0]["attr1"] + batches[1]["attr1"] == [str(i) for i in range(total_rows)]
+
+
+def test_get_full_catalog():
+    async def _test(sdk):
+        catalog = await sdk.catalog.get_full_catalog(_workspace)
+        return catalog, await sdk.catalog.get_full_catalog(_workspace)
+
+    (catalog, cached), requests = _run_with_server(0, _test)
+
+    assert cached is catalog
+    assert len(requests) == 3
+    assert catalog.get_metric("claim-amount") is not None
+    assert catalog.datasets == []
+
+
+def test_read_all_many_metrics():
+    total_rows = _TABLE_ROW_BATCH_SIZE + 1
+    total_metrics = 300
+    items = _items[:1] + [
+        SimpleMetric(local_id=f"metric{m}", item=ObjId(type="metric", id="claim-amount")) for m in range(total_metrics)
+    ]
+
+    async def _test(sdk):
+        table = await sdk.tables.for_items(_workspace, items)
+        return [row async for row in table.read_all()]
+
+    rows, requests = _run_with_server(total_rows, _test, total_metrics)
+
+    assert len(rows) == total_rows
+    assert rows[-1]["metric299"] == total_rows - 1 + 299 * total_rows
+    # execute + 2 pages read in 2 tiles each
+    assert len(requests) == 5
+
+
+def test_catalog_with_valid_objects():
+    async def _test(sdk):
+        valid = await sdk.catalog.catalog_with_valid_objects(_workspace, _items[1])
+        catalog = await sdk.catalog.get_full_catalog(_workspace)
+        # synchronous variant must not block the event loop that serves the requests
+        sync_valid = await asyncio.get_running_loop().run_in_executor(
+            None, catalog.catalog_with_valid_objects, _items[1]
+        )
+        return valid, sync_valid
+
+    (valid, sync_valid), requests = _run_with_server(0, _test)
+
+    assert [m.id for m in valid.metrics] == ["claim-amount"]
+    assert [m.id for m in sync_valid.metrics] == ["claim-amount"]
+    assert requests[-1].headers["X-Custom"] == "value"
@@ -1,5 +1,23 @@
 # (C) 2021 GoodData Corporation
-from gooddata_sdk import GoodDataApiClient
+import gzip
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from gooddata_sdk import (
+    Attribute,
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+    ComputeService,
+    ExecutionDefinition,
+    ExecutionResponse,
+    GoodDataApiClient,
+    RetryPolicy,
+)
 
 
 def test_http_headers_precedence():
@@ -12,3 +30,157 @@ def test_http_headers_precedence():
     agent = c._metadata_client.default_headers["User-Agent"]
     assert agent.startswith("gooddata")
     assert agent.endswith("yes")
+
+
+def test_shared_connection_pool():
+    c = GoodDataApiClient("host", "token", connection_pool_size=16)
+    pool_manager = c.metadata_client.rest_client.pool_manager
+
+    assert c.afm_client.rest_client.pool_manager is pool_manager
+    assert c.scan_client.rest_client.pool_manager is pool_manager
+    assert pool_manager.connection_pool_kw["maxsize"] == 16
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in pool_manager.connection_pool_kw["socket_options"]
+
+
+def test_socket_options():
+    option = (socket.IPPROTO_TCP, socket.TCP_NODELAY, 0)
+    c = GoodDataApiClient("host", "token", keep_alive=False, socket_options=[option])
+    socket_options = c.metadata_client.rest_client.pool_manager.connection_pool_kw["socket_options"]
+
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in socket_options
+    assert socket_options[-1] == option
+
+
+def test_compression_headers():
+    assert "Accept-Encoding" not in GoodDataApiClient("host", "token").afm_client.default_headers
+
+    c = GoodDataApiClient("host", "token", compression=True)
+
+    for client in [c.afm_client, c.metadata_client, c.scan_client]:
+        assert "gzip" in client.default_headers["Accept-Encoding"].split(",")
+
+
+def test_compressed_result_decoded():
+    result = dict(data=[], dimensionHeaders=[], grandTotals=[], paging=dict(offset=[0], count=[0], total=[0]))
+    accept_encoding = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            accept_encoding.append(self.headers.get("Accept-Encoding"))
+            body = gzip.compress(json.dumps(result).encode("utf-8"))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        client = GoodDataApiClient(f"http://127.0.0.1:{server.server_port}", "token", compression=True)
+        exec_def = ExecutionDefinition([Attribute(local_id="a", label="l")], None, None, [["a"]])
+        response = ExecutionResponse(
+            ComputeService(client)._result_api,
+            "demo",
+            exec_def,
+            dict(execution_response=dict(links=dict(executionResult="r"))),
+        )
+
+        page = response.read_result(limit=[10])
+    finally:
+        server.shutdown()
+
+    assert "gzip" in accept_encoding[0]
+    assert page.paging == result["paging"]
+
+
+def _serve(statuses):
+    """
+    Starts server which responds to GET requests with the given statuses; the last one is repeated forever.
+    """
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(self.path)
+            status = statuses[min(len(requests), len(statuses)) - 1]
+            body = json.dumps(dict(data=[])).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server, requests
+
+
+def _get(client: GoodDataApiClient):
+    return client.metadata_client.call_api(
+        "/api/entities/workspaces", "GET", response_type=None, auth_settings=["bearerToken"], _preload_content=False
+    )
+
+
+def test_retry_policy_validation():
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter=2)
+
+    retry = RetryPolicy(max_retries=5, backoff_factor=1, backoff_max=3, jitter=0).as_urllib3_retry()
+    assert retry.total == 5
+    assert 503 in retry.status_forcelist
+    assert "POST" in retry.allowed_methods
+    # backoff of the 4th consecutive error would be 8 seconds without the cap
+    assert retry.increment("GET", "/").increment("GET", "/").increment("GET", "/").get_backoff_time() <= 3
+
+
+def test_retry_on_server_errors():
+    server, requests = _serve([503, 503, 200])
+
+    try:
+        client = GoodDataApiClient(
+            f"http://127.0.0.1:{server.server_port}", "token", retry_policy=RetryPolicy(backoff_factor=0)
+        )
+        response = _get(client)
+    finally:
+        server.shutdown()
+
+    assert response.status == 200
+    assert len(requests) == 3
+
+
+def test_circuit_breaker():
+    server, requests = _serve([500, 500, 200])
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.2)
+
+    try:
+        client = GoodDataApiClient(f"http://127.0.0.1:{server.server_port}", "token", circuit_breaker=breaker)
+        assert client.circuit_breaker is breaker
+
+        for _ in range(2):
+            with pytest.raises(Exception) as e:
+                _get(client)
+            assert getattr(e.value, "status", None) == 500
+
+        assert breaker.is_open
+        with pytest.raises(CircuitBreakerOpenError):
+            _get(client)
+        assert len(requests) == 2
+
+        time.sleep(0.3)
+        assert _get(client).status == 200
+        assert not breaker.is_open
+        assert len(requests) == 3
+    finally:
+        server.shutdown()
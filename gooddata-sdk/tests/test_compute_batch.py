@@ -0,0 +1,83 @@
+# (C) 2022 GoodData Corporation
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pytest
+
+from gooddata_sdk import Attribute, ComputeService, ExecutionDefinition, GoodDataApiClient, ObjId, SimpleMetric
+
+
+class FakeAfmApi:
+    def __init__(self, fail_on: int = -1) -> None:
+        self._lock = threading.Lock()
+        self._fail_on = fail_on
+        self.calls: list[Any] = []
+
+    def compute_report(self, workspace_id: str, afm_execution: Any, **kwargs: Any) -> dict[str, Any]:
+        with self._lock:
+            call_idx = len(self.calls)
+            self.calls.append(afm_execution)
+
+        if call_idx == self._fail_on:
+            raise ValueError("computation failed")
+
+        return dict(execution_response=dict(links=dict(executionResult=f"result-{call_idx}")))
+
+
+def _exec_def(label: str) -> ExecutionDefinition:
+    return ExecutionDefinition(
+        attributes=[Attribute(local_id="attr1", label=label)],
+        metrics=[SimpleMetric(local_id="metric1", item=ObjId(type="metric", id="claim-amount"))],
+        filters=None,
+        dimensions=[["attr1"], ["measureGroup"]],
+    )
+
+
+def _create_service(api: FakeAfmApi) -> ComputeService:
+    service = ComputeService(GoodDataApiClient("host", "token"))
+    service._exec_api = api
+
+    return service
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_for_exec_defs(max_concurrency):
+    api = FakeAfmApi()
+    exec_defs = [_exec_def("region.region_name"), _exec_def("car.car_make"), _exec_def("region.region_name")]
+
+    responses = dict(_create_service(api).for_exec_defs("demo", exec_defs, max_concurrency=max_concurrency))
+
+    assert sorted(responses.keys()) == [0, 1, 2]
+    # identical definitions are computed once and share the response
+    assert len(api.calls) == 2
+    assert responses[0] is responses[2]
+    assert responses[0].result_id != responses[1].result_id
+    assert responses[1].exec_def is exec_defs[1]
+    assert all(response.workspace_id == "demo" for response in responses.values())
+
+
+def test_for_exec_defs_failure():
+    api = FakeAfmApi(fail_on=0)
+    exec_defs = [_exec_def(f"label.{i}") for i in range(3)]
+
+    with pytest.raises(ValueError):
+        list(_create_service(api).for_exec_defs("demo", exec_defs, max_concurrency=1))
+
+
+def test_count_label_elements():
+    calls = []
+
+    class FakeElementsApi:
+        def compute_label_elements(self, workspace_id: str, label: str, **kwargs: Any) -> dict[str, Any]:
+            calls.append((workspace_id, label, kwargs["limit"]))
+            return dict(elements=[], paging=dict(total=42, count=1, offset=0))
+
+    service = ComputeService(GoodDataApiClient("host", "token"))
+    service._elements_api = FakeElementsApi()
+
+    assert service.count_label_elements("demo", "region.region_name") == 42
+    assert service.count_label_elements("demo", "region.region_name") == 42
+    # the count is remembered and just single element is read
+    assert calls == [("demo", "region.region_name", 1)]
@@ -0,0 +1,68 @@
+# (C) 2022 GoodData Corporation
+from __future__ import annotations
+
+from gooddata_sdk import ExecutionResult
+
+
+def _attribute_headers(*values: list[str]) -> dict:
+    return dict(
+        headerGroups=[dict(headers=[dict(attributeHeader=dict(labelValue=v)) for v in vals]) for vals in values]
+    )
+
+
+def _measure_headers(count: int) -> dict:
+    return dict(headerGroups=[dict(headers=[dict(measureHeader=dict(order=i)) for i in range(count)])])
+
+
+def _result(data: list, headers: list[dict], count: list[int]) -> ExecutionResult:
+    return ExecutionResult(
+        dict(
+            data=data,
+            dimension_headers=headers,
+            grand_totals=[],
+            paging=dict(offset=[0 for _ in count], count=count, total=count),
+        )
+    )
+
+
+def test_header_columns():
+    result = _result(
+        data=[[1, 2], [3, 4], [5, 6]],
+        headers=[_attribute_headers(["a", "b", "c"], ["x", "y", "z"]), _measure_headers(2)],
+        count=[3, 2],
+    )
+
+    assert result.get_all_header_columns(0) == [["a", "b", "c"], ["x", "y", "z"]]
+    assert result.get_all_header_columns(0)[1] == result.get_all_header_values(0, 1)
+
+
+def test_data_columns_metrics_in_second_dim():
+    result = _result(
+        data=[[1, 2], [3, 4], [5, None]],
+        headers=[_attribute_headers(["a", "b", "c"]), _measure_headers(2)],
+        count=[3, 2],
+    )
+
+    assert result.get_all_data_columns(1) == [[1, 3, 5], [2, 4, None]]
+
+
+def test_data_columns_metrics_in_first_dim():
+    result = _result(
+        data=[[1, 3, 5], [2, 4, 6]],
+        headers=[_measure_headers(2), _attribute_headers(["a", "b", "c"])],
+        count=[2, 3],
+    )
+
+    assert result.get_all_data_columns(0) == [[1, 3, 5], [2, 4, 6]]
+
+
+def test_data_columns_single_dim():
+    result = _result(data=[1, 2], headers=[_measure_headers(2)], count=[2])
+
+    assert result.get_all_data_columns(0) == [[1], [2]]
+
+
+def test_data_columns_empty():
+    result = _result(data=[], headers=[_attribute_headers([]), _measure_headers(2)], count=[0, 2])
+
+    assert result.get_all_data_columns(1) == [[], []]
@@ -0,0 +1,107 @@
+# (C) 2022 GoodData Corporation
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from gooddata_sdk import (
+    Attribute,
+    ComputeService,
+    ExecutionDefinition,
+    ExecutionResponse,
+    GoodDataApiClient,
+    RetryPolicy,
+)
+
+pytest.importorskip("httpx")
+
+from gooddata_metadata_client.exceptions import NotFoundException  # noqa: E402
+from gooddata_sdk.http2 import Http2PoolManager  # noqa: E402
+
+
+def _serve(statuses):
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests.append(self)
+            status = statuses[min(len(requests), len(statuses)) - 1]
+            query = parse_qs(urlparse(self.path).query)
+            limit = [int(v) for v in query.get("limit", ["0"])[0].split(",")]
+            result = dict(data=[], dimensionHeaders=[], grandTotals=[], paging=dict(offset=[0], count=[0], total=limit))
+            body = json.dumps(result).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Retry-After", "0")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    return server, requests
+
+
+def _response(client: GoodDataApiClient) -> ExecutionResponse:
+    exec_def = ExecutionDefinition([Attribute(local_id="a", label="l")], None, None, [["a"]])
+    return ExecutionResponse(
+        ComputeService(client)._result_api,
+        "demo",
+        exec_def,
+        dict(execution_response=dict(links=dict(executionResult="r"))),
+    )
+
+
+def test_shared_http2_pool_manager():
+    c = GoodDataApiClient("https://host", "token", http2=True, connection_pool_size=8)
+    pool_manager = c.metadata_client.rest_client.pool_manager
+
+    assert isinstance(pool_manager, Http2PoolManager)
+    assert c.afm_client.rest_client.pool_manager is pool_manager
+    assert c.scan_client.rest_client.pool_manager is pool_manager
+    assert "Accept-Encoding" not in pool_manager.client.headers
+
+
+def test_read_result():
+    server, requests = _serve([200])
+
+    try:
+        client = GoodDataApiClient(f"http://127.0.0.1:{server.server_port}", "token", http2=True, compression=True)
+        page = _response(client).read_result(limit=[10, 5])
+    finally:
+        server.shutdown()
+
+    assert page.paging["total"] == [10, 5]
+    assert requests[0].headers["Authorization"] == "Bearer token"
+    assert "gzip" in requests[0].headers["Accept-Encoding"]
+
+
+def test_retry_and_errors():
+    server, requests = _serve([503, 200, 404])
+
+    try:
+        client = GoodDataApiClient(
+            f"http://127.0.0.1:{server.server_port}",
+            "token",
+            http2=True,
+            retry_policy=RetryPolicy(backoff_factor=0),
+        )
+        page = _response(client).read_result(limit=[10])
+
+        with pytest.raises(NotFoundException):
+            client.metadata_client.call_api(
+                "/api/entities/workspaces", "GET", response_type=None, auth_settings=["bearerToken"]
+            )
+    finally:
+        server.shutdown()
+
+    assert page.paging["total"] == [10]
+    assert len(requests) == 3
@@ -0,0 +1,130 @@
+# (C) 2022 GoodData Corporation
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import pytest
+
+from gooddata_sdk import CatalogService, GoodDataApiClient
+from gooddata_sdk.utils import load_all_entities
+
+
+class FakePage:
+    def __init__(self, data: list[int]) -> None:
+        self.data = data
+        self.included = [f"included-{i}" for i in data]
+
+
+class InFlight:
+    """
+    Tracks maximum number of requests running at the same time.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._running = 0
+        self.max_running = 0
+
+    def __enter__(self) -> None:
+        with self._lock:
+            self._running += 1
+            self.max_running = max(self.max_running, self._running)
+
+    def __exit__(self, *args: Any) -> None:
+        with self._lock:
+            self._running -= 1
+
+
+class FakePagedResource:
+    def __init__(
+        self, total: int, in_flight: Optional[InFlight] = None, delay: float = 0, failing_page: Optional[int] = None
+    ) -> None:
+        self._total = total
+        self._lock = threading.Lock()
+        self._in_flight = in_flight or InFlight()
+        self._delay = delay
+        self._failing_page = failing_page
+        self.pages: list[int] = []
+
+    def get_page(self, workspace_id: str, page: int, size: int, **kwargs: Any) -> FakePage:
+        with self._lock:
+            self.pages.append(page)
+
+        with self._in_flight:
+            time.sleep(self._delay)
+
+        if page == self._failing_page:
+            raise RuntimeError(f"page {page} failed")
+
+        return FakePage(list(range(page * size, min((page + 1) * size, self._total))))
+
+
+@pytest.mark.parametrize("total", [0, 3, 10, 11, 47])
+@pytest.mark.parametrize("parallel_pages", [0, 1, 3])
+def test_load_all_entities(total, parallel_pages):
+    resource = FakePagedResource(total)
+    get_page = functools.partial(resource.get_page, "demo", _check_return_type=False)
+
+    entities = load_all_entities(get_page, page_size=5, parallel_pages=parallel_pages)
+
+    assert entities.data == list(range(total))
+    assert entities.included == [f"included-{i}" for i in range(total)]
+    # all pages up to the last (short or empty) one are read exactly once
+    last_page = total // 5
+    assert sorted(set(resource.pages)) == sorted(resource.pages)
+    assert set(range(last_page + 1)).issubset(resource.pages)
+
+
+def test_load_all_entities_single_page_not_speculative():
+    resource = FakePagedResource(3)
+    get_page = functools.partial(resource.get_page, "demo")
+
+    load_all_entities(get_page, page_size=5, parallel_pages=4)
+
+    assert resource.pages == [0]
+
+
+def _catalog_service(monkeypatch, resources: dict[str, FakePagedResource], connection_pool_size: int):
+    # catalog is not created from the fake pages, the loaded entities are returned instead
+    monkeypatch.setattr("gooddata_sdk.catalog._create_catalog", lambda _, *entities: entities)
+    monkeypatch.setattr("gooddata_sdk.catalog.load_all_entities", functools.partial(load_all_entities, page_size=5))
+    client = GoodDataApiClient("http://localhost:3000", "token", connection_pool_size=connection_pool_size)
+    service = CatalogService(client, catalog_load_workers=3)
+    service._api = SimpleNamespace(
+        get_all_entities_datasets=resources["datasets"].get_page,
+        get_all_entities_attributes=resources["attributes"].get_page,
+        get_all_entities_metrics=resources["metrics"].get_page,
+    )
+
+    return service
+
+
+@pytest.mark.parametrize("connection_pool_size", [2, 6, 12])
+def test_load_catalog_concurrently(monkeypatch, connection_pool_size):
+    in_flight = InFlight()
+    totals = dict(datasets=23, attributes=52, metrics=7)
+    resources = {name: FakePagedResource(total, in_flight, delay=0.01) for name, total in totals.items()}
+    service = _catalog_service(monkeypatch, resources, connection_pool_size)
+
+    datasets, attributes, metrics = service.get_full_catalog("demo")
+
+    assert datasets.data == list(range(23))
+    assert attributes.data == list(range(52))
+    assert metrics.data == list(range(7))
+    assert 1 < in_flight.max_running <= connection_pool_size
+
+
+def test_load_catalog_concurrently_fails(monkeypatch):
+    resources = dict(
+        datasets=FakePagedResource(23),
+        attributes=FakePagedResource(52, failing_page=6),
+        metrics=FakePagedResource(7),
+    )
+    service = _catalog_service(monkeypatch, resources, 12)
+
+    with pytest.raises(RuntimeError, match="page 6 failed"):
+        service.get_full_catalog("demo")
@@ -0,0 +1,283 @@
+# (C) 2022 GoodData Corporation
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from gooddata_afm_client.exceptions import ApiException
+from gooddata_sdk import (
+    Attribute,
+    ComputeService,
+    DiskResultCache,
+    ExecutionDefinition,
+    GoodDataApiClient,
+    GoodDataSdk,
+    MemoryResultCache,
+    ObjId,
+    PositiveAttributeFilter,
+    SimpleMetric,
+)
+
+_attr1 = Attribute(local_id="attr1", label="region.region_name")
+_attr2 = Attribute(local_id="attr2", label="car.car_make")
+_metric1 = SimpleMetric(local_id="metric1", item=ObjId(type="metric", id="claim-amount"))
+_metric2 = SimpleMetric(local_id="metric2", item=ObjId(type="metric", id="claim-count"))
+_filter1 = PositiveAttributeFilter(label="region.region_name", values=["East"])
+_filter2 = PositiveAttributeFilter(label="car.car_make", values=["Audi"])
+
+
+def _exec_def(attributes, metrics, filters) -> ExecutionDefinition:
+    return ExecutionDefinition(
+        attributes=attributes, metrics=metrics, filters=filters, dimensions=[["attr1", "attr2"], ["measureGroup"]]
+    )
+
+
+def test_fingerprint_normalizes_order():
+    exec_def = _exec_def([_attr1, _attr2], [_metric1, _metric2], [_filter1, _filter2])
+
+    assert (
+        exec_def.fingerprint() == _exec_def([_attr1, _attr2], [_metric1, _metric2], [_filter1, _filter2]).fingerprint()
+    )
+    assert (
+        exec_def.fingerprint() == _exec_def([_attr2, _attr1], [_metric1, _metric2], [_filter2, _filter1]).fingerprint()
+    )
+    # order of metrics determines order of values in the result
+    assert (
+        exec_def.fingerprint() != _exec_def([_attr1, _attr2], [_metric2, _metric1], [_filter1, _filter2]).fingerprint()
+    )
+    assert exec_def.fingerprint() != _exec_def([_attr1, _attr2], [_metric1, _metric2], [_filter1]).fingerprint()
+
+
+def test_memory_result_cache():
+    cache = MemoryResultCache(max_size=2, ttl=None)
+    cache.put("a", dict(data=[1]))
+    cache.put("b", dict(data=[2]))
+    assert cache.get("a") == dict(data=[1])
+
+    # b is least recently used
+    cache.put("c", dict(data=[3]))
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    cache.invalidate()
+    assert cache.get("a") is None
+
+
+def test_disk_result_cache(tmp_path):
+    cache = DiskResultCache(tmp_path / "results", max_size=2, ttl=60)
+    assert cache.get("a") is None
+
+    cache.put("a", dict(data=[1]))
+    cache.put("b", dict(data=[2]))
+    # the cache is shared through the directory
+    assert DiskResultCache(tmp_path / "results").get("b") == dict(data=[2])
+
+    old = time.time() - 10
+    for path in (tmp_path / "results").iterdir():
+        os.utime(path, (old, old))
+    assert cache.get("a") == dict(data=[1])
+
+    # b is least recently used
+    cache.put("c", dict(data=[3]))
+    assert cache.get("b") is None
+    assert cache.get("c") == dict(data=[3])
+    assert len(cache) == 2
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_disk_result_cache_expired(tmp_path):
+    cache = DiskResultCache(tmp_path, ttl=0.01)
+    cache.put("a", dict(data=[1]))
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+class FakeAfmApi:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def compute_report(self, workspace_id: str, afm_execution: Any, **kwargs: Any) -> dict[str, Any]:
+        self.calls += 1
+        return dict(execution_response=dict(links=dict(executionResult=f"result{self.calls}")))
+
+
+class FakeResultApi:
+    def __init__(self, api_client: Any, gone: tuple[str, ...] = ()) -> None:
+        self.api_client = api_client
+        self.calls: list[Any] = []
+        self._gone = gone
+
+    def retrieve_result(self, **kwargs: Any) -> Any:
+        self.calls.append(kwargs)
+        if kwargs["result_id"] in self._gone:
+            raise ApiException(status=410, reason="Gone")
+
+        result = dict(
+            data=[[1]],
+            dimensionHeaders=[],
+            grandTotals=[],
+            paging=dict(offset=kwargs["offset"], count=[1, 1], total=[1, 1]),
+        )
+
+        return SimpleNamespace(data=json.dumps(result).encode("utf-8"))
+
+
+def _create_service(gone: tuple[str, ...] = (), **kwargs: Any) -> tuple[ComputeService, FakeAfmApi, FakeResultApi]:
+    service = ComputeService(GoodDataApiClient("host", "token"), **kwargs)
+    exec_api = FakeAfmApi()
+    result_api = FakeResultApi(service._result_api.api_client, gone)
+    service._exec_api = exec_api
+    service._result_api = result_api
+
+    return service, exec_api, result_api
+
+
+@pytest.mark.parametrize("cache_factory", [lambda path: MemoryResultCache(), lambda path: DiskResultCache(path)])
+def test_read_result_cached(tmp_path, cache_factory):
+    service, _, result_api = _create_service(result_cache=cache_factory(tmp_path), result_id_cache_size=10)
+
+    def _read(exec_def, offset):
+        return service.for_exec_def("demo", exec_def).read_result(limit=[1, 1], offset=offset)
+
+    first = _read(_exec_def([_attr1, _attr2], [_metric1], [_filter1, _filter2]), [0, 0])
+    second = _read(_exec_def([_attr2, _attr1], [_metric1], [_filter2, _filter1]), [0, 0])
+    assert len(result_api.calls) == 1
+    assert second.data == first.data
+    assert second.paging == first.paging
+
+    # different page and different definition are not served from the cache
+    _read(_exec_def([_attr1, _attr2], [_metric1], [_filter1, _filter2]), [1, 0])
+    _read(_exec_def([_attr1, _attr2], [_metric2], [_filter1, _filter2]), [0, 0])
+    assert len(result_api.calls) == 3
+
+
+def test_read_result_cached_per_result_and_token(tmp_path):
+    cache = DiskResultCache(tmp_path)
+    service, exec_api, result_api = _create_service(result_cache=cache)
+    exec_def = _exec_def([_attr1], [_metric1], None)
+
+    # without remembered result ids, each computation produces new result whose pages are not cached yet
+    service.for_exec_def("demo", exec_def).read_result(limit=[1, 1])
+    service.for_exec_def("demo", exec_def).read_result(limit=[1, 1])
+    assert exec_api.calls == 2
+    assert [call["result_id"] for call in result_api.calls] == ["result1", "result2"]
+
+    # pages of the same result are not shared with clients using different token
+    other_service = ComputeService(GoodDataApiClient("host", "other-token"), result_cache=cache)
+    other_result_api = FakeResultApi(other_service._result_api.api_client)
+    other_service._result_api = other_result_api
+    other_service.for_result_id("demo", exec_def, "result1").read_result(limit=[1, 1])
+    service.for_result_id("demo", exec_def, "result1").read_result(limit=[1, 1])
+
+    assert len(other_result_api.calls) == 1
+    assert len(result_api.calls) == 2
+
+
+def test_read_result_without_cache():
+    service, exec_api, result_api = _create_service()
+
+    for _ in range(2):
+        service.for_exec_def("demo", _exec_def([_attr1], [_metric1], None)).read_result(limit=[1, 1])
+
+    assert len(result_api.calls) == 2
+    assert exec_api.calls == 2
+
+
+def test_for_result_id():
+    service, exec_api, result_api = _create_service()
+
+    response = service.for_result_id("demo", _exec_def([_attr1], [_metric1], None), "known")
+    response.read_result(limit=[1, 1])
+
+    assert response.result_id == "known"
+    assert exec_api.calls == 0
+    assert result_api.calls[0]["result_id"] == "known"
+
+
+def test_result_ids_reused():
+    service, exec_api, result_api = _create_service(result_id_cache_size=10)
+
+    first = service.for_exec_def("demo", _exec_def([_attr1, _attr2], [_metric1], None))
+    second = service.for_exec_def("demo", _exec_def([_attr2, _attr1], [_metric1], None))
+    other_workspace = service.for_exec_def("other", _exec_def([_attr1, _attr2], [_metric1], None))
+
+    assert exec_api.calls == 2
+    assert second.result_id == first.result_id
+    assert other_workspace.result_id != first.result_id
+
+
+def test_result_ids_shared_by_sdk_services():
+    sdk = GoodDataSdk.create("host", "token", result_id_cache_size_=10, result_id_cache_ttl_=60)
+    exec_api = FakeAfmApi()
+    sdk.compute._exec_api = exec_api
+
+    first = sdk.compute.for_exec_def("demo", _exec_def([_attr1], [_metric1], None))
+    second = sdk.tables._compute.for_exec_def("demo", _exec_def([_attr1], [_metric1], None))
+
+    assert sdk.tables._compute is sdk.compute
+    assert exec_api.calls == 1
+    assert second.result_id == first.result_id
+
+
+def test_result_ids_recomputed_when_gone():
+    service, exec_api, result_api = _create_service(gone=("result1",), result_id_cache_size=10)
+    service.for_exec_def("demo", _exec_def([_attr1], [_metric1], None))
+
+    response = service.for_exec_def("demo", _exec_def([_attr1], [_metric1], None))
+    response.read_result(limit=[1, 1])
+
+    assert response.result_id == "result2"
+    assert exec_api.calls == 2
+    assert [call["result_id"] for call in result_api.calls] == ["result1", "result2"]
+    # the new result id is remembered
+    assert service.for_exec_def("demo", _exec_def([_attr1], [_metric1], None)).result_id == "result2"
+
+
+class BarrierResultApi(FakeResultApi):
+    """
+    Result API which fails reads of gone results only after all readers tried to read them.
+    """
+
+    def __init__(self, api_client: Any, gone: tuple[str, ...], readers: int) -> None:
+        super().__init__(api_client, gone)
+        self._barrier = threading.Barrier(readers, timeout=5)
+
+    def retrieve_result(self, **kwargs: Any) -> Any:
+        if kwargs["result_id"] in self._gone:
+            self._barrier.wait()
+        return super().retrieve_result(**kwargs)
+
+
+def test_result_gone_concurrent_readers():
+    service, exec_api, _ = _create_service(gone=("result1",), result_id_cache_size=10)
+    service.for_exec_def("demo", _exec_def([_attr1], [_metric1], None))
+    result_api = BarrierResultApi(service._result_api.api_client, ("result1",), readers=2)
+    service._result_api = result_api
+    response = service.for_exec_def("demo", _exec_def([_attr1], [_metric1], None))
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pages = list(executor.map(lambda offset: response.read_result(limit=[1, 1], offset=[offset, 0]), [0, 1]))
+
+    assert [page.paging_offset for page in pages] == [[0, 0], [1, 0]]
+    # both readers hit the gone result, the result is computed again only once
+    assert exec_api.calls == 2
+    assert sorted(call["result_id"] for call in result_api.calls) == ["result1", "result1", "result2", "result2"]
+
+
+def test_result_gone_without_recompute():
+    service, _, _ = _create_service(gone=("result1",))
+    response = service.for_exec_def("demo", _exec_def([_attr1], [_metric1], None))
+
+    with pytest.raises(ApiException):
+        response.read_result(limit=[1, 1])
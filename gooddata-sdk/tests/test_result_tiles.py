@@ -0,0 +1,99 @@
+# (C) 2022 GoodData Corporation
+from __future__ import annotations
+
+import threading
+from typing import Any, Optional
+
+import pytest
+
+from gooddata_sdk import Attribute, ExecutionDefinition, ExecutionResponse, ExecutionResult, ObjId, SimpleMetric
+from gooddata_sdk.table import _MAX_METRICS, _TABLE_ROW_BATCH_SIZE, _as_table
+
+
+class FakeResponse(ExecutionResponse):
+    """
+    Serves two-dimensional result with `rows` attribute values in the first dimension and `metrics` metrics in
+    the second one. Value of metric `m` in row `r` is `r * 10000 + m`.
+    """
+
+    def __init__(self, rows: int, metrics: int) -> None:
+        exec_def = ExecutionDefinition(
+            attributes=[Attribute(local_id="attr1", label="region.region_name")],
+            metrics=[SimpleMetric(local_id=f"m{i}", item=ObjId(type="metric", id=f"m{i}")) for i in range(metrics)],
+            filters=None,
+            dimensions=[["attr1"], ["measureGroup"]],
+        )
+        super().__init__(None, "demo", exec_def, dict(execution_response=dict(links=dict(executionResult="r1"))))
+        self._rows = rows
+        self._metrics = metrics
+        self._reads_lock = threading.Lock()
+        self.reads: list[tuple[list[int], list[int]]] = []
+
+    def read_result(self, limit: Any, offset: Optional[Any] = None) -> ExecutionResult:
+        assert offset is not None
+        with self._reads_lock:
+            self.reads.append((offset, limit))
+
+        rows = list(range(offset[0], min(offset[0] + limit[0], self._rows)))
+        metrics = list(range(offset[1], min(offset[1] + limit[1], self._metrics)))
+
+        return ExecutionResult(
+            dict(
+                data=[[r * 10000 + m for m in metrics] for r in rows],
+                dimension_headers=[
+                    dict(headerGroups=[dict(headers=[dict(attributeHeader=dict(labelValue=str(r))) for r in rows])]),
+                    dict(headerGroups=[dict(headers=[dict(measureHeader=dict(order=m)) for m in metrics])]),
+                ],
+                grand_totals=[],
+                paging=dict(offset=offset, count=[len(rows), len(metrics)], total=[self._rows, self._metrics]),
+            ),
+            payload_size=100,
+        )
+
+
+@pytest.mark.parametrize(
+    "offset,limit,tile_limit",
+    [
+        ([0, 0], [25, 30], [10, 7]),
+        ([3, 5], [20, 20], [6, 6]),
+        ([0, 0], [100, 100], [10, 10]),
+        ([0, 0], [25, 30], [25, 30]),
+    ],
+)
+def test_read_result_tiled(offset, limit, tile_limit):
+    response = FakeResponse(rows=25, metrics=30)
+
+    tiled = response.read_result_tiled(offset=offset, limit=limit, tile_limit=tile_limit)
+    whole = response.read_result(offset=offset, limit=limit)
+
+    assert tiled.data == whole.data
+    assert tiled.headers == whole.headers
+    assert tiled.paging == whole.paging
+    assert tiled.payload_size == 100 * (len(response.reads) - 1)
+
+
+def test_read_result_tiled_empty():
+    response = FakeResponse(rows=0, metrics=3)
+
+    tiled = response.read_result_tiled(limit=[10, 3], tile_limit=[5, 1])
+
+    assert tiled.data == []
+    assert tiled.paging_count == [0, 3]
+    assert len(tiled.get_all_data_columns(1)) == 3
+
+
+@pytest.mark.parametrize("prefetch_pages", [0, 2])
+def test_table_with_many_metrics(prefetch_pages):
+    total_rows = 2 * _TABLE_ROW_BATCH_SIZE + 1
+    metrics = 2 * _MAX_METRICS + 10
+    response = FakeResponse(rows=total_rows, metrics=metrics)
+
+    table = _as_table(response, _TABLE_ROW_BATCH_SIZE)
+    rows = list(table.read_all(prefetch_pages=prefetch_pages))
+
+    assert len(rows) == total_rows
+    assert rows[-1]["attr1"] == str(total_rows - 1)
+    assert [rows[-1][f"m{m}"] for m in range(metrics)] == [(total_rows - 1) * 10000 + m for m in range(metrics)]
+    # 3 pages, each read in 3 tiles
+    assert len(response.reads) == 9
+    assert max(limit[1] for _, limit in response.reads) == _MAX_METRICS
@@ -0,0 +1,61 @@
+# (C) 2022 GoodData Corporation
+import unittest.mock as mock
+
+from gooddata_sdk.utils import TtlCache
+
+
+def test_get_put():
+    cache = TtlCache(max_size=2)
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+
+def test_lru_eviction():
+    cache = TtlCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    # touch 'a' so that 'b' is least recently used
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl():
+    cache = TtlCache(max_size=2, ttl=10)
+
+    with mock.patch("gooddata_sdk.utils.time.monotonic", return_value=100.0):
+        cache.put("a", 1)
+
+    with mock.patch("gooddata_sdk.utils.time.monotonic", return_value=109.0):
+        assert cache.get("a") == 1
+
+    with mock.patch("gooddata_sdk.utils.time.monotonic", return_value=110.0):
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+def test_invalidate():
+    cache = TtlCache(max_size=3)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_disabled():
+    cache = TtlCache(max_size=0)
+    cache.put("a", 1)
+
+    assert cache.get("a") is None
@@ -27,6 +27,23 @@ class TestConverter:
         assert sc.to_external_type(test_value) == f"String:{str(test_value)}"
         assert ic.to_external_type(test_value) == f"Integer:{str(test_value)}"
 
+    def test_to_external_type_batch(self):
+        test_values = ["2021", "2022"]
+        c = conv.DateConverter()
+
+        assert c.to_external_type_batch(test_values) == [c.to_external_type(value) for value in test_values]
+
+    def test_to_external_type_batch_fnc(self):
+        test_values = ["1", "2"]
+        conv.DatetimeConverter.set_external_batch_fnc(lambda obj, values: f"Batch:{','.join(values)}")
+        try:
+            assert conv.DatetimeConverter().to_external_type_batch(test_values) == "Batch:1,2"
+            # batch function is set just for the one converter class
+            dc = conv.DateConverter()
+            assert dc.to_external_type_batch(["2021"]) == [dc.to_external_type("2021")]
+        finally:
+            conv.DatetimeConverter.set_external_batch_fnc(None)
+
 
 class TestStringConverter:
     def test_to_type(self):
@@ -60,6 +77,11 @@ class TestDateConverter:
         with pytest.raises(ValueError):
             c.to_type(test_value)
 
+    @pytest.mark.parametrize("value,expected", [("2021", "%Y"), ("2021-02", "%Y-%m"), ("2021-02-03", "%Y-%m-%d")])
+    def test_to_date_format(self, value, expected):
+        assert conv.DateConverter.to_date_format(value) == expected
+        assert datetime.datetime.strptime(value, expected).date() == conv.DateConverter.to_date(value)
+
 
 class TestDatetimeConverter:
     def test_to_type_ok(self):
@@ -67,6 +89,13 @@ class TestDatetimeConverter:
         c = conv.DatetimeConverter()
         assert c.to_type(test_value) == datetime.datetime(2021, 10, 20, 11, 0)
 
+    @pytest.mark.parametrize(
+        "value,expected", [("2021-10-20 11", "%Y-%m-%d %H"), ("2021-10-20 11:12", "%Y-%m-%d %H:%M")]
+    )
+    def test_to_datetime_format(self, value, expected):
+        assert conv.DatetimeConverter.to_datetime_format(value) == expected
+        assert datetime.datetime.strptime(value, expected) == conv.DatetimeConverter.to_datetime(value)
+
     def test_to_type_wrong_val(self):
         test_value = "2021-10-20"
         c = conv.DatetimeConverter()